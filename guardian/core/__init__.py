@@ -15,22 +15,34 @@ from .confidence import (
 )
 from .validation import (
     validate_syntax,
+    validate_syntax_content,
     validate_links,
+    validate_links_async,
     validate_change,
     validate_all_changes
 )
 from .git_utils import (
     rollback_file,
+    rollback_files,
     git_add,
+    git_add_files,
     git_commit,
     git_status_clean,
     git_diff,
-    is_git_repo
+    git_diff_files,
+    is_git_repo,
+    probe_repos,
+    RepoInfo,
+    rollback_file_async,
+    git_add_async,
+    git_diff_async,
+    status_session
 )
 from .reporting import (
     generate_markdown_report,
     generate_json_report,
     generate_console_output,
+    dumps_json,
     save_report
 )
 from .file_cache import (
@@ -39,6 +51,7 @@ from .file_cache import (
     reset_global_cache,
     content_hash,
     simhash,
+    simhash_batch,
     hamming_distance,
     are_similar
 )
@@ -70,22 +83,34 @@ __all__ = [
 
     # Validation
     'validate_syntax',
+    'validate_syntax_content',
     'validate_links',
+    'validate_links_async',
     'validate_change',
     'validate_all_changes',
 
     # Git
     'rollback_file',
+    'rollback_files',
     'git_add',
+    'git_add_files',
     'git_commit',
     'git_status_clean',
     'git_diff',
+    'git_diff_files',
     'is_git_repo',
+    'probe_repos',
+    'RepoInfo',
+    'rollback_file_async',
+    'git_add_async',
+    'git_diff_async',
+    'status_session',
 
     # Reporting
     'generate_markdown_report',
     'generate_json_report',
     'generate_console_output',
+    'dumps_json',
     'save_report',
 
     # File Cache
@@ -94,6 +119,7 @@ __all__ = [
     'reset_global_cache',
     'content_hash',
     'simhash',
+    'simhash_batch',
     'hamming_distance',
     'are_similar',
 
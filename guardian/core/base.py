@@ -9,6 +9,7 @@ Security features:
 - File size limits to prevent memory exhaustion (DG-2026-006)
 """
 
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
@@ -108,8 +109,15 @@ class HealingSystem(ABC):
     Configuration:
         All paths and thresholds are loaded from config dict.
         See config_schema.py for expected structure.
+
+    Reuse:
+        The orchestrator keeps one instance per healer and reuses it for
+        later runs. Subclasses that keep per-run state beyond self.errors
+        should set reusable = False to get a fresh instance every run.
     """
 
+    reusable: bool = True
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize healing system with configuration.
@@ -171,6 +179,9 @@ class HealingSystem(ABC):
 
         self.errors: List[str] = []
 
+        # Set by the orchestrator; see should_stop()
+        self.stop_event: Optional[threading.Event] = None
+
     @abstractmethod
     def check(self) -> HealingReport:
         """
@@ -346,6 +357,25 @@ class HealingSystem(ABC):
         """
         self.errors.append(message)
 
+    def should_stop(self) -> bool:
+        """
+        Check whether a shutdown (Ctrl+C) has been requested.
+
+        heal() implementations call this between changes (or files) and
+        stop applying changes once it returns True; changes already
+        written stay applied. The first True also records an error, so the
+        report shows the run was cut short.
+
+        Returns:
+            True if the healer should stop
+        """
+        if self.stop_event is None or not self.stop_event.is_set():
+            return False
+        message = "Stopped by shutdown request; remaining changes not applied"
+        if message not in self.errors:
+            self.log_error(message)
+        return True
+
     def create_report(
         self,
         mode: str,
@@ -20,13 +20,18 @@ This module MUST be called before any healing operations via:
         raise ConfigValidationError(result.errors)
 """
 
+import copy
+import json
 import re
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple, Union
-from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import logging
 
+from .atomic_write import atomic_write, AtomicWriteError
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -54,6 +59,49 @@ DANGEROUS_REGEX_PATTERNS = [
     r'(?:\.\+){2,}',     # .+.+.+ - multiple consecutive quantifiers
 ]
 
+# =============================================================================
+# SCHEMA CONSTANTS (used by validate_config_schema)
+# =============================================================================
+_CONFIDENCE_THRESHOLD_KEYS = ('auto_commit_threshold', 'auto_stage_threshold', 'report_only_threshold')
+_REGEX_KEYS = ('link_pattern', 'section_pattern')
+_REGEX_LIST_KEYS = ('timestamp_patterns', 'jargon_patterns')
+_THRESHOLD_CONFIGS = {
+    'similarity_threshold': (0.0, 1.0),
+    'fuzzy_threshold': (0.0, 1.0),
+    'missing_keywords_threshold': (0.0, 1.0),
+    'historical_success_rate': (0.0, 1.0),
+}
+_INT_FIELDS = ('staleness_threshold_days', 'min_block_size', 'long_section_threshold')
+_LIST_FIELDS = ('exclude_dirs', 'file_extensions', 'hierarchy_rules', 'related_section_headers')
+_UNIMPLEMENTED_ADVANCED_KEYS = ('max_workers', 'cache_dir', 'enable_cache', 'cache_ttl')
+
+# String booleans that are truthy in Python but meant as false (and vice versa)
+_FALSY_STRINGS = frozenset({'false', 'no', '0'})
+_TRUTHY_STRINGS = frozenset({'true', 'yes', '1'})
+
+# Valid values from manage_collapsed.py / reporting.py (tuples keep display order)
+_HINT_STRATEGIES = ('summary', 'first_sentence', 'keywords')
+_VALID_HINT_STRATEGIES = frozenset(_HINT_STRATEGIES)
+_REPORT_FORMATS = ('markdown', 'json', 'html', 'both')
+_VALID_REPORT_FORMATS = frozenset(_REPORT_FORMATS)
+
+# Type names for the common config value types, so error paths avoid
+# type(x).__name__ attribute lookups
+_TYPE_NAMES = {
+    dict: 'dict',
+    list: 'list',
+    str: 'str',
+    int: 'int',
+    float: 'float',
+    bool: 'bool',
+    type(None): 'NoneType',
+}
+
+
+def _type_name(value: Any) -> str:
+    """Return the type name of value for error messages."""
+    return _TYPE_NAMES.get(type(value)) or type(value).__name__
+
 
 class ConfigError(Exception):
     """Configuration validation error with context (Issue 8)."""
@@ -87,17 +135,74 @@ class ConfigValidationError(Exception):
         super().__init__(message)
 
 
-@dataclass
+# Unformatted error: (key, message template, template args, suggestion)
+DeferredError = Tuple[str, Any, Tuple[Any, ...], Optional[str]]
+
+
+def _format_error(key: str, template: Any, args: Tuple[Any, ...], suggestion: Optional[str]) -> str:
+    """Render a deferred error as '[key] message | Suggestion: ...'."""
+    msg = template.format(*args) if args else str(template)
+    full_msg = f"[{key}] {msg}"
+    if suggestion:
+        full_msg += f" | Suggestion: {suggestion}"
+    return full_msg
+
+
 class ValidationResult:
-    """Result of configuration validation."""
-    is_valid: bool
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
-    validated_config: Dict[str, Any] = field(default_factory=dict)
+    """
+    Result of configuration validation.
+
+    Errors may be passed pre-formatted via ``errors`` or as unformatted
+    ``deferred_errors`` tuples. Deferred errors are only rendered to strings
+    the first time ``errors`` is read, so callers that just check
+    ``is_valid`` never pay for message formatting.
+    """
+
+    def __init__(
+        self,
+        is_valid: bool,
+        errors: Optional[List[str]] = None,
+        warnings: Optional[List[str]] = None,
+        validated_config: Optional[Dict[str, Any]] = None,
+        deferred_errors: Optional[List[DeferredError]] = None
+    ):
+        self.is_valid = is_valid
+        self._errors: List[str] = errors if errors is not None else []
+        self._deferred_errors: List[DeferredError] = deferred_errors if deferred_errors is not None else []
+        self.warnings: List[str] = warnings if warnings is not None else []
+        self.validated_config: Dict[str, Any] = validated_config if validated_config is not None else {}
+
+    @property
+    def errors(self) -> List[str]:
+        """Formatted error messages (renders any deferred errors on first access)."""
+        if self._deferred_errors:
+            self._errors.extend(_format_error(*err) for err in self._deferred_errors)
+            self._deferred_errors = []
+        return self._errors
+
+    @errors.setter
+    def errors(self, value: List[str]) -> None:
+        self._errors = value
+        self._deferred_errors = []
+
+    @property
+    def error_count(self) -> int:
+        """Number of errors, without formatting deferred ones."""
+        return len(self._errors) + len(self._deferred_errors)
 
     def __bool__(self) -> bool:
         return self.is_valid
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ValidationResult):
+            return NotImplemented
+        return (self.is_valid, self.errors, self.warnings, self.validated_config) == \
+            (other.is_valid, other.errors, other.warnings, other.validated_config)
+
+    def __repr__(self) -> str:
+        return (f"ValidationResult(is_valid={self.is_valid!r}, errors={self.errors!r}, "
+                f"warnings={self.warnings!r}, validated_config={self.validated_config!r})")
+
     def raise_if_invalid(self) -> 'ValidationResult':
         """Raise ConfigValidationError if validation failed."""
         if not self.is_valid:
@@ -302,7 +407,7 @@ def validate_threshold(
     if not isinstance(value, (int, float)):
         raise ConfigError(
             key_name,
-            f"Must be numeric, got {type(value).__name__}",
+            f"Must be numeric, got {_type_name(value)}",
             value,
             f"Use a number like 0.9"
         )
@@ -363,7 +468,7 @@ def validate_positive_int(value: Any, key_name: str) -> int:
     if not isinstance(value, int) or isinstance(value, bool):
         raise ConfigError(
             key_name,
-            f"Must be an integer, got {type(value).__name__}",
+            f"Must be an integer, got {_type_name(value)}",
             value
         )
 
@@ -435,7 +540,7 @@ def ensure_list(value: Any, key_name: str, coerce_string: bool = True) -> List[A
 
     raise ConfigError(
         key_name,
-        f"Expected list, got {type(value).__name__}",
+        f"Expected list, got {_type_name(value)}",
         value,
         "Use list syntax: [item1, item2]"
     )
@@ -477,7 +582,7 @@ def validate_regex_pattern(
     if not isinstance(pattern, str):
         raise ConfigError(
             key_name,
-            f"Pattern must be a string, got {type(pattern).__name__}",
+            f"Pattern must be a string, got {_type_name(pattern)}",
             pattern,
             "Enclose pattern in quotes"
         )
@@ -543,6 +648,120 @@ def validate_regex_pattern(
         )
 
 
+# =============================================================================
+# HEALER-SPECIFIC VALIDATORS (dispatched from validate_config_schema)
+# =============================================================================
+# Signature: (healer_config, prefix, add_error, add_warning, root_path, check_paths)
+HealerValidator = Callable[[Dict[str, Any], str, Callable[..., None], Callable[[str, str], None],
+                            Optional[Path], bool], None]
+
+
+def _validate_sync_canonical(
+    healer_config: Dict[str, Any],
+    prefix: str,
+    add_error: Callable[..., None],
+    add_warning: Callable[[str, str], None],
+    root_path: Optional[Path],
+    check_paths: bool
+) -> None:
+    """Validate [healers.sync_canonical] source_file."""
+    # source_file is required when enabled (Issue 6)
+    enabled = healer_config.get('enabled', True)
+    if enabled and 'source_file' not in healer_config:
+        add_error(f'{prefix}.source_file', 'Required when sync_canonical is enabled',
+                 suggestion='Add source_file = "path/to/source.json"')
+    elif 'source_file' in healer_config:
+        source_val = healer_config['source_file']
+        if not isinstance(source_val, str):
+            add_error(f'{prefix}.source_file', 'Must be string, got {}', _type_name(source_val))
+        # Only validate paths for ENABLED healers
+        elif enabled and check_paths and root_path is not None:
+            try:
+                # One string normalization and one stat() for the existence check
+                if os.path.isabs(source_val):
+                    full_source = os.path.normpath(source_val)
+                else:
+                    full_source = os.path.normpath(os.path.join(root_path, source_val))
+                try:
+                    os.stat(full_source)
+                except (OSError, ValueError):
+                    # ValueError: embedded null byte, reported by the traversal check below
+                    add_error(f'{prefix}.source_file',
+                             'Source file does not exist: {}', full_source,
+                             suggestion='Create the file or update the path')
+                # Path traversal check (on the raw value so explicit '..' is still rejected)
+                validate_path_traversal(source_val, root_path, f'{prefix}.source_file')
+            except ConfigError as e:
+                add_error(f'{prefix}.source_file', e)
+
+
+def _validate_enforce_disclosure(
+    healer_config: Dict[str, Any],
+    prefix: str,
+    add_error: Callable[..., None],
+    add_warning: Callable[[str, str], None],
+    root_path: Optional[Path],
+    check_paths: bool
+) -> None:
+    """Validate [healers.enforce_disclosure] layer_definitions."""
+    # layer_definitions validation
+    if 'layer_definitions' in healer_config:
+        layers = healer_config['layer_definitions']
+        if not isinstance(layers, dict):
+            add_error(f'{prefix}.layer_definitions', 'Must be dict, got {}', _type_name(layers))
+        else:
+            for layer_name, layer_config in layers.items():
+                layer_prefix = f'{prefix}.layer_definitions.{layer_name}'
+                if not isinstance(layer_config, dict):
+                    add_error(layer_prefix, 'Must be dict, got {}', _type_name(layer_config))
+                    continue
+                # Validate layer-specific thresholds
+                if 'max_lines' in layer_config:
+                    val = layer_config['max_lines']
+                    try:
+                        validate_positive_int(val, f'{layer_prefix}.max_lines')
+                        if val == 0:
+                            add_warning(f'{layer_prefix}.max_lines',
+                                       'Value is 0, all sections will be flagged as oversized')
+                    except ConfigError as e:
+                        add_error(f'{layer_prefix}.max_lines', e)
+                if 'allowed_depth' in layer_config:
+                    val = layer_config['allowed_depth']
+                    try:
+                        validate_positive_int(val, f'{layer_prefix}.allowed_depth')
+                        if val == 0:
+                            add_warning(f'{layer_prefix}.allowed_depth',
+                                       'Value is 0, all headers will be flagged as too deep')
+                    except ConfigError as e:
+                        add_error(f'{layer_prefix}.allowed_depth', e)
+
+
+def _validate_manage_collapsed(
+    healer_config: Dict[str, Any],
+    prefix: str,
+    add_error: Callable[..., None],
+    add_warning: Callable[[str, str], None],
+    root_path: Optional[Path],
+    check_paths: bool
+) -> None:
+    """Validate [healers.manage_collapsed] hint_strategy."""
+    # hint_strategy validation
+    # Valid values from manage_collapsed.py implementation
+    if 'hint_strategy' in healer_config:
+        strategy = healer_config['hint_strategy']
+        if not (isinstance(strategy, str) and strategy in _VALID_HINT_STRATEGIES):
+            add_error(f'{prefix}.hint_strategy',
+                     "Invalid value '{}'", strategy,
+                     suggestion=f'Use one of: {", ".join(_HINT_STRATEGIES)}')
+
+
+_HEALER_VALIDATORS: Dict[str, HealerValidator] = {
+    'sync_canonical': _validate_sync_canonical,
+    'enforce_disclosure': _validate_enforce_disclosure,
+    'manage_collapsed': _validate_manage_collapsed,
+}
+
+
 def validate_config_schema(
     config: Dict[str, Any],
     project_root: Optional[Path] = None,
@@ -569,7 +788,7 @@ def validate_config_schema(
     Returns:
         ValidationResult with errors and warnings
     """
-    errors: List[str] = []
+    errors: List[DeferredError] = []
     warnings: List[str] = []
     validated_config: Dict[str, Any] = {}
 
@@ -577,12 +796,10 @@ def validate_config_schema(
     if project_root is None:
         project_root = Path.cwd()
 
-    # Helper to add error with clear context
-    def add_error(key: str, msg: str, suggestion: str = None):
-        full_msg = f"[{key}] {msg}"
-        if suggestion:
-            full_msg += f" | Suggestion: {suggestion}"
-        errors.append(full_msg)
+    # Helper to add error with clear context. Messages are str.format templates
+    # (or exceptions) rendered lazily by ValidationResult.errors.
+    def add_error(key: str, msg: Any, *args: Any, suggestion: str = None):
+        errors.append((key, msg, args, suggestion))
 
     def add_warning(key: str, msg: str):
         warnings.append(f"[{key}] {msg}")
@@ -593,19 +810,19 @@ def validate_config_schema(
 
     # Check config is not None (Issue 3)
     if config is None:
-        add_error('config', 'Configuration is None (file may be empty)', 'Provide a valid config file')
-        return ValidationResult(is_valid=False, errors=errors, warnings=warnings)
+        add_error('config', 'Configuration is None (file may be empty)', suggestion='Provide a valid config file')
+        return ValidationResult(is_valid=False, deferred_errors=errors, warnings=warnings)
 
     # Check config is a dict (Issue 3)
     if not isinstance(config, dict):
-        add_error('config', f'Configuration must be a dictionary, got {type(config).__name__}',
-                 'Use TOML sections like [project] or YAML mappings')
-        return ValidationResult(is_valid=False, errors=errors, warnings=warnings)
+        add_error('config', 'Configuration must be a dictionary, got {}', _type_name(config),
+                 suggestion='Use TOML sections like [project] or YAML mappings')
+        return ValidationResult(is_valid=False, deferred_errors=errors, warnings=warnings)
 
     # Check nesting depth (Issue 4 - Resource limits)
     def check_depth(obj: Any, path: str, depth: int) -> bool:
         if depth > MAX_NESTING_DEPTH:
-            add_error(path, f'Config nesting too deep (max {MAX_NESTING_DEPTH})', 'Flatten config structure')
+            add_error(path, 'Config nesting too deep (max {})', MAX_NESTING_DEPTH, suggestion='Flatten config structure')
             return False
         if isinstance(obj, dict):
             for k, v in list(obj.items())[:100]:
@@ -618,72 +835,79 @@ def validate_config_schema(
         return True
 
     if not check_depth(config, 'config', 0):
-        return ValidationResult(is_valid=False, errors=errors, warnings=warnings)
+        return ValidationResult(is_valid=False, deferred_errors=errors, warnings=warnings)
 
     # =========================================================================
     # [project] section - REQUIRED
     # =========================================================================
     project = config.get('project', {})
 
+    # Expand project.root once; the doc_root, sync_canonical and reporting
+    # checks below all reuse this Path (None when root is missing or not a
+    # string; an empty root is the current directory and is still checked)
+    root_path: Optional[Path] = None
+    if isinstance(project, dict):
+        _root = project.get('root')
+        if isinstance(_root, (str, Path)):
+            _root_str = str(_root)
+            root_path = Path(os.path.expanduser(_root_str)) if _root_str.startswith('~') else Path(_root)
+
     if not project:
         add_error('project', 'Missing required [project] section',
-                 'Add [project] section with root and doc_root keys')
+                 suggestion='Add [project] section with root and doc_root keys')
     elif not isinstance(project, dict):
-        add_error('project', f'Must be a section/dict, got {type(project).__name__}',
-                 'Use [project] in TOML or project: in YAML')
+        add_error('project', 'Must be a section/dict, got {}', _type_name(project),
+                 suggestion='Use [project] in TOML or project: in YAML')
     else:
         # Required: root (Issue 1, 6 - Path validation)
         if 'root' not in project:
             add_error('project.root', 'Required key missing',
-                     'Add root = "." for current directory or absolute path')
+                     suggestion='Add root = "." for current directory or absolute path')
         else:
             root_val = project['root']
             # Type check (Issue 3)
             if not isinstance(root_val, (str, Path)):
-                add_error('project.root', f'Must be a string, got {type(root_val).__name__}',
-                         'Use root = "path/to/project"')
+                add_error('project.root', 'Must be a string, got {}', _type_name(root_val),
+                         suggestion='Use root = "path/to/project"')
             else:
-                root_path = Path(root_val)
                 # Expand ~ (Issue 5 in PH tests)
                 if str(root_val).startswith('~'):
-                    root_path = Path(os.path.expanduser(str(root_val)))
                     add_warning('project.root', f'Expanded ~ to {root_path}')
 
-                if check_paths and not root_path.exists():
-                    add_error('project.root', f"Path does not exist: {root_val}",
-                             'Create the directory or use an existing path')
+                root_dir = root_path if root_path is not None else Path(root_val)
+
+                if check_paths and not root_dir.exists():
+                    add_error('project.root', 'Path does not exist: {}', root_val,
+                             suggestion='Create the directory or use an existing path')
                 else:
                     # Update project_root for later validations
-                    project_root = root_path.resolve() if root_path.exists() else project_root
+                    project_root = root_dir.resolve() if root_dir.exists() else project_root
 
         # Required: doc_root (Issue 1 - Path traversal)
         if 'doc_root' not in project:
             add_error('project.doc_root', 'Required key missing',
-                     'Add doc_root = "docs/" or similar')
+                     suggestion='Add doc_root = "docs/" or similar')
         elif 'root' in project:
             doc_root_val = project['doc_root']
             # Type check (Issue 3)
             if not isinstance(doc_root_val, (str, Path)):
-                add_error('project.doc_root', f'Must be a string, got {type(doc_root_val).__name__}',
-                         'Use doc_root = "docs/"')
+                add_error('project.doc_root', 'Must be a string, got {}', _type_name(doc_root_val),
+                         suggestion='Use doc_root = "docs/"')
             else:
                 try:
                     doc_root = Path(doc_root_val)
-                    root_path = Path(project['root'])
-                    if str(project['root']).startswith('~'):
-                        root_path = Path(os.path.expanduser(project['root']))
 
                     # Path traversal check (Issue 1)
-                    if check_paths and root_path.exists():
+                    if check_paths and root_path is not None and root_path.exists():
                         validate_path_traversal(doc_root, root_path, 'project.doc_root')
 
                     # Check for explicit traversal attempt
                     if '..' in str(doc_root_val):
                         add_error('project.doc_root', "Path contains '..' (directory traversal not allowed)",
-                                 'Use a path within project root without ..')
+                                 suggestion='Use a path within project root without ..')
 
                 except ConfigError as e:
-                    add_error('project.doc_root', str(e))
+                    add_error('project.doc_root', e)
 
         # Optional: excluded_dirs (Issue 5 - List vs string)
         if 'excluded_dirs' in project:
@@ -693,12 +917,12 @@ def validate_config_schema(
                 for i, d in enumerate(dirs):
                     if d is None:
                         add_error(f'project.excluded_dirs[{i}]', 'Contains None value',
-                                 'Remove null entries from list')
+                                 suggestion='Remove null entries from list')
                     elif not isinstance(d, str):
-                        add_error(f'project.excluded_dirs[{i}]', f'Must be string, got {type(d).__name__}',
-                                 'Use string values in list')
+                        add_error(f'project.excluded_dirs[{i}]', 'Must be string, got {}', _type_name(d),
+                                 suggestion='Use string values in list')
             except ConfigError as e:
-                add_error('project.excluded_dirs', str(e))
+                add_error('project.excluded_dirs', e)
 
     # =========================================================================
     # [confidence] section - OPTIONAL but validated if present (Issue 2)
@@ -706,11 +930,11 @@ def validate_config_schema(
     confidence = config.get('confidence', {})
 
     if confidence and not isinstance(confidence, dict):
-        add_error('confidence', f'Must be a section/dict, got {type(confidence).__name__}',
-                 'Use [confidence] in TOML or confidence: in YAML')
+        add_error('confidence', 'Must be a section/dict, got {}', _type_name(confidence),
+                 suggestion='Use [confidence] in TOML or confidence: in YAML')
     elif isinstance(confidence, dict):
         # Validate all threshold keys (Issue 2 - Numeric ranges)
-        for threshold_key in ['auto_commit_threshold', 'auto_stage_threshold', 'report_only_threshold']:
+        for threshold_key in _CONFIDENCE_THRESHOLD_KEYS:
             if threshold_key in confidence:
                 try:
                     validate_threshold(
@@ -718,7 +942,7 @@ def validate_config_schema(
                         f'confidence.{threshold_key}'
                     )
                 except ConfigError as e:
-                    add_error(f'confidence.{threshold_key}', str(e))
+                    add_error(f'confidence.{threshold_key}', e)
 
         # Check threshold ordering logic (commit > stage > report)
         commit_t = confidence.get('auto_commit_threshold')
@@ -749,56 +973,56 @@ def validate_config_schema(
     healers = config.get('healers', {})
 
     if healers and not isinstance(healers, dict):
-        add_error('healers', f'Must be a section/dict, got {type(healers).__name__}',
-                 'Use [healers.healer_name] in TOML')
+        add_error('healers', 'Must be a section/dict, got {}', _type_name(healers),
+                 suggestion='Use [healers.healer_name] in TOML')
     elif isinstance(healers, dict):
         for healer_name, healer_config in healers.items():
             prefix = f'healers.{healer_name}'
 
             # Type check healer config (Issue 3)
             if not isinstance(healer_config, dict):
-                add_error(prefix, f'Must be a section/dict, got {type(healer_config).__name__}',
-                         f'Use [{prefix}] section in TOML')
+                add_error(prefix, 'Must be a section/dict, got {}', _type_name(healer_config),
+                         suggestion=f'Use [{prefix}] section in TOML')
                 continue
 
             # Validate 'enabled' field - handle string boolean issue (Issue 5 - TC-005, TC-009)
             if 'enabled' in healer_config:
                 enabled_val = healer_config['enabled']
                 if isinstance(enabled_val, str):
-                    if enabled_val.lower() in ('false', 'no', '0'):
+                    if enabled_val.lower() in _FALSY_STRINGS:
                         add_warning(f'{prefix}.enabled',
                                    f"String '{enabled_val}' is truthy in Python. Use boolean false (no quotes)")
-                    elif enabled_val.lower() not in ('true', 'yes', '1'):
-                        add_error(f'{prefix}.enabled', f"Invalid boolean string '{enabled_val}'",
-                                 'Use true or false without quotes')
+                    elif enabled_val.lower() not in _TRUTHY_STRINGS:
+                        add_error(f'{prefix}.enabled', "Invalid boolean string '{}'", enabled_val,
+                                 suggestion='Use true or false without quotes')
 
             # Validate regex patterns (Issue 7)
             # NOTE: backlink_format is a template string with {title} and {path}, NOT a regex
-            for pattern_key in ['link_pattern', 'section_pattern']:
+            for pattern_key in _REGEX_KEYS:
                 if pattern_key in healer_config:
                     value = healer_config[pattern_key]
                     if isinstance(value, str):
                         try:
                             validate_regex_pattern(value, f'{prefix}.{pattern_key}')
                         except ConfigError as e:
-                            add_error(f'{prefix}.{pattern_key}', str(e))
+                            add_error(f'{prefix}.{pattern_key}', e)
 
             # Validate pattern lists (Issue 4, 7)
-            for pattern_list_key in ['timestamp_patterns', 'jargon_patterns']:
+            for pattern_list_key in _REGEX_LIST_KEYS:
                 if pattern_list_key in healer_config:
                     try:
                         patterns = ensure_list(healer_config[pattern_list_key], f'{prefix}.{pattern_list_key}')
                         if len(patterns) > MAX_PATTERNS:
                             add_error(f'{prefix}.{pattern_list_key}',
-                                     f'Too many patterns ({len(patterns)}). Max is {MAX_PATTERNS}.',
-                                     'Reduce pattern count or split configuration')
+                                     'Too many patterns ({}). Max is {}.', len(patterns), MAX_PATTERNS,
+                                     suggestion='Reduce pattern count or split configuration')
                         for i, pattern in enumerate(patterns):
                             try:
                                 validate_regex_pattern(pattern, f'{prefix}.{pattern_list_key}[{i}]')
                             except ConfigError as e:
-                                add_error(f'{prefix}.{pattern_list_key}[{i}]', str(e))
+                                add_error(f'{prefix}.{pattern_list_key}[{i}]', e)
                     except ConfigError as e:
-                        add_error(f'{prefix}.{pattern_list_key}', str(e))
+                        add_error(f'{prefix}.{pattern_list_key}', e)
 
             # Validate deprecated_patterns (list of dicts with pattern key)
             if 'deprecated_patterns' in healer_config:
@@ -806,7 +1030,7 @@ def validate_config_schema(
                     dep_patterns = ensure_list(healer_config['deprecated_patterns'], f'{prefix}.deprecated_patterns')
                     if len(dep_patterns) > MAX_PATTERNS:
                         add_error(f'{prefix}.deprecated_patterns',
-                                 f'Too many patterns ({len(dep_patterns)}). Max is {MAX_PATTERNS}.')
+                                 'Too many patterns ({}). Max is {}.', len(dep_patterns), MAX_PATTERNS)
                     for i, item in enumerate(dep_patterns):
                         item_prefix = f'{prefix}.deprecated_patterns[{i}]'
                         if isinstance(item, dict):
@@ -814,40 +1038,33 @@ def validate_config_schema(
                                 try:
                                     validate_regex_pattern(item['pattern'], f'{item_prefix}.pattern')
                                 except ConfigError as e:
-                                    add_error(f'{item_prefix}.pattern', str(e))
+                                    add_error(f'{item_prefix}.pattern', e)
                             if 'confidence' in item:
                                 try:
                                     validate_threshold(item['confidence'], f'{item_prefix}.confidence')
                                 except ConfigError as e:
-                                    add_error(f'{item_prefix}.confidence', str(e))
+                                    add_error(f'{item_prefix}.confidence', e)
                         elif isinstance(item, str):
                             # Allow simple string patterns
                             try:
                                 validate_regex_pattern(item, item_prefix)
                             except ConfigError as e:
-                                add_error(item_prefix, str(e))
+                                add_error(item_prefix, e)
                         else:
-                            add_error(item_prefix, f'Must be dict or string, got {type(item).__name__}')
+                            add_error(item_prefix, 'Must be dict or string, got {}', _type_name(item))
                 except ConfigError as e:
-                    add_error(f'{prefix}.deprecated_patterns', str(e))
+                    add_error(f'{prefix}.deprecated_patterns', e)
 
             # Validate numeric thresholds (Issue 2)
-            threshold_configs = {
-                'similarity_threshold': (0.0, 1.0),
-                'fuzzy_threshold': (0.0, 1.0),
-                'missing_keywords_threshold': (0.0, 1.0),
-                'historical_success_rate': (0.0, 1.0),
-            }
-            for threshold_key, (min_val, max_val) in threshold_configs.items():
+            for threshold_key, (min_val, max_val) in _THRESHOLD_CONFIGS.items():
                 if threshold_key in healer_config:
                     try:
                         validate_threshold(healer_config[threshold_key], f'{prefix}.{threshold_key}', min_val, max_val)
                     except ConfigError as e:
-                        add_error(f'{prefix}.{threshold_key}', str(e))
+                        add_error(f'{prefix}.{threshold_key}', e)
 
             # Validate positive integer fields (Issue 2)
-            int_fields = ['staleness_threshold_days', 'min_block_size', 'long_section_threshold']
-            for int_key in int_fields:
+            for int_key in _INT_FIELDS:
                 if int_key in healer_config:
                     value = healer_config[int_key]
                     try:
@@ -857,91 +1074,24 @@ def validate_config_schema(
                             add_warning(f'{prefix}.{int_key}',
                                        f'Value is 0, which may cause all items to be flagged')
                     except ConfigError as e:
-                        add_error(f'{prefix}.{int_key}', str(e))
+                        add_error(f'{prefix}.{int_key}', e)
 
             # Validate list fields (Issue 5)
-            list_fields = ['exclude_dirs', 'file_extensions', 'hierarchy_rules', 'related_section_headers']
-            for list_key in list_fields:
+            for list_key in _LIST_FIELDS:
                 if list_key in healer_config:
                     try:
                         items = ensure_list(healer_config[list_key], f'{prefix}.{list_key}')
                         if len(items) > MAX_ARRAY_SIZE:
                             add_error(f'{prefix}.{list_key}',
-                                     f'Too many items ({len(items)}). Maximum is {MAX_ARRAY_SIZE}.',
-                                     f'Reduce to fewer than {MAX_ARRAY_SIZE} items')
+                                     'Too many items ({}). Maximum is {}.', len(items), MAX_ARRAY_SIZE,
+                                     suggestion=f'Reduce to fewer than {MAX_ARRAY_SIZE} items')
                     except ConfigError as e:
-                        add_error(f'{prefix}.{list_key}', str(e))
+                        add_error(f'{prefix}.{list_key}', e)
 
             # Healer-specific validations
-            if healer_name == 'sync_canonical':
-                # source_file is required when enabled (Issue 6)
-                enabled = healer_config.get('enabled', True)
-                if enabled and 'source_file' not in healer_config:
-                    add_error(f'{prefix}.source_file', 'Required when sync_canonical is enabled',
-                             'Add source_file = "path/to/source.json"')
-                elif 'source_file' in healer_config:
-                    source_val = healer_config['source_file']
-                    if not isinstance(source_val, str):
-                        add_error(f'{prefix}.source_file', f'Must be string, got {type(source_val).__name__}')
-                    # Only validate paths for ENABLED healers
-                    elif enabled and check_paths and project.get('root'):
-                        try:
-                            source_path = Path(source_val)
-                            root_path = Path(project['root'])
-                            if str(project['root']).startswith('~'):
-                                root_path = Path(os.path.expanduser(project['root']))
-                            full_source = root_path / source_path if not source_path.is_absolute() else source_path
-                            if not full_source.exists():
-                                add_error(f'{prefix}.source_file',
-                                         f'Source file does not exist: {full_source}',
-                                         'Create the file or update the path')
-                            # Path traversal check
-                            validate_path_traversal(source_path, root_path, f'{prefix}.source_file')
-                        except ConfigError as e:
-                            add_error(f'{prefix}.source_file', str(e))
-
-            if healer_name == 'enforce_disclosure':
-                # layer_definitions validation
-                if 'layer_definitions' in healer_config:
-                    layers = healer_config['layer_definitions']
-                    if not isinstance(layers, dict):
-                        add_error(f'{prefix}.layer_definitions', f'Must be dict, got {type(layers).__name__}')
-                    else:
-                        for layer_name, layer_config in layers.items():
-                            layer_prefix = f'{prefix}.layer_definitions.{layer_name}'
-                            if not isinstance(layer_config, dict):
-                                add_error(layer_prefix, f'Must be dict, got {type(layer_config).__name__}')
-                                continue
-                            # Validate layer-specific thresholds
-                            if 'max_lines' in layer_config:
-                                val = layer_config['max_lines']
-                                try:
-                                    validate_positive_int(val, f'{layer_prefix}.max_lines')
-                                    if val == 0:
-                                        add_warning(f'{layer_prefix}.max_lines',
-                                                   'Value is 0, all sections will be flagged as oversized')
-                                except ConfigError as e:
-                                    add_error(f'{layer_prefix}.max_lines', str(e))
-                            if 'allowed_depth' in layer_config:
-                                val = layer_config['allowed_depth']
-                                try:
-                                    validate_positive_int(val, f'{layer_prefix}.allowed_depth')
-                                    if val == 0:
-                                        add_warning(f'{layer_prefix}.allowed_depth',
-                                                   'Value is 0, all headers will be flagged as too deep')
-                                except ConfigError as e:
-                                    add_error(f'{layer_prefix}.allowed_depth', str(e))
-
-            if healer_name == 'manage_collapsed':
-                # hint_strategy validation
-                # Valid values from manage_collapsed.py implementation
-                if 'hint_strategy' in healer_config:
-                    strategy = healer_config['hint_strategy']
-                    valid_strategies = ['summary', 'first_sentence', 'keywords']
-                    if strategy not in valid_strategies:
-                        add_error(f'{prefix}.hint_strategy',
-                                 f"Invalid value '{strategy}'",
-                                 f'Use one of: {", ".join(valid_strategies)}')
+            validator = _HEALER_VALIDATORS.get(healer_name)
+            if validator is not None:
+                validator(healer_config, prefix, add_error, add_warning, root_path, check_paths)
 
     # =========================================================================
     # [git] section - OPTIONAL
@@ -949,22 +1099,22 @@ def validate_config_schema(
     git = config.get('git', {})
 
     if git and not isinstance(git, dict):
-        add_error('git', f'Must be a section/dict, got {type(git).__name__}',
-                 'Use [git] in TOML')
+        add_error('git', 'Must be a section/dict, got {}', _type_name(git),
+                 suggestion='Use [git] in TOML')
     elif isinstance(git, dict):
         if 'commit_prefix' in git:
             if not isinstance(git['commit_prefix'], str):
-                add_error('git.commit_prefix', f"Must be string, got {type(git['commit_prefix']).__name__}",
-                         'Use commit_prefix = "[docs]"')
+                add_error('git.commit_prefix', 'Must be string, got {}', _type_name(git['commit_prefix']),
+                         suggestion='Use commit_prefix = "[docs]"')
 
         if 'auto_commit' in git:
             val = git['auto_commit']
-            if isinstance(val, str) and val.lower() in ('false', 'no', '0'):
+            if isinstance(val, str) and val.lower() in _FALSY_STRINGS:
                 add_warning('git.auto_commit', f"String '{val}' is truthy. Use boolean false")
 
         if 'install_hooks' in git:
             val = git['install_hooks']
-            if isinstance(val, str) and val.lower() in ('false', 'no', '0'):
+            if isinstance(val, str) and val.lower() in _FALSY_STRINGS:
                 add_warning('git.install_hooks', f"String '{val}' is truthy. Use boolean false")
 
     # =========================================================================
@@ -973,41 +1123,32 @@ def validate_config_schema(
     reporting = config.get('reporting', {})
 
     if reporting and not isinstance(reporting, dict):
-        add_error('reporting', f'Must be a section/dict, got {type(reporting).__name__}',
-                 'Use [reporting] in TOML')
+        add_error('reporting', 'Must be a section/dict, got {}', _type_name(reporting),
+                 suggestion='Use [reporting] in TOML')
     elif isinstance(reporting, dict):
         if 'output_dir' in reporting:
             output_val = reporting['output_dir']
             if not isinstance(output_val, str):
-                add_error('reporting.output_dir', f'Must be string, got {type(output_val).__name__}')
-            elif project.get('root'):
-                try:
-                    output_dir = Path(output_val)
-                    root_path = Path(project['root'])
-                    if str(project['root']).startswith('~'):
-                        root_path = Path(os.path.expanduser(project['root']))
-                    # Path traversal check (warning, not error - output dir can be created)
-                    if '..' in output_val:
-                        add_warning('reporting.output_dir',
-                                   f"Path contains '..', may escape project root")
-                except Exception as e:
-                    add_warning('reporting.output_dir', str(e))
+                add_error('reporting.output_dir', 'Must be string, got {}', _type_name(output_val))
+            elif root_path is not None:
+                # Path traversal check (warning, not error - output dir can be created)
+                if '..' in output_val:
+                    add_warning('reporting.output_dir',
+                               f"Path contains '..', may escape project root")
 
         if 'format' in reporting:
             fmt = reporting['format']
             # Valid values from reporting.py implementation (supports 'both' for markdown+json)
-            valid_formats = ['markdown', 'json', 'html', 'both']
-            if fmt not in valid_formats:
-                add_error('reporting.format', f"Invalid format '{fmt}'",
-                         f'Use one of: {", ".join(valid_formats)}')
+            if not (isinstance(fmt, str) and fmt in _VALID_REPORT_FORMATS):
+                add_error('reporting.format', "Invalid format '{}'", fmt,
+                         suggestion=f'Use one of: {", ".join(_REPORT_FORMATS)}')
 
     # =========================================================================
     # [advanced] section - Check for unimplemented features
     # =========================================================================
     advanced = config.get('advanced', {})
     if advanced and isinstance(advanced, dict):
-        unimplemented = ['max_workers', 'cache_dir', 'enable_cache', 'cache_ttl']
-        for key in unimplemented:
+        for key in _UNIMPLEMENTED_ADVANCED_KEYS:
             if key in advanced:
                 add_warning(f'advanced.{key}', 'This feature is documented but not yet implemented')
 
@@ -1016,7 +1157,7 @@ def validate_config_schema(
     # =========================================================================
     return ValidationResult(
         is_valid=len(errors) == 0,
-        errors=errors,
+        deferred_errors=errors,
         warnings=warnings,
         validated_config=config if len(errors) == 0 else {}
     )
@@ -1050,62 +1191,137 @@ def safe_read_file(path: Path, max_size: int = MAX_FILE_SIZE) -> str:
     return path.read_text()
 
 
-def validate_and_load_config(
+# =============================================================================
+# PARSED CONFIG CACHE
+# =============================================================================
+# Parsed configs keyed by (resolved path, mtime_ns, size), most recent last.
+# Only parsing is cached. ValidationResult is recomputed on every call: with
+# check_paths it depends on which configured paths exist on disk, and that
+# can change without the config file changing.
+MAX_CACHED_CONFIGS = 100
+_config_cache: "OrderedDict[Tuple[str, int, int], Any]" = OrderedDict()
+_config_cache_lock = threading.Lock()
+
+
+class ConfigParseError(ValueError):
+    """Syntax error in a config file (reported as a validation error)."""
+    pass
+
+
+def clear_config_cache() -> None:
+    """Forget all parsed configs."""
+    with _config_cache_lock:
+        _config_cache.clear()
+
+
+def load_cached_config(
     config_path: Path,
-    check_paths: bool = True
-) -> Tuple[Dict[str, Any], ValidationResult]:
+    st: os.stat_result,
+    use_sidecar: bool = False
+) -> Any:
     """
-    Load and validate a configuration file.
+    Return parse_config_file(config_path), reusing it until the file changes.
 
-    This is the main entry point for config validation. It:
-    1. Checks file exists and is valid size
-    2. Parses YAML/TOML with proper error handling
-    3. Runs comprehensive validation
-    4. Returns both config and validation result
+    Cached entries are keyed by the file's resolved path, mtime and size.
+    Every caller goes through the same parser, so a cached entry is what
+    any of them would have parsed. Every call returns a fresh deep copy,
+    so callers may modify it.
+
+    With use_sidecar, the parsed config is also stored next to the source
+    as "<name>.cache.json" so later processes can skip YAML/TOML parsing.
+    The sidecar is only written when the config survives a JSON round
+    trip unchanged (no dates, non-string keys, etc.) and is ignored once
+    the source's mtime or size changes.
 
     Args:
-        config_path: Path to config file (YAML, TOML, or JSON)
-        check_paths: If True, verify paths exist on disk
+        config_path: Path to config file
+        st: Result of config_path.stat()
+        use_sidecar: Read/write a JSON sidecar cache next to the config
 
     Returns:
-        (config_dict, validation_result)
-
-    Raises:
-        FileNotFoundError: If config file doesn't exist
-        ValueError: If config format is unsupported
-        ConfigValidationError: If config is invalid (when using raise_if_invalid)
+        Parsed configuration
     """
-    # Check file exists
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    key = (str(config_path.resolve()), st.st_mtime_ns, st.st_size)
+    with _config_cache_lock:
+        cached = _config_cache.get(key)
+        if cached is not None:
+            _config_cache.move_to_end(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    config = _read_config_sidecar(config_path, st) if use_sidecar else None
+    if config is None:
+        config = parse_config_file(config_path)
+        if use_sidecar:
+            _write_config_sidecar(config_path, st, config)
 
-    # Check file size (Issue 4 - Resource limits)
-    file_size = config_path.stat().st_size
-    if file_size > 10 * 1024 * 1024:  # 10MB
-        raise ValueError(
-            f"Config file too large: {config_path} ({file_size:,} bytes). "
-            f"Maximum is 10MB."
-        )
+    with _config_cache_lock:
+        _config_cache[key] = config
+        if len(_config_cache) > MAX_CACHED_CONFIGS:
+            _config_cache.popitem(last=False)
+
+    return copy.deepcopy(config)
 
-    if file_size == 0:
-        raise ValueError(f"Config file is empty: {config_path}")
 
-    # Load based on extension
+def _config_sidecar_path(config_path: Path) -> Path:
+    """Location of the JSON sidecar cache for config_path."""
+    return config_path.with_name(config_path.name + '.cache.json')
+
+
+def _read_config_sidecar(config_path: Path, st: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Config stored in the sidecar for this version of the source, if any."""
+    try:
+        with open(_config_sidecar_path(config_path), encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get('source') != [st.st_mtime_ns, st.st_size]:
+        return None
+    config = data.get('config')
+    return config if isinstance(config, dict) else None
+
+
+def _write_config_sidecar(config_path: Path, st: os.stat_result, config: Any) -> None:
+    """Atomically store config in the sidecar; skipped if JSON would alter it."""
+    if not isinstance(config, dict):
+        return
+    try:
+        encoded = json.dumps({'source': [st.st_mtime_ns, st.st_size], 'config': config})
+    except (TypeError, ValueError):
+        return  # e.g. TOML/YAML dates
+    if json.loads(encoded)['config'] != config:
+        return  # e.g. integer keys would come back as strings
+
+    try:
+        atomic_write(_config_sidecar_path(config_path), encoded)
+    except (AtomicWriteError, OSError):
+        pass  # The sidecar is only an optimization (e.g. read-only directory)
+
+
+def parse_config_file(config_path: Path) -> Any:
+    """
+    Parse a YAML, TOML or JSON config file (no caching).
+
+    Raises:
+        ConfigParseError: If the file has a syntax error
+        ValueError: If the format is unsupported or its parser is missing
+    """
     suffix = config_path.suffix.lower()
-    config = None
-    parse_error = None
 
     if suffix in ['.yaml', '.yml']:
         try:
             import yaml
+            # Safe loading either way; CSafeLoader is the libyaml-backed one
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
             with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                return yaml.load(f, Loader=loader)
         except ImportError:
             raise ValueError(
                 "YAML support requires PyYAML. Install with: pip install pyyaml"
-            )
+            ) from None
         except yaml.YAMLError as e:
-            parse_error = f"YAML parse error: {e}"
+            raise ConfigParseError(f"YAML parse error: {e}") from None
 
     elif suffix == '.toml':
         try:
@@ -1114,21 +1330,20 @@ def validate_and_load_config(
             except ImportError:
                 import toml as tomllib
             with open(config_path, 'rb') as f:
-                config = tomllib.load(f)
+                return tomllib.load(f)
         except ImportError:
             raise ValueError(
                 "TOML support requires toml. Install with: pip install toml"
-            )
+            ) from None
         except Exception as e:
-            parse_error = f"TOML parse error: {e}"
+            raise ConfigParseError(f"TOML parse error: {e}") from None
 
     elif suffix == '.json':
-        import json
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+                return json.load(f)
         except json.JSONDecodeError as e:
-            parse_error = f"JSON parse error at line {e.lineno}: {e.msg}"
+            raise ConfigParseError(f"JSON parse error at line {e.lineno}: {e.msg}") from None
 
     else:
         raise ValueError(
@@ -1136,11 +1351,59 @@ def validate_and_load_config(
             f"Use .yaml, .yml, .toml, or .json"
         )
 
+
+def validate_and_load_config(
+    config_path: Path,
+    check_paths: bool = True,
+    use_sidecar: bool = False
+) -> Tuple[Dict[str, Any], ValidationResult]:
+    """
+    Load and validate a configuration file.
+
+    This is the main entry point for config validation. It:
+    1. Checks file exists and is valid size
+    2. Parses YAML/TOML with proper error handling (cached until the file changes)
+    3. Runs comprehensive validation
+    4. Returns both config and validation result
+
+    Args:
+        config_path: Path to config file (YAML, TOML, or JSON)
+        check_paths: If True, verify paths exist on disk
+        use_sidecar: Read/write a JSON sidecar cache next to the config
+                     (see load_cached_config)
+
+    Returns:
+        (config_dict, validation_result)
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+        ValueError: If config format is unsupported
+        ConfigValidationError: If config is invalid (when using raise_if_invalid)
+    """
+    # Check file exists
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    # Check file size (Issue 4 - Resource limits)
+    file_size = st.st_size
+    if file_size > 10 * 1024 * 1024:  # 10MB
+        raise ValueError(
+            f"Config file too large: {config_path} ({file_size:,} bytes). "
+            f"Maximum is 10MB."
+        )
+
+    if file_size == 0:
+        raise ValueError(f"Config file is empty: {config_path}")
+
     # Handle parse errors
-    if parse_error:
+    try:
+        config = load_cached_config(config_path, st, use_sidecar)
+    except ConfigParseError as e:
         return {}, ValidationResult(
             is_valid=False,
-            errors=[f"[config_file] {parse_error}"],
+            errors=[f"[config_file] {e}"],
             warnings=[],
             validated_config={}
         )
@@ -1148,7 +1411,7 @@ def validate_and_load_config(
     if not isinstance(config, dict):
         return {}, ValidationResult(
             is_valid=False,
-            errors=["[config] Config must be a dictionary/mapping, got " + type(config).__name__],
+            errors=["[config] Config must be a dictionary/mapping, got " + _type_name(config)],
             warnings=[],
             validated_config={}
         )
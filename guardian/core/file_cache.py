@@ -6,7 +6,7 @@ Reduces I/O overhead by caching file content with TTL and LRU eviction.
 
 Performance impact:
 - Files read 3-7x by different healers → 1x with cache
-- Memory bounded by max_size parameter
+- Memory bounded by max_size (entries) and max_bytes (content size)
 - TTL ensures freshness for long-running operations
 """
 
@@ -14,7 +14,9 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass, field
-from collections import OrderedDict
+from collections import Counter, OrderedDict
+import sys
+import threading
 import time
 import hashlib
 
@@ -26,6 +28,7 @@ class CacheEntry:
     mtime: float  # File modification time when cached
     cached_at: float  # When this entry was cached
     size: int  # Content size in bytes
+    lines: Optional[List[str]] = None  # Lazily populated by read_lines()
 
 
 class FileCache:
@@ -33,29 +36,40 @@ class FileCache:
     LRU cache for file content with TTL support.
 
     Features:
-    - LRU eviction when max_size is reached
+    - LRU eviction when max_size or max_bytes is reached
     - TTL-based expiration for freshness
     - mtime tracking to detect file changes
-    - Memory-bounded by max_size
+    - Memory-bounded by max_bytes, so one huge file can't crowd out RSS
+    - Thread-safe: lookups are lock-free, mutations take a single RLock
 
     Usage:
         cache = FileCache(max_size=1000, ttl_seconds=300)
         content = cache.read(Path("/path/to/file.md"))
     """
 
-    def __init__(self, max_size: int = 1000, ttl_seconds: float = 300.0):
+    def __init__(self, max_size: int = 1000, ttl_seconds: float = 300.0,
+                 max_bytes: int = 64 * 1024 * 1024):
         """
         Initialize file cache.
 
         Args:
             max_size: Maximum number of files to cache (default: 1000)
             ttl_seconds: Time-to-live for cache entries in seconds (default: 5 minutes)
+            max_bytes: Maximum total weight of cached content (default: 64MB).
+                Files heavier than this on their own are returned but not cached.
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self._cache: OrderedDict[Path, CacheEntry] = OrderedDict()
+        self.max_bytes = max_bytes
+        # Keyed by interned resolved-path strings: str hashes are cached on the
+        # object, so repeat lookups skip Path.__hash__'s str() round-trip
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._total_bytes = 0
         self._hits = 0
         self._misses = 0
+        # Guards every mutation of _cache and the hit/miss counters. Plain
+        # dict lookups stay outside the lock (atomic under the GIL).
+        self._lock = threading.RLock()
 
     def read(self, file_path: Path) -> str:
         """
@@ -71,10 +85,15 @@ class FileCache:
             FileNotFoundError: If file does not exist
             IOError: If file cannot be read
         """
+        return self._get_entry(file_path).content
+
+    def _get_entry(self, file_path: Path) -> CacheEntry:
+        """Return a fresh cache entry for file_path, reading it on a miss."""
         file_path = file_path.resolve()
+        key = sys.intern(str(file_path))
 
         # Check cache
-        entry = self._cache.get(file_path)
+        entry = self._cache.get(key)
 
         if entry is not None:
             # Validate cache entry
@@ -83,60 +102,100 @@ class FileCache:
             # Check TTL
             if current_time - entry.cached_at > self.ttl_seconds:
                 # Expired - remove and re-read
-                del self._cache[file_path]
+                self._discard(key, entry)
             else:
                 # Check if file was modified
                 try:
                     current_mtime = file_path.stat().st_mtime
                     if current_mtime <= entry.mtime:
                         # Cache hit - move to end (most recently used)
-                        self._cache.move_to_end(file_path)
-                        self._hits += 1
-                        return entry.content
+                        with self._lock:
+                            if key in self._cache:
+                                self._cache.move_to_end(key)
+                            self._hits += 1
+                        return entry
                 except OSError:
                     # File stat failed - remove from cache
-                    del self._cache[file_path]
+                    self._discard(key, entry)
 
-        # Cache miss - read file
-        self._misses += 1
+        # Cache miss - read file (outside the lock so slow I/O never blocks hits)
+        with self._lock:
+            self._misses += 1
         content = file_path.read_text(encoding='utf-8')
 
         # Add to cache
-        self._add_to_cache(file_path, content)
-
-        return content
+        return self._add_to_cache(key, file_path, content)
 
     def read_lines(self, file_path: Path) -> List[str]:
         """
         Read file and return lines.
 
+        The split result is cached on the entry, so repeated calls for an
+        unchanged file only copy the list rather than re-splitting the content.
+
         Args:
             file_path: Path to file
 
         Returns:
             List of lines (without newlines)
         """
-        content = self.read(file_path)
-        return content.split('\n')
+        entry = self._get_entry(file_path)
+        if entry.lines is None:
+            entry.lines = entry.content.split('\n')
+        # Shallow copy so callers can mutate their list without touching the cache
+        return list(entry.lines)
 
-    def _add_to_cache(self, file_path: Path, content: str):
+    def _add_to_cache(self, key: str, file_path: Path, content: str) -> CacheEntry:
         """Add content to cache with eviction if needed."""
-        # Evict oldest entries if at capacity
-        while len(self._cache) >= self.max_size:
-            self._cache.popitem(last=False)  # Remove oldest (first) item
-
         try:
             mtime = file_path.stat().st_mtime
         except OSError:
             mtime = time.time()
 
-        self._cache[file_path] = CacheEntry(
+        entry = CacheEntry(
             content=content,
             mtime=mtime,
             cached_at=time.time(),
             size=len(content)
         )
 
+        weight = self.weight(entry)
+        if weight > self.max_bytes:
+            # Caching this file would evict everything else; serve it uncached
+            return entry
+
+        with self._lock:
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._total_bytes -= self.weight(old)
+
+            # Evict oldest entries until both the entry and byte budgets fit
+            while self._cache and (len(self._cache) >= self.max_size or
+                                   self._total_bytes + weight > self.max_bytes):
+                _, evicted = self._cache.popitem(last=False)  # Remove oldest (first) item
+                self._total_bytes -= self.weight(evicted)
+
+            self._cache[key] = entry
+            self._total_bytes += weight
+        return entry
+
+    def _discard(self, key: str, entry: CacheEntry):
+        """Remove key if it still maps to entry (another thread may have refreshed it)."""
+        with self._lock:
+            if self._cache.get(key) is entry:
+                del self._cache[key]
+                self._total_bytes -= self.weight(entry)
+
+    @staticmethod
+    def weight(entry: CacheEntry) -> int:
+        """
+        Cost of an entry against max_bytes.
+
+        Currently the content length; kept as a single hook so other
+        representations (e.g. compressed content) can be priced differently.
+        """
+        return entry.size
+
     def invalidate(self, file_path: Path):
         """
         Invalidate a cache entry.
@@ -146,15 +205,19 @@ class FileCache:
         Args:
             file_path: Path to invalidate
         """
-        file_path = file_path.resolve()
-        if file_path in self._cache:
-            del self._cache[file_path]
+        key = sys.intern(str(file_path.resolve()))
+        with self._lock:
+            entry = self._cache.pop(key, None)
+            if entry is not None:
+                self._total_bytes -= self.weight(entry)
 
     def clear(self):
         """Clear entire cache."""
-        self._cache.clear()
-        self._hits = 0
-        self._misses = 0
+        with self._lock:
+            self._cache.clear()
+            self._total_bytes = 0
+            self._hits = 0
+            self._misses = 0
 
     @property
     def stats(self) -> Dict:
@@ -162,15 +225,14 @@ class FileCache:
         total = self._hits + self._misses
         hit_rate = self._hits / total if total > 0 else 0.0
 
-        total_size = sum(e.size for e in self._cache.values())
-
         return {
             'entries': len(self._cache),
             'max_size': self.max_size,
+            'max_bytes': self.max_bytes,
             'hits': self._hits,
             'misses': self._misses,
             'hit_rate': hit_rate,
-            'total_cached_bytes': total_size
+            'total_cached_bytes': self._total_bytes
         }
 
 
@@ -178,7 +240,8 @@ class FileCache:
 _global_cache: Optional[FileCache] = None
 
 
-def get_file_cache(max_size: int = 1000, ttl_seconds: float = 300.0) -> FileCache:
+def get_file_cache(max_size: int = 1000, ttl_seconds: float = 300.0,
+                   max_bytes: int = 64 * 1024 * 1024) -> FileCache:
     """
     Get global file cache instance.
 
@@ -188,6 +251,7 @@ def get_file_cache(max_size: int = 1000, ttl_seconds: float = 300.0) -> FileCach
     Args:
         max_size: Maximum cache size (only used if creating new cache)
         ttl_seconds: TTL for entries (only used if creating new cache)
+        max_bytes: Byte budget for cached content (only used if creating new cache)
 
     Returns:
         FileCache instance
@@ -195,7 +259,8 @@ def get_file_cache(max_size: int = 1000, ttl_seconds: float = 300.0) -> FileCach
     global _global_cache
 
     if _global_cache is None:
-        _global_cache = FileCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        _global_cache = FileCache(max_size=max_size, ttl_seconds=ttl_seconds,
+                                  max_bytes=max_bytes)
 
     return _global_cache
 
@@ -245,26 +310,51 @@ def simhash(text: str, hash_bits: int = 64) -> int:
     Returns:
         Integer representing the SimHash
     """
-    # Tokenize - split on whitespace and normalize
-    tokens = text.lower().split()
+    return _simhash_tokens(text.lower().split(), hash_bits, {})
+
 
+def simhash_batch(texts: List[str], hash_bits: int = 64) -> List[int]:
+    """
+    Compute SimHashes for many texts in one pass.
+
+    Equivalent to ``[simhash(t) for t in texts]`` but shares a token hash
+    table across the whole batch, so each distinct token in the corpus is
+    hashed once instead of once per occurrence per text.
+
+    Args:
+        texts: Texts to hash
+        hash_bits: Number of bits in each hash (default: 64)
+
+    Returns:
+        List of SimHash integers, aligned with texts
+    """
+    token_hashes: Dict[str, int] = {}
+    return [_simhash_tokens(text.lower().split(), hash_bits, token_hashes)
+            for text in texts]
+
+
+def _simhash_tokens(tokens: List[str], hash_bits: int,
+                    token_hashes: Dict[str, int]) -> int:
+    """Build a SimHash fingerprint from tokens, memoizing token hashes."""
     if not tokens:
         return 0
 
     # Initialize bit counters
     v = [0] * hash_bits
 
-    # Process each token
-    for token in tokens:
-        # Hash token to bits
-        h = int(hashlib.md5(token.encode('utf-8')).hexdigest(), 16)
+    # Process each distinct token once, weighted by its frequency
+    for token, count in Counter(tokens).items():
+        h = token_hashes.get(token)
+        if h is None:
+            h = int.from_bytes(hashlib.md5(token.encode('utf-8')).digest(), 'big')
+            token_hashes[token] = h
 
         # Update bit counters
         for i in range(hash_bits):
-            if h & (1 << i):
-                v[i] += 1
+            if (h >> i) & 1:
+                v[i] += count
             else:
-                v[i] -= 1
+                v[i] -= count
 
     # Generate final fingerprint
     fingerprint = 0
@@ -275,6 +365,18 @@ def simhash(text: str, hash_bits: int = 64) -> int:
     return fingerprint
 
 
+# are_similar compares the low 64 bits, matching hamming_distance's default
+_MASK_64 = (1 << 64) - 1
+
+# int.bit_count() is Python 3.10+; bin().count() is the fastest pure fallback
+if hasattr(int, 'bit_count'):
+    def _popcount(x: int) -> int:
+        return x.bit_count()
+else:  # pragma: no cover - Python < 3.10
+    def _popcount(x: int) -> int:
+        return bin(x).count('1')
+
+
 def hamming_distance(hash1: int, hash2: int, bits: int = 64) -> int:
     """
     Compute Hamming distance between two hashes.
@@ -290,14 +392,7 @@ def hamming_distance(hash1: int, hash2: int, bits: int = 64) -> int:
     Returns:
         Number of differing bits
     """
-    xor = hash1 ^ hash2
-    distance = 0
-
-    for i in range(bits):
-        if xor & (1 << i):
-            distance += 1
-
-    return distance
+    return _popcount((hash1 ^ hash2) & ((1 << bits) - 1))
 
 
 def are_similar(hash1: int, hash2: int, max_distance: int = 3) -> bool:
@@ -312,4 +407,7 @@ def are_similar(hash1: int, hash2: int, max_distance: int = 3) -> bool:
     Returns:
         True if hashes are similar
     """
-    return hamming_distance(hash1, hash2) <= max_distance
+    xor = (hash1 ^ hash2) & _MASK_64
+    if xor == 0:
+        return True
+    return _popcount(xor) <= max_distance
@@ -6,6 +6,14 @@ Provides safe git operations for:
 - Committing changes
 - Checking repository status
 
+Async variants (rollback_file_async, git_add_async, git_diff_async) run
+git through asyncio subprocesses so an event loop can overlap many calls.
+
+Batch operations (rollback_files, git_add_files, git_diff_files) pass many
+paths to a single git process per repository instead of spawning one
+process per file. Read-only repository probes (probe_repos) run in
+parallel; mutating operations are serialized per repository.
+
 Error handling features:
 - Detailed error messages for git operations (GIT-04, GIT-06, GIT-07)
 - Timeout handling (GIT-06)
@@ -15,18 +23,48 @@ Security features:
 - Safe path handling to prevent command injection (DG-2026-003)
 """
 
+import asyncio
+import atexit
+import functools
+import os
 import subprocess
 import shutil
 import logging
+import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import cpu_count
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
-from .security import safe_git_path, validate_git_path
+from .security import safe_git_path_after_ddash, validate_git_path
 
 
 # Get module logger
 logger = logging.getLogger(__name__)
 
+# Every git command here passes file paths after a `--` separator, so they
+# cannot be parsed as options and safe_git_path_after_ddash (a plain
+# fspath) is enough. Any new command that passes a path WITHOUT a
+# preceding `--` must use security.safe_git_path instead.
+
+# Max paths passed to one git invocation; keeps command lines well under ARG_MAX
+MAX_PATHS_PER_COMMAND = 1000
+
+# Skip the close-every-fd walk in the child on POSIX. Python opens fds as
+# non-inheritable (PEP 446), so nothing leaks unless explicitly marked
+# inheritable; Windows keeps the default (True). Passed as an explicit
+# keyword at every spawn so type checkers can match the overloads.
+_CLOSE_FDS = sys.platform == 'win32'
+
+# Max concurrent read-only git probes across all callers
+MAX_PROBE_WORKERS = min(8, cpu_count())
+
+T = TypeVar('T')
+
 
 class GitError(Exception):
     """Base exception for git-related errors."""
@@ -58,10 +96,14 @@ class GitRollbackError(GitError):
     pass
 
 
+@functools.lru_cache(maxsize=1)
 def _check_git_installed() -> bool:
     """
     Check if git is installed and accessible.
 
+    The PATH scan runs once per process; git does not appear or
+    disappear mid-run.
+
     Returns:
         True if git is available, False otherwise
     """
@@ -72,16 +114,21 @@ def _run_git_command(
     cmd: List[str],
     cwd: Path,
     timeout: int = 30,
-    operation_name: str = "git operation"
-) -> Tuple[bool, str, str]:
+    operation_name: str = "git operation",
+    discard_stdout: bool = False
+) -> Tuple[bool, bytes, bytes]:
     """
     Run a git command with proper error handling.
 
+    Output is returned as raw bytes; callers that parse it use
+    _run_git_command_text or decode only what they return.
+
     Args:
         cmd: Command list to run
         cwd: Working directory
         timeout: Timeout in seconds
         operation_name: Description of operation for error messages
+        discard_stdout: Send stdout to DEVNULL (stdout is returned as b"")
 
     Returns:
         Tuple of (success, stdout, stderr)
@@ -100,11 +147,12 @@ def _run_git_command(
         result = subprocess.run(
             cmd,
             cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=timeout
+            stdout=subprocess.DEVNULL if discard_stdout else subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=timeout,
+            close_fds=_CLOSE_FDS
         )
-        return result.returncode == 0, result.stdout, result.stderr
+        return result.returncode == 0, result.stdout or b"", result.stderr
     except subprocess.TimeoutExpired as e:
         msg = f"Git {operation_name} timed out after {timeout}s. The repository may be large or network issues occurred."
         logger.error(msg)
@@ -114,7 +162,379 @@ def _run_git_command(
     except PermissionError as e:
         msg = f"Permission denied executing git: {e}"
         logger.error(msg)
-        return False, "", msg
+        return False, b"", msg.encode('utf-8')
+
+
+def _run_git_command_silent(
+    cmd: List[str],
+    cwd: Path,
+    timeout: int = 30,
+    operation_name: str = "git operation"
+) -> Tuple[bool, bytes]:
+    """
+    Run a git command whose stdout is not needed (add, checkout, commit).
+
+    Returns:
+        Tuple of (success, stderr)
+    """
+    success, _, stderr = _run_git_command(
+        cmd, cwd, timeout, operation_name, discard_stdout=True
+    )
+    return success, stderr
+
+
+def _decode(data: bytes) -> str:
+    """Decode git output, replacing undecodable bytes."""
+    return data.decode('utf-8', errors='replace')
+
+
+def _run_git_command_text(
+    cmd: List[str],
+    cwd: Path,
+    timeout: int = 30,
+    operation_name: str = "git operation"
+) -> Tuple[bool, str, str]:
+    """Run a git command and return (success, stdout, stderr) as strings."""
+    success, stdout, stderr = _run_git_command(cmd, cwd, timeout, operation_name)
+    return success, _decode(stdout), _decode(stderr)
+
+
+def _chunked(items: Sequence[T], size: int = MAX_PATHS_PER_COMMAND) -> Iterator[Sequence[T]]:
+    """Yield successive slices of at most size items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _canonical_path(file_path: Path) -> str:
+    """
+    Absolute path with the parent directory's symlinks resolved.
+
+    The file itself is not resolved so tracked symlinks keep their own path,
+    while the directory part matches what `git rev-parse --show-toplevel` reports.
+    """
+    abs_path = os.path.abspath(file_path)
+    return os.path.join(os.path.realpath(os.path.dirname(abs_path)), os.path.basename(abs_path))
+
+
+def _repo_root(path: Path) -> Optional[Path]:
+    """
+    Return the top-level directory of the git repository containing path.
+
+    Args:
+        path: File or directory inside the repository
+
+    Returns:
+        Repository root, or None if path is not inside a git work tree
+    """
+    cwd = path if path.is_dir() else path.parent
+    return _repo_root_for_dir(os.path.abspath(cwd))
+
+
+@functools.lru_cache(maxsize=256)
+def _repo_root_for_dir(cwd: str) -> Optional[Path]:
+    """Cached `git rev-parse --show-toplevel` for an absolute directory."""
+    success, stdout, stderr = _run_git_command_text(
+        ['git', 'rev-parse', '--show-toplevel'],
+        cwd=Path(cwd),
+        timeout=5,
+        operation_name="repo root lookup"
+    )
+    if not success or not stdout.strip():
+        return None
+    return Path(stdout.strip())
+
+
+# Cached `git status --porcelain=v2 --branch -uno` output keyed by working
+# directory. Only populated inside status_session(); outside a session every
+# probe runs git, so conflicts created by other processes are never missed.
+# Also dropped whenever this module stages, commits or rolls back files.
+_status_cache: Dict[str, str] = {}
+_status_sessions = 0
+_status_lock = threading.Lock()
+
+
+@contextmanager
+def status_session() -> Iterator[None]:
+    """
+    Reuse repository status probes for the duration of one healing session.
+
+    Repeated check_merge_conflict calls inside the block share one
+    `git status` per repository. The cache is cleared when the outermost
+    session exits. git_commit always re-reads status regardless.
+    """
+    global _status_sessions
+    with _status_lock:
+        _status_sessions += 1
+    try:
+        yield
+    finally:
+        with _status_lock:
+            _status_sessions -= 1
+            if not _status_sessions:
+                _status_cache.clear()
+
+
+def _repo_status(cwd: Path, fresh: bool = False) -> str:
+    """
+    Return porcelain v2 status for the repository containing cwd.
+
+    Untracked files are skipped (-uno); only tracked and unmerged entries
+    are reported, which avoids walking the whole work tree. The result is
+    cached only inside status_session(), and never when fresh is True.
+    """
+    key = os.path.abspath(cwd)
+    if not fresh:
+        with _status_lock:
+            cached = _status_cache.get(key)
+        if cached is not None:
+            return cached
+
+    success, stdout, stderr = _run_git_command_text(
+        ['git', 'status', '--porcelain=v2', '--branch', '-uno'],
+        cwd=cwd,
+        timeout=10,
+        operation_name="status check"
+    )
+    if success:
+        with _status_lock:
+            if _status_sessions:
+                _status_cache[key] = stdout
+    return stdout
+
+
+def _invalidate_status_cache() -> None:
+    """Forget cached status after a mutating git operation."""
+    with _status_lock:
+        _status_cache.clear()
+
+
+def _has_unmerged_entries(status: str) -> bool:
+    """True if porcelain v2 status lists any unmerged ('u ') entries."""
+    return any(line.startswith('u ') for line in status.splitlines())
+
+
+# One lock per repository; mutating git operations (add, checkout, commit)
+# hold it so they never race on the index. Reentrant so git_commit can
+# call git_add_files while holding it.
+_repo_locks: Dict[str, threading.RLock] = {}
+_repo_locks_guard = threading.Lock()
+
+
+def _repo_lock(repo_root: Path) -> threading.RLock:
+    """Return the lock serializing mutating git operations in repo_root."""
+    key = os.path.abspath(repo_root)
+    with _repo_locks_guard:
+        lock = _repo_locks.get(key)
+        if lock is None:
+            lock = _repo_locks[key] = threading.RLock()
+        return lock
+
+
+@dataclass
+class RepoInfo:
+    """Result of probing a path for its git repository."""
+    is_repo: bool
+    root: Optional[Path] = None
+
+
+_probe_semaphore = threading.BoundedSemaphore(MAX_PROBE_WORKERS)
+
+
+def _probe_repo(directory: str) -> RepoInfo:
+    """Look up the repository for one directory, bounded by the probe semaphore."""
+    with _probe_semaphore:
+        try:
+            root = _repo_root_for_dir(directory)
+        except GitError:
+            root = None
+    return RepoInfo(is_repo=root is not None, root=root)
+
+
+def probe_repos(paths: Sequence[Path]) -> Dict[Path, RepoInfo]:
+    """
+    Find the git repository for many paths in parallel.
+
+    Probes are read-only (`git rev-parse --show-toplevel`), so they run
+    concurrently on a thread pool; each distinct directory is probed once
+    and the result also warms the repo-root cache used by the batch helpers.
+
+    Args:
+        paths: Files or directories to probe
+
+    Returns:
+        Mapping of each input path to its RepoInfo
+    """
+    if not paths:
+        return {}
+    if not _check_git_installed():
+        return {p: RepoInfo(is_repo=False) for p in paths}
+
+    dirs = {p: os.path.abspath(p if p.is_dir() else p.parent) for p in paths}
+    unique_dirs = list(dict.fromkeys(dirs.values()))
+
+    workers = min(MAX_PROBE_WORKERS, len(unique_dirs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        infos = dict(zip(unique_dirs, executor.map(_probe_repo, unique_dirs)))
+
+    return {p: infos[d] for p, d in dirs.items()}
+
+
+def _group_by_repo(files: Sequence[Path]) -> Dict[Path, List[Tuple[str, Path]]]:
+    """
+    Group files by repository root.
+
+    Each entry pairs the root-relative (posix) git path with the original
+    input path. Files outside any git repository are logged and omitted.
+    """
+    groups: Dict[Path, List[Tuple[str, Path]]] = {}
+    roots_by_dir: Dict[str, Optional[Path]] = {}
+
+    for file_path in files:
+        canonical = _canonical_path(file_path)
+        parent = os.path.dirname(canonical)
+        if parent not in roots_by_dir:
+            roots_by_dir[parent] = _repo_root_for_dir(parent)
+        root = roots_by_dir[parent]
+        if root is None:
+            logger.warning(f"Not inside a git repository: {file_path}")
+            continue
+        rel = Path(os.path.relpath(canonical, os.path.realpath(root))).as_posix()
+        groups.setdefault(root, []).append((rel, file_path))
+
+    return groups
+
+
+class _GitCatFile:
+    """
+    Long-running `git cat-file --batch-check` process for one repository.
+
+    Answers "is this path committed at HEAD?" by writing `HEAD:<path>` lines
+    to the process instead of spawning a new git per query, so process
+    startup and pack-index loading are paid once per repository.
+    """
+
+    def __init__(self, repo_root: Path):
+        self.repo_root = repo_root
+        self._lock = threading.Lock()
+        self._proc = subprocess.Popen(
+            ['git', 'cat-file', '--batch-check=%(objecttype) %(objectname)'],
+            cwd=repo_root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            close_fds=_CLOSE_FDS
+        )
+
+    def object_type(self, rel_path: str) -> Optional[str]:
+        """
+        Return the object type of HEAD:<rel_path>, or None if it is missing.
+
+        Raises:
+            GitError: If the cat-file process has exited
+        """
+        with self._lock:
+            stdin, stdout = self._proc.stdin, self._proc.stdout
+            if self._proc.poll() is not None or stdin is None or stdout is None:
+                raise GitError(f"git cat-file exited unexpectedly in {self.repo_root}")
+            stdin.write(f"HEAD:{rel_path}\n")
+            stdin.flush()
+            line = stdout.readline()
+        if not line:
+            raise GitError(f"git cat-file exited unexpectedly in {self.repo_root}")
+        kind, _, rest = line.rstrip('\n').partition(' ')
+        return None if rest == 'missing' or kind == 'missing' else kind
+
+    def is_tracked(self, rel_path: str) -> bool:
+        """True if rel_path (relative to the repo root, posix) is a file at HEAD."""
+        return self.object_type(rel_path) == 'blob'
+
+    def close(self) -> None:
+        """Close stdin so git exits, then reap the process."""
+        try:
+            if self._proc.stdin:
+                self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+
+
+# One cat-file process per repository root, closed at interpreter exit
+_cat_file_procs: Dict[Path, _GitCatFile] = {}
+_cat_file_lock = threading.Lock()
+
+
+def _get_cat_file(repo_root: Path) -> _GitCatFile:
+    """Return the shared cat-file process for repo_root, starting it if needed."""
+    with _cat_file_lock:
+        proc = _cat_file_procs.get(repo_root)
+        if proc is None or proc._proc.poll() is not None:
+            if not _check_git_installed():
+                raise GitNotInstalledError(
+                    "Git is not installed or not in PATH. "
+                    "Install git: https://git-scm.com/downloads"
+                )
+            proc = _GitCatFile(repo_root)
+            _cat_file_procs[repo_root] = proc
+        return proc
+
+
+@atexit.register
+def _close_cat_file_procs() -> None:
+    """Shut down all persistent cat-file processes."""
+    with _cat_file_lock:
+        for proc in _cat_file_procs.values():
+            proc.close()
+        _cat_file_procs.clear()
+
+
+def _is_tracked_at_head(repo_root: Path, rel_path: str) -> bool:
+    """Check tracked status through the repository's persistent cat-file process."""
+    if '\n' in rel_path:
+        # The batch protocol is line-based; fall back to a one-off ls-files
+        success, stdout, stderr = _run_git_command_text(
+            ['git', 'ls-files', '--error-unmatch', '--', safe_git_path_after_ddash(rel_path)],
+            cwd=repo_root,
+            timeout=10,
+            operation_name="check tracked status"
+        )
+        return success
+    return _get_cat_file(repo_root).is_tracked(rel_path)
+
+
+def _rollback_target(file_path: Path) -> Optional[Tuple[Path, str]]:
+    """
+    Validate a rollback request and locate the file in its repository.
+
+    Returns:
+        (repo_root, root-relative posix path), or None if the file does not
+        exist or is not a valid git path (both logged)
+
+    Raises:
+        GitRollbackError: If file is untracked (GIT-07)
+    """
+    if not file_path.exists():
+        logger.warning(f"Cannot rollback non-existent file: {file_path}")
+        return None
+
+    # Security: Validate git path
+    is_valid, error = validate_git_path(file_path)
+    if not is_valid:
+        logger.warning(f"Invalid git path: {error}")
+        return None
+
+    # Check if file is tracked (committed at HEAD)
+    canonical = _canonical_path(file_path)
+    repo_root = _repo_root_for_dir(os.path.dirname(canonical))
+    if repo_root is not None:
+        rel_path = Path(os.path.relpath(canonical, os.path.realpath(repo_root))).as_posix()
+        if _is_tracked_at_head(repo_root, rel_path):
+            return repo_root, rel_path
+    msg = f"Cannot rollback untracked file: {file_path}. Add it to git first or delete manually."
+    logger.warning(msg)
+    raise GitRollbackError(msg)
 
 
 def rollback_file(file_path: Path) -> bool:
@@ -126,8 +546,8 @@ def rollback_file(file_path: Path) -> bool:
     2. File is tracked by git
     3. Git is available
 
-    Security: Uses safe_git_path to prevent command injection via
-    filenames starting with '-'.
+    Security: Paths are passed after `--` so filenames starting with '-'
+    cannot be parsed as options.
 
     Args:
         file_path: Path to file to rollback
@@ -140,42 +560,24 @@ def rollback_file(file_path: Path) -> bool:
         GitTimeoutError: If operation times out (GIT-06)
         GitRollbackError: If file is untracked (GIT-07)
     """
-    if not file_path.exists():
-        logger.warning(f"Cannot rollback non-existent file: {file_path}")
-        return False
-
-    # Security: Validate git path
-    is_valid, error = validate_git_path(file_path)
-    if not is_valid:
-        logger.warning(f"Invalid git path: {error}")
+    target = _rollback_target(file_path)
+    if target is None:
         return False
-
-    # Check if file is tracked
-    try:
-        success, stdout, stderr = _run_git_command(
-            ['git', 'ls-files', '--error-unmatch', '--', safe_git_path(file_path)],
-            cwd=file_path.parent,
-            timeout=10,
-            operation_name="check tracked status"
-        )
-        if not success:
-            msg = f"Cannot rollback untracked file: {file_path}. Add it to git first or delete manually."
-            logger.warning(msg)
-            raise GitRollbackError(msg)
-    except GitError:
-        raise
+    repo_root, rel_path = target
 
     # Perform rollback
     try:
-        success, stdout, stderr = _run_git_command(
-            ['git', 'checkout', 'HEAD', '--', safe_git_path(file_path)],
-            cwd=file_path.parent,
-            timeout=10,
-            operation_name="checkout"
-        )
+        with _repo_lock(repo_root):
+            success, stderr = _run_git_command_silent(
+                ['git', 'checkout', 'HEAD', '--', safe_git_path_after_ddash(rel_path)],
+                cwd=repo_root,
+                timeout=10,
+                operation_name="checkout"
+            )
+            _invalidate_status_cache()
 
         if not success:
-            logger.error(f"Git rollback failed for {file_path}: {stderr}")
+            logger.error(f"Git rollback failed for {file_path}: {_decode(stderr)}")
 
         return success
     except GitError:
@@ -186,7 +588,7 @@ def git_add(file_path: Path) -> bool:
     """
     Stage a file for commit.
 
-    Security: Uses safe_git_path to prevent command injection.
+    Security: Paths are passed after `--` to prevent option injection.
 
     Args:
         file_path: Path to file to stage
@@ -209,28 +611,207 @@ def git_add(file_path: Path) -> bool:
         return False
 
     try:
-        success, stdout, stderr = _run_git_command(
-            ['git', 'add', '--', safe_git_path(file_path)],
-            cwd=file_path.parent,
-            timeout=10,
-            operation_name="add"
-        )
+        with _repo_lock(_repo_root_for_dir(os.path.abspath(file_path.parent)) or file_path.parent):
+            success, stderr = _run_git_command_silent(
+                ['git', 'add', '--', safe_git_path_after_ddash(file_path)],
+                cwd=file_path.parent,
+                timeout=10,
+                operation_name="add"
+            )
+            _invalidate_status_cache()
 
         if not success:
-            logger.error(f"Failed to stage {file_path}: {stderr}")
+            logger.error(f"Failed to stage {file_path}: {_decode(stderr)}")
 
         return success
     except GitError:
         raise
 
 
+def _validate_batch(files: Sequence[Path], action: str) -> bool:
+    """Check that every file exists and is a safe git path, logging failures."""
+    ok = True
+    for file_path in files:
+        if not file_path.exists():
+            logger.warning(f"Cannot {action} non-existent file: {file_path}")
+            ok = False
+            continue
+        is_valid, error = validate_git_path(file_path)
+        if not is_valid:
+            logger.warning(f"Invalid git path for {action}: {error}")
+            ok = False
+    return ok
+
+
+def rollback_files(files: Sequence[Path]) -> Dict[Path, bool]:
+    """
+    Rollback many files to HEAD with one ls-files and one checkout per repository.
+
+    Unlike rollback_file, untracked files do not raise; they are logged and
+    reported as False so the remaining files can still be restored.
+
+    Args:
+        files: Paths to rollback
+
+    Returns:
+        Mapping of each input path to whether it was rolled back
+
+    Raises:
+        GitNotInstalledError: If git is not installed (GIT-04)
+        GitTimeoutError: If operation times out (GIT-06)
+    """
+    results: Dict[Path, bool] = dict.fromkeys(files, False)
+    candidates = [f for f in files if _validate_batch([f], "rollback")]
+
+    for root, entries in _group_by_repo(candidates).items():
+        for chunk in _chunked(entries):
+            git_paths = [safe_git_path_after_ddash(rel) for rel, _ in chunk]
+
+            # One ls-files call finds which of the paths are tracked
+            success, stdout, stderr = _run_git_command_text(
+                ['git', 'ls-files', '-z', '--', *git_paths],
+                cwd=root,
+                timeout=30,
+                operation_name="check tracked status"
+            )
+            tracked = set(stdout.split('\0')) if success else set()
+
+            to_restore = []
+            for (rel, file_path), git_path in zip(chunk, git_paths):
+                if rel in tracked:
+                    to_restore.append((git_path, file_path))
+                else:
+                    logger.warning(
+                        f"Cannot rollback untracked file: {file_path}. "
+                        "Add it to git first or delete manually."
+                    )
+
+            if not to_restore:
+                continue
+
+            with _repo_lock(root):
+                success, checkout_stderr = _run_git_command_silent(
+                    ['git', 'checkout', 'HEAD', '--', *(git_path for git_path, _ in to_restore)],
+                    cwd=root,
+                    timeout=30,
+                    operation_name="checkout"
+                )
+                _invalidate_status_cache()
+            if not success:
+                logger.error(f"Git rollback failed in {root}: {_decode(checkout_stderr)}")
+                continue
+            for _, file_path in to_restore:
+                results[file_path] = True
+
+    return results
+
+
+def git_add_files(files: Sequence[Path]) -> bool:
+    """
+    Stage many files with one `git add` per repository.
+
+    Args:
+        files: Paths to stage
+
+    Returns:
+        True if every file was staged (nothing is staged if any path is invalid)
+
+    Raises:
+        GitNotInstalledError: If git is not installed (GIT-04)
+        GitTimeoutError: If operation times out (GIT-06)
+    """
+    if not files:
+        return True
+    if not _validate_batch(files, "stage"):
+        return False
+
+    groups = _group_by_repo(files)
+    if sum(len(entries) for entries in groups.values()) != len(files):
+        return False
+
+    for root, entries in groups.items():
+        with _repo_lock(root):
+            for chunk in _chunked(entries):
+                success, stderr = _run_git_command_silent(
+                    ['git', 'add', '--', *(safe_git_path_after_ddash(rel) for rel, _ in chunk)],
+                    cwd=root,
+                    timeout=30,
+                    operation_name="add"
+                )
+                _invalidate_status_cache()
+                if not success:
+                    logger.error(f"Failed to stage files in {root}: {_decode(stderr)}")
+                    return False
+
+    return True
+
+
+def git_diff_files(files: Sequence[Path], staged: bool = False) -> Optional[str]:
+    """
+    Get the combined git diff for many files with one `git diff` per repository.
+
+    Args:
+        files: Paths to diff
+        staged: If True, get diff of staged changes (--cached)
+
+    Returns:
+        Concatenated diff output, or None if any diff failed
+
+    Raises:
+        GitNotInstalledError: If git is not installed (GIT-04)
+        GitTimeoutError: If operation times out (GIT-06)
+    """
+    for file_path in files:
+        is_valid, error = validate_git_path(file_path)
+        if not is_valid:
+            logger.warning(f"Invalid git path for diff: {error}")
+            return None
+
+    base_cmd = ['git', 'diff']
+    if staged:
+        base_cmd.append('--cached')
+
+    output = []
+    for root, entries in _group_by_repo(files).items():
+        for chunk in _chunked(entries):
+            success, stdout, stderr = _run_git_command(
+                [*base_cmd, '--', *(safe_git_path_after_ddash(rel) for rel, _ in chunk)],
+                cwd=root,
+                timeout=30,
+                operation_name="diff"
+            )
+            if not success:
+                logger.warning(f"Git diff failed in {root}: {_decode(stderr)}")
+                return None
+            output.append(stdout)
+
+    return _decode(b''.join(output))
+
+
+def _commit_only(message: str, root: Path, entries: List[Tuple[str, Path]]) -> Tuple[bool, bytes]:
+    """Run `git commit --only` for root-relative paths in one repository."""
+    success, stderr = _run_git_command_silent(
+        ['git', 'commit', '--only', '-m', message, '--',
+         *(safe_git_path_after_ddash(rel) for rel, _ in entries)],
+        cwd=root,
+        timeout=30,
+        operation_name="commit"
+    )
+    _invalidate_status_cache()
+    return success, stderr
+
+
 def git_commit(message: str, files: List[Path], repo_root: Optional[Path] = None) -> bool:
     """
     Git commit with standard format.
 
+    Only the given files are committed (`git commit --only`), in a single
+    git process when they are already tracked; new files are staged first.
+    Files outside repo_root's repository are staged but not committed.
+
     Args:
         message: Commit message (should follow conventional commits format)
-        files: List of files to commit (will be staged first)
+        files: List of files to commit
         repo_root: Repository root (uses first file's parent if not provided)
 
     Returns:
@@ -253,47 +834,62 @@ def git_commit(message: str, files: List[Path], repo_root: Optional[Path] = None
 
     cwd = repo_root or files[0].parent
 
-    # Check for merge conflict first (GIT-03)
-    try:
-        success, stdout, stderr = _run_git_command(
-            ['git', 'status', '--porcelain'],
-            cwd=cwd,
-            timeout=10,
-            operation_name="status check"
-        )
-        if 'UU ' in stdout or 'AA ' in stdout or 'DD ' in stdout:
-            msg = "Cannot commit: merge conflict in progress. Resolve conflicts first."
-            logger.error(msg)
-            raise GitMergeConflictError(msg)
-    except GitError:
-        raise
+    with _repo_lock(_repo_root(cwd) or cwd):
+        # Check for merge conflict first (GIT-03); always a fresh status,
+        # since a conflict may have been created outside this module
+        try:
+            if _has_unmerged_entries(_repo_status(cwd, fresh=True)):
+                msg = "Cannot commit: merge conflict in progress. Resolve conflicts first."
+                logger.error(msg)
+                raise GitMergeConflictError(msg)
+        except GitError:
+            raise
 
-    try:
-        # Stage all files first
-        for file_path in files:
-            if not git_add(file_path):
+        try:
+            if not _validate_batch(files, "stage"):
+                return False
+            groups = _group_by_repo(files)
+            if sum(len(entries) for entries in groups.values()) != len(files):
                 return False
 
-        # Commit
-        success, stdout, stderr = _run_git_command(
-            ['git', 'commit', '-m', message],
-            cwd=cwd,
-            timeout=30,
-            operation_name="commit"
-        )
-
-        if not success:
-            # Check for hook rejection (GIT-08)
-            if 'hook' in stderr.lower() or 'pre-commit' in stderr.lower():
-                msg = f"Commit rejected by git hook: {stderr}"
-                logger.error(msg)
-                raise GitHookRejectionError(msg)
-
-            logger.error(f"Git commit failed: {stderr}")
+            commit_root = _repo_root(cwd)
+            entries = groups.pop(commit_root, []) if commit_root is not None else []
+            others = [file_path for other in groups.values() for _, file_path in other]
+            if others and not git_add_files(others):
+                return False
 
-        return success
-    except GitError:
-        raise
+            if commit_root is not None and entries and len(entries) <= MAX_PATHS_PER_COMMAND:
+                # Stage and commit the paths in one process
+                success, stderr = _commit_only(message, commit_root, entries)
+                if not success and b'did not match any file' in stderr:
+                    # New files are unknown to git until staged
+                    if not git_add_files([file_path for _, file_path in entries]):
+                        return False
+                    success, stderr = _commit_only(message, commit_root, entries)
+            else:
+                # Too many paths for one command line: stage, then commit the index
+                if entries and not git_add_files([file_path for _, file_path in entries]):
+                    return False
+                success, stderr = _run_git_command_silent(
+                    ['git', 'commit', '-m', message],
+                    cwd=cwd,
+                    timeout=30,
+                    operation_name="commit"
+                )
+                _invalidate_status_cache()
+
+            if not success:
+                # Check for hook rejection (GIT-08)
+                if b'hook' in stderr.lower() or b'pre-commit' in stderr.lower():
+                    msg = f"Commit rejected by git hook: {_decode(stderr)}"
+                    logger.error(msg)
+                    raise GitHookRejectionError(msg)
+
+                logger.error(f"Git commit failed: {_decode(stderr)}")
+
+            return success
+        except GitError:
+            raise
 
 
 def git_status_clean(repo_root: Path) -> bool:
@@ -326,7 +922,7 @@ def git_diff(file_path: Path, staged: bool = False) -> Optional[str]:
     """
     Get git diff for a file.
 
-    Security: Uses safe_git_path to prevent command injection.
+    Security: Paths are passed after `--` to prevent option injection.
 
     Args:
         file_path: Path to file
@@ -349,7 +945,7 @@ def git_diff(file_path: Path, staged: bool = False) -> Optional[str]:
         cmd = ['git', 'diff']
         if staged:
             cmd.append('--cached')
-        cmd.extend(['--', safe_git_path(file_path)])
+        cmd.extend(['--', safe_git_path_after_ddash(file_path)])
 
         success, stdout, stderr = _run_git_command(
             cmd,
@@ -359,9 +955,9 @@ def git_diff(file_path: Path, staged: bool = False) -> Optional[str]:
         )
 
         if success:
-            return stdout
+            return _decode(stdout)
 
-        logger.warning(f"Git diff failed for {file_path}: {stderr}")
+        logger.warning(f"Git diff failed for {file_path}: {_decode(stderr)}")
         return None
     except GitError:
         raise
@@ -387,7 +983,7 @@ def is_git_repo(path: Path) -> bool:
             timeout=5,
             operation_name="repo check"
         )
-        return success and stdout.strip() == 'true'
+        return success and stdout.strip() == b'true'
     except GitError:
         return False
 
@@ -399,11 +995,203 @@ def check_merge_conflict(repo_root: Path) -> bool:
     Args:
         repo_root: Path to repository root
 
+    Uses porcelain status rather than stat'ing .git/MERGE_HEAD, so it
+    needs no gitdir resolution and also works in worktrees, where .git is
+    a file pointing at the real git directory. The status is only reused
+    between calls inside status_session().
+
     Returns:
-        True if merge conflict exists
+        True if merge conflict exists (unmerged paths in the index)
     """
     try:
-        merge_head = repo_root / '.git' / 'MERGE_HEAD'
-        return merge_head.exists()
-    except Exception:
+        return _has_unmerged_entries(_repo_status(repo_root))
+    except GitError:
         return False
+
+
+# ==============================================================================
+# Async variants
+# ==============================================================================
+
+# Max git processes in flight from the async API, per event loop
+MAX_ASYNC_GIT_PROCESSES = 8
+
+# Per-event-loop semaphores and per-repository locks. asyncio primitives
+# must not be shared across loops; weak keys drop them with their loop.
+_async_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+_async_repo_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]" = weakref.WeakKeyDictionary()
+
+
+def _async_semaphore() -> asyncio.Semaphore:
+    """Semaphore capping concurrent git processes for the running loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _async_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _async_semaphores[loop] = asyncio.Semaphore(MAX_ASYNC_GIT_PROCESSES)
+    return semaphore
+
+
+def _async_repo_lock(repo_root: Path) -> asyncio.Lock:
+    """Lock serializing async mutating operations in repo_root for the running loop."""
+    locks = _async_repo_locks.setdefault(asyncio.get_running_loop(), {})
+    key = os.path.abspath(repo_root)
+    lock = locks.get(key)
+    if lock is None:
+        lock = locks[key] = asyncio.Lock()
+    return lock
+
+
+async def _run_git_command_async(
+    cmd: List[str],
+    cwd: Path,
+    timeout: int = 30,
+    operation_name: str = "git operation"
+) -> Tuple[bool, bytes, bytes]:
+    """
+    Async counterpart of _run_git_command.
+
+    Returns:
+        Tuple of (success, stdout, stderr)
+
+    Raises:
+        GitNotInstalledError: If git is not installed (GIT-04)
+        GitTimeoutError: If command times out (GIT-06)
+    """
+    if not _check_git_installed():
+        raise GitNotInstalledError(
+            "Git is not installed or not in PATH. "
+            "Install git: https://git-scm.com/downloads"
+        )
+
+    async with _async_semaphore():
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                close_fds=_CLOSE_FDS
+            )
+        except FileNotFoundError as e:
+            raise GitNotInstalledError(f"Git command not found: {e}") from e
+        except PermissionError as e:
+            msg = f"Permission denied executing git: {e}"
+            logger.error(msg)
+            return False, b"", msg.encode('utf-8')
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError as e:
+            proc.kill()
+            await proc.wait()
+            msg = f"Git {operation_name} timed out after {timeout}s. The repository may be large or network issues occurred."
+            logger.error(msg)
+            raise GitTimeoutError(msg) from e
+
+    return proc.returncode == 0, stdout, stderr
+
+
+async def rollback_file_async(file_path: Path) -> bool:
+    """
+    Async counterpart of rollback_file.
+
+    Rollbacks in the same repository are serialized (they share the index);
+    rollbacks in different repositories run concurrently.
+
+    Raises:
+        GitNotInstalledError: If git is not installed (GIT-04)
+        GitTimeoutError: If operation times out (GIT-06)
+        GitRollbackError: If file is untracked (GIT-07)
+    """
+    # Repo-root lookup and tracked check are cached / persistent-process
+    # queries; run them off the event loop anyway since they can block
+    loop = asyncio.get_running_loop()
+    target = await loop.run_in_executor(None, _rollback_target, file_path)
+    if target is None:
+        return False
+    repo_root, rel_path = target
+
+    async with _async_repo_lock(repo_root):
+        success, stdout, stderr = await _run_git_command_async(
+            ['git', 'checkout', 'HEAD', '--', safe_git_path_after_ddash(rel_path)],
+            cwd=repo_root,
+            timeout=10,
+            operation_name="checkout"
+        )
+        _invalidate_status_cache()
+
+    if not success:
+        logger.error(f"Git rollback failed for {file_path}: {_decode(stderr)}")
+
+    return success
+
+
+async def git_add_async(file_path: Path) -> bool:
+    """
+    Async counterpart of git_add.
+
+    Raises:
+        GitNotInstalledError: If git is not installed (GIT-04)
+        GitTimeoutError: If operation times out (GIT-06)
+    """
+    if not file_path.exists():
+        logger.warning(f"Cannot stage non-existent file: {file_path}")
+        return False
+
+    # Security: Validate git path
+    is_valid, error = validate_git_path(file_path)
+    if not is_valid:
+        logger.warning(f"Invalid git path for staging: {error}")
+        return False
+
+    loop = asyncio.get_running_loop()
+    repo_root = await loop.run_in_executor(
+        None, _repo_root_for_dir, os.path.abspath(file_path.parent)
+    )
+
+    async with _async_repo_lock(repo_root or file_path.parent):
+        success, stdout, stderr = await _run_git_command_async(
+            ['git', 'add', '--', safe_git_path_after_ddash(file_path.name)],
+            cwd=file_path.parent,
+            timeout=10,
+            operation_name="add"
+        )
+        _invalidate_status_cache()
+
+    if not success:
+        logger.error(f"Failed to stage {file_path}: {_decode(stderr)}")
+
+    return success
+
+
+async def git_diff_async(file_path: Path, staged: bool = False) -> Optional[str]:
+    """
+    Async counterpart of git_diff (read-only, so calls run concurrently).
+
+    Raises:
+        GitNotInstalledError: If git is not installed (GIT-04)
+        GitTimeoutError: If operation times out (GIT-06)
+    """
+    # Security: Validate git path
+    is_valid, error = validate_git_path(file_path)
+    if not is_valid:
+        logger.warning(f"Invalid git path for diff: {error}")
+        return None
+
+    cmd = ['git', 'diff']
+    if staged:
+        cmd.append('--cached')
+    cmd.extend(['--', safe_git_path_after_ddash(file_path.name)])
+
+    success, stdout, stderr = await _run_git_command_async(
+        cmd,
+        cwd=file_path.parent,
+        timeout=10,
+        operation_name="diff"
+    )
+
+    if success:
+        return _decode(stdout)
+
+    logger.warning(f"Git diff failed for {file_path}: {_decode(stderr)}")
+    return None
@@ -6,6 +6,8 @@ Provides structured logging with:
 - File output (JSON format for parsing)
 - Context tracking (healer name, file being processed)
 - Error categorization
+- Background output: the calling thread only enqueues records; formatting
+  and writes happen on a listener thread
 
 Usage:
     from guardian.core.logger import setup_logger, get_logger
@@ -18,14 +20,28 @@ Usage:
     logger.error("File not found", extra={"file": "missing.md", "error_code": "FS-06"})
 """
 
+import atexit
+import copy
+import functools
 import logging
+import logging.handlers
 import json
+import os
+import queue
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, asdict
 
+# Optional fast JSON encoder for the log file
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # Error codes from the audit
 ERROR_CODES = {
@@ -65,6 +81,9 @@ ERROR_CODES = {
     "CFG-05": "Invalid regex in config",
 }
 
+# Console suffix for each known error code, e.g. "[FS-06: File deleted during processing]"
+_ERR_BRACKET = {code: f"[{code}: {desc}]" for code, desc in ERROR_CODES.items()}
+
 
 @dataclass
 class LogContext:
@@ -87,10 +106,24 @@ class ContextFilter(logging.Filter):
         super().__init__()
         self.context = default_context or LogContext()
 
+    @property
+    def context(self) -> LogContext:
+        """Default context applied to records."""
+        return self._context
+
+    @context.setter
+    def context(self, ctx: LogContext) -> None:
+        self.set_context(ctx)
+
+    def set_context(self, ctx: LogContext) -> None:
+        """Replace the default context (its dict form is computed once here)."""
+        self._context = ctx
+        self._context_dict = ctx.to_dict()
+
     def filter(self, record: logging.LogRecord) -> bool:
         """Add context attributes to record."""
         # Add context from filter
-        for key, value in self.context.to_dict().items():
+        for key, value in self._context_dict.items():
             if not hasattr(record, key):
                 setattr(record, key, value)
 
@@ -102,17 +135,51 @@ class ContextFilter(logging.Filter):
         return True
 
 
-class ColoredFormatter(logging.Formatter):
-    """Colorized console formatter."""
+def _record_message(record: logging.LogRecord) -> str:
+    """
+    record.getMessage() without the %-formatting call when there are no args.
+
+    Records from HealerLogger (and everything leaving the queue handler)
+    carry a plain pre-built string.
+    """
+    msg = record.msg
+    if not record.args and type(msg) is str:
+        return msg
+    return record.getMessage()
+
+
+def _format_context(record: logging.LogRecord) -> str:
+    """Render " [healer] (file:line)" for a record, or '' without context."""
+    # ContextFilter defaults these to None; getattr covers records that
+    # reached the handlers from child loggers without passing the filter
+    context = ''
+    healer_name = getattr(record, 'healer_name', None)
+    if healer_name:
+        context = f" [{healer_name}]"
+    file_path = getattr(record, 'file_path', None)
+    if file_path:
+        line_number = getattr(record, 'line_number', None)
+        if line_number:
+            context += f" ({file_path}:{line_number})"
+        else:
+            context += f" ({file_path})"
+    return context
+
+
+def _format_error_code(record: logging.LogRecord) -> str:
+    """Render " [CODE: description]" for a record, or '' without an error code."""
+    error_code = getattr(record, 'error_code', None)
+    if not error_code:
+        return ''
+    bracket = _ERR_BRACKET.get(error_code)
+    if bracket is None:
+        # Codes registered after import still get their description
+        bracket = f"[{error_code}: {ERROR_CODES.get(error_code, 'Unknown error')}]"
+    return f" {bracket}"
 
-    COLORS = {
-        'DEBUG': '\033[36m',     # Cyan
-        'INFO': '\033[32m',      # Green
-        'WARNING': '\033[33m',   # Yellow
-        'ERROR': '\033[31m',     # Red
-        'CRITICAL': '\033[35m',  # Magenta
-        'RESET': '\033[0m',
-    }
+
+class PlainFormatter(logging.Formatter):
+    """Console formatter without ANSI colors (used when stdout is not a TTY)."""
 
     ICONS = {
         'DEBUG': '🔍',
@@ -122,61 +189,77 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '🚨',
     }
 
-    def __init__(self, use_colors: bool = True, use_icons: bool = True):
+    def __init__(self, use_icons: bool = True):
         super().__init__()
-        self.use_colors = use_colors and sys.stdout.isatty()
         self.use_icons = use_icons
+        # Icon + level name, built once per level
+        self._level_prefix = {level: self._build_prefix(level) for level in self.ICONS}
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record with colors and icons."""
-        level = record.levelname
+    def _level_str(self, level: str) -> str:
+        """Level name as shown in the prefix."""
+        return level
+
+    def _build_prefix(self, level: str) -> str:
+        """Build the icon and level-name prefix for one level."""
         icon = self.ICONS.get(level, '') if self.use_icons else ''
+        level_str = self._level_str(level)
+        return f"{icon} {level_str}" if icon else level_str
 
-        # Build message
-        parts = []
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record with icon, context and error code."""
+        prefix = self._level_prefix.get(record.levelname)
+        if prefix is None:
+            prefix = self._build_prefix(record.levelname)
+        return f"{prefix}{_format_context(record)} {_record_message(record)}{_format_error_code(record)}"
 
-        if icon:
-            parts.append(icon)
 
-        if self.use_colors:
-            color = self.COLORS.get(level, '')
-            reset = self.COLORS['RESET']
-            parts.append(f"{color}{level}{reset}")
-        else:
-            parts.append(level)
+class ColoredFormatter(PlainFormatter):
+    """Colorized console formatter."""
+
+    COLORS = {
+        'DEBUG': '\033[36m',     # Cyan
+        'INFO': '\033[32m',      # Green
+        'WARNING': '\033[33m',   # Yellow
+        'ERROR': '\033[31m',     # Red
+        'CRITICAL': '\033[35m',  # Magenta
+        'RESET': '\033[0m',
+    }
+
+    def __init__(self, use_colors: bool = True, use_icons: bool = True):
+        self.use_colors = use_colors and sys.stdout.isatty()
+        super().__init__(use_icons)
 
-        # Add context if present
-        context_parts = []
-        if hasattr(record, 'healer_name') and record.healer_name:
-            context_parts.append(f"[{record.healer_name}]")
-        if hasattr(record, 'file_path') and record.file_path:
-            file_info = record.file_path
-            if hasattr(record, 'line_number') and record.line_number:
-                file_info += f":{record.line_number}"
-            context_parts.append(f"({file_info})")
+    def _level_str(self, level: str) -> str:
+        """Level name wrapped in its ANSI color."""
+        if not self.use_colors:
+            return level
+        return f"{self.COLORS.get(level, '')}{level}{self.COLORS['RESET']}"
 
-        if context_parts:
-            parts.append(' '.join(context_parts))
 
-        parts.append(record.getMessage())
+def _json_default(obj: Any) -> Any:
+    """Serialize datetimes for the stdlib json fallback."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
-        # Add error code if present
-        if hasattr(record, 'error_code') and record.error_code:
-            error_desc = ERROR_CODES.get(record.error_code, "Unknown error")
-            parts.append(f"[{record.error_code}: {error_desc}]")
 
-        return ' '.join(parts)
+def _dumps_entry(log_entry: Dict[str, Any]) -> str:
+    """Serialize a log entry, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(log_entry).decode('utf-8')
+    return json.dumps(log_entry, default=_json_default)
 
 
 class JSONFormatter(logging.Formatter):
-    """JSON formatter for file logging."""
+    """JSON formatter for file logging (uses orjson if installed)."""
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_entry = {
-            'timestamp': datetime.now().isoformat(),
+            # Time the record was created, not when the listener formats it
+            'timestamp': datetime.fromtimestamp(record.created),
             'level': record.levelname,
-            'message': record.getMessage(),
+            'message': _record_message(record),
             'logger': record.name,
         }
 
@@ -189,7 +272,136 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_entry['exception'] = self.formatException(record.exc_info)
 
-        return json.dumps(log_entry)
+        return _dumps_entry(log_entry)
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Size-rotating file handler that batches writes.
+
+    The stock handlers flush after every record, and RotatingFileHandler
+    seeks to end-of-file (another flush) and formats each record twice to
+    decide on rollover. This handler formats once, tracks the file size
+    itself (in characters, exact for ASCII JSON) and flushes every
+    flush_interval records, on ERROR and above, and on close.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        max_bytes: int = 50_000_000,
+        backup_count: int = 3,
+        encoding: str = 'utf-8',
+        buffer_size: int = 64 * 1024,
+        flush_interval: int = 100
+    ):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._unflushed = 0
+        self._size = 0
+        super().__init__(
+            filename,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding=encoding,
+            delay=True
+        )
+
+    def _open(self) -> Any:
+        """Open the log file with a large write buffer and record its size."""
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=getattr(self, 'errors', None)
+        )
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write one record, rolling over first if it would exceed max_bytes."""
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += len(msg)
+            self._unflushed += 1
+            if self._unflushed >= self.flush_interval or record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Flush buffered records to disk."""
+        self._unflushed = 0
+        super().flush()
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a listener in the same process.
+
+    The stock prepare() formats the record and drops exc_info so it can be
+    pickled; here records never leave the process, so only the message
+    arguments are merged and exc_info is kept for the real handlers.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = _record_message(record)
+        record.args = None
+        return record
+
+
+# Active queue listeners by logger name
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+_listeners_lock = threading.Lock()
+
+
+def _stop_listener(name: str) -> List[logging.Handler]:
+    """Stop the listener for a logger (draining its queue) and return its handlers."""
+    with _listeners_lock:
+        listener = _listeners.pop(name, None)
+    if listener is None:
+        return []
+    listener.stop()
+    return list(listener.handlers)
+
+
+def shutdown_logger(name: str = "doc-guardian") -> None:
+    """
+    Flush and close a logger configured by setup_logger.
+
+    Pending records are written before the handlers are closed.
+
+    Args:
+        name: Logger name
+    """
+    for handler in _stop_listener(name):
+        try:
+            handler.flush()
+            handler.close()
+        except (OSError, ValueError):
+            # Stream already closed (e.g. stdout at interpreter exit)
+            pass
+    logging.getLogger(name).handlers.clear()
+
+
+@atexit.register
+def _shutdown_all_loggers() -> None:
+    """Drain every listener at interpreter exit."""
+    with _listeners_lock:
+        names = list(_listeners)
+    for name in names:
+        shutdown_logger(name)
 
 
 def setup_logger(
@@ -198,11 +410,18 @@ def setup_logger(
     level: int = logging.INFO,
     console: bool = True,
     use_colors: bool = True,
-    use_icons: bool = True
+    use_icons: bool = True,
+    max_log_bytes: int = 50_000_000,
+    log_backup_count: int = 3
 ) -> logging.Logger:
     """
     Setup logger with file and console output.
 
+    Records are put on a queue by the calling thread; a background
+    QueueListener formats them and writes to the console/file handlers.
+    The log file is buffered and rotated by size; call shutdown_logger()
+    to flush explicitly (it also runs at exit).
+
     Args:
         name: Logger name
         log_file: Path to log file (JSON format)
@@ -210,6 +429,8 @@ def setup_logger(
         console: Enable console output
         use_colors: Use ANSI colors in console
         use_icons: Use emoji icons in console
+        max_log_bytes: Rotate the log file at this size (0 disables rotation)
+        log_backup_count: Number of rotated log files to keep
 
     Returns:
         Configured logger instance
@@ -221,28 +442,48 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
-    # Remove existing handlers
-    logger.handlers.clear()
+    # Remove existing handlers (draining any previous listener first)
+    shutdown_logger(name)
 
     # Add context filter
     context_filter = ContextFilter()
     logger.addFilter(context_filter)
 
+    handlers: List[logging.Handler] = []
+
     # Console handler
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
-        console_handler.setFormatter(ColoredFormatter(use_colors, use_icons))
-        logger.addHandler(console_handler)
+        # Pick the formatter once: colors only when writing to a terminal
+        if use_colors and sys.stdout.isatty():
+            console_handler.setFormatter(ColoredFormatter(True, use_icons))
+        else:
+            console_handler.setFormatter(PlainFormatter(use_icons))
+        handlers.append(console_handler)
 
     # File handler
     if log_file:
         log_file = Path(log_file)
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = BufferedRotatingFileHandler(
+            log_file,
+            max_bytes=max_log_bytes,
+            backup_count=log_backup_count
+        )
         file_handler.setLevel(level)
         file_handler.setFormatter(JSONFormatter())
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if handlers:
+        record_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            record_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        with _listeners_lock:
+            _listeners[name] = listener
+        logger.addHandler(_InProcessQueueHandler(record_queue))
 
     return logger
 
@@ -260,6 +501,12 @@ def get_logger(name: str = "doc-guardian") -> logging.Logger:
     return logging.getLogger(name)
 
 
+@functools.lru_cache(maxsize=1024)
+def _pathstr(path: Path) -> str:
+    """str(path), cached: per-file healers log the same paths repeatedly."""
+    return str(path)
+
+
 class HealerLogger:
     """
     Logger wrapper for healers with automatic context.
@@ -277,6 +524,9 @@ class HealerLogger:
         """
         self.healer_name = healer_name
         self._logger = logger or get_logger()
+        self._log_fn = self._logger.log
+        self._enabled_for = self._logger.isEnabledFor
+        self._base_extra = {'healer_name': healer_name}
 
     def _log(
         self,
@@ -285,35 +535,38 @@ class HealerLogger:
         file_path: Optional[Path] = None,
         line_number: Optional[int] = None,
         error_code: Optional[str] = None,
-        **kwargs
-    ):
+        **kwargs: Any
+    ) -> None:
         """Internal log method with context."""
+        # Skip building the extra dict for disabled levels (usually DEBUG)
+        if not self._enabled_for(level):
+            return
         extra = {
-            'healer_name': self.healer_name,
-            'file_path': str(file_path) if file_path else None,
+            **self._base_extra,
+            'file_path': _pathstr(file_path) if file_path else None,
             'line_number': line_number,
             'error_code': error_code,
             **kwargs
         }
-        self._logger.log(level, message, extra=extra)
+        self._log_fn(level, message, extra=extra)
 
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, **kwargs: Any) -> None:
         """Log debug message."""
         self._log(logging.DEBUG, message, **kwargs)
 
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, **kwargs: Any) -> None:
         """Log info message."""
         self._log(logging.INFO, message, **kwargs)
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, **kwargs: Any) -> None:
         """Log warning message."""
         self._log(logging.WARNING, message, **kwargs)
 
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, **kwargs: Any) -> None:
         """Log error message."""
         self._log(logging.ERROR, message, **kwargs)
 
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, **kwargs: Any) -> None:
         """Log critical message."""
         self._log(logging.CRITICAL, message, **kwargs)
 
@@ -323,7 +576,7 @@ class HealerLogger:
         file_path: Path,
         line_number: Optional[int] = None,
         error_code: Optional[str] = None
-    ):
+    ) -> None:
         """
         Log file-related error with context.
 
@@ -340,7 +593,7 @@ class HealerLogger:
             error_code=error_code
         )
 
-    def operation_start(self, operation: str, file_path: Optional[Path] = None):
+    def operation_start(self, operation: str, file_path: Optional[Path] = None) -> None:
         """Log start of an operation."""
         self.debug(
             f"Starting: {operation}",
@@ -353,7 +606,7 @@ class HealerLogger:
         operation: str,
         file_path: Optional[Path] = None,
         success: bool = True
-    ):
+    ) -> None:
         """Log completion of an operation."""
         if success:
             self.debug(f"Completed: {operation}", file_path=file_path)
@@ -5,9 +5,16 @@ Ensures all file paths are within allowed directories and don't use
 directory traversal techniques (../, symlinks, etc.).
 """
 
-from pathlib import Path
-from typing import List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePath
+from typing import List, Optional, Set, Tuple, Union
 import os
+import sys
+
+
+# Batches larger than this are validated on a thread pool
+PARALLEL_VALIDATE_THRESHOLD = 64
+MAX_VALIDATE_WORKERS = min(16, (os.cpu_count() or 1) * 4)
 
 
 class PathTraversalError(Exception):
@@ -15,6 +22,24 @@ class PathTraversalError(Exception):
     pass
 
 
+def _root_bounds(root: Path) -> Tuple[str, str]:
+    """
+    (exact, prefix) strings for containment checks against a resolved root.
+
+    normcase makes the comparison case-insensitive on Windows, matching
+    PurePath.relative_to there.
+    """
+    exact = os.path.normcase(str(root)).rstrip(os.sep)
+    return exact, exact + os.sep
+
+
+def _is_within(resolved: Path, root: Path) -> bool:
+    """True if resolved equals root or lies beneath it (both already resolved)."""
+    exact, prefix = _root_bounds(root)
+    path_str = os.path.normcase(str(resolved))
+    return path_str == exact or path_str.startswith(prefix)
+
+
 class PathValidator:
     """Validates file paths for security issues."""
 
@@ -26,16 +51,26 @@ class PathValidator:
             allowed_roots: List of root directories that are allowed
             follow_symlinks: Whether to allow symlinks (default: False for security)
         """
-        # Resolve all roots to absolute paths
+        # Resolve all roots to absolute paths. Only the roots are resolved
+        # once; candidate paths are resolved on every call, since any
+        # directory on the way may be swapped for a symlink between calls.
         self.allowed_roots = [Path(root).resolve() for root in allowed_roots]
         self.follow_symlinks = follow_symlinks
-
-    def validate_path(self, path: Path, purpose: str = "") -> Path:
+        # (exact, prefix) strings for the per-call containment check. Roots
+        # given more than once (e.g. the project root and a doc root that
+        # resolve to the same directory) are checked only once.
+        self._root_bounds = list(dict.fromkeys(
+            (sys.intern(exact), sys.intern(prefix))
+            for exact, prefix in map(_root_bounds, self.allowed_roots)
+        ))
+
+    def validate_path(self, path: Union[str, PurePath], purpose: str = "") -> Path:
         """
         Validate a path for security issues.
 
         Args:
-            path: Path to validate
+            path: Path to validate (str, PurePath or Path; only the
+                resolved result is a concrete Path)
             purpose: Optional description of what this path is for
 
         Returns:
@@ -44,35 +79,33 @@ class PathValidator:
         Raises:
             PathTraversalError: If path is invalid or outside allowed roots
         """
-        # Convert to Path object if string
+        # Normalize strings the way Path would (a trailing slash must not
+        # reach islink, which follows the link for "link/"); path objects
+        # are already normalized. No concrete Path is needed until resolving.
         if isinstance(path, str):
-            path = Path(path)
+            path = PurePath(path)
+        path_str = os.fspath(path)
 
         # Check for null bytes (common in attacks)
-        if '\x00' in str(path):
+        if '\x00' in path_str:
             raise PathTraversalError(f"Path contains null byte: {path}")
 
+        # Check symlinks first: a rejected path never needs resolving
+        if not self.follow_symlinks and os.path.islink(path_str):
+            raise PathTraversalError(f"Symlinks not allowed: {path}")
+
         # Resolve to absolute path
         try:
-            resolved_path = path.resolve()
+            resolved_path = Path(path_str).resolve()
         except (OSError, RuntimeError) as e:
             raise PathTraversalError(f"Failed to resolve path {path}: {e}")
 
-        # Check symlinks
-        if not self.follow_symlinks and path.is_symlink():
-            raise PathTraversalError(f"Symlinks not allowed: {path}")
-
-        # Check if path is within allowed roots
-        is_allowed = False
-        for root in self.allowed_roots:
-            try:
-                # Check if resolved path is relative to allowed root
-                resolved_path.relative_to(root)
-                is_allowed = True
-                break
-            except ValueError:
-                # Not relative to this root, try next
-                continue
+        # Check if path is within allowed roots (string prefix on whole components)
+        resolved_str = os.path.normcase(str(resolved_path))
+        is_allowed = any(
+            resolved_str == exact or resolved_str.startswith(prefix)
+            for exact, prefix in self._root_bounds
+        )
 
         if not is_allowed:
             roots_str = ", ".join(str(r) for r in self.allowed_roots)
@@ -95,6 +128,19 @@ class PathValidator:
         Raises:
             PathTraversalError: If any path is invalid
         """
+        # String-only checks for the whole batch first, so a malformed
+        # batch is rejected before any filesystem syscalls are made
+        for path in paths:
+            if '\x00' in os.fspath(path):
+                raise PathTraversalError(f"Path contains null byte: {path}")
+
+        # Resolving is syscall-bound and releases the GIL, so large batches
+        # overlap their filesystem lookups on a thread pool. map() keeps
+        # input order and re-raises the first failing path's error.
+        if len(paths) > PARALLEL_VALIDATE_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=MAX_VALIDATE_WORKERS) as executor:
+                return list(executor.map(self.validate_path, paths))
+
         return [self.validate_path(path) for path in paths]
 
     def is_safe_filename(self, filename: str) -> bool:
@@ -194,17 +240,15 @@ def validate_path_contained(path: Path, container: Path, allow_nonexistent: bool
     """
     if not isinstance(path, Path):
         path = Path(path)
-    if not isinstance(container, Path):
-        container = Path(container)
 
     # Resolve container to absolute path
     try:
-        resolved_container = container.resolve()
+        resolved_container = Path(container).resolve()
     except (OSError, RuntimeError) as e:
         raise PathSecurityError(f"Invalid container {container}: {e}")
 
     # For nonexistent paths, check if the logical path would be inside container
-    if allow_nonexistent and not path.exists():
+    if allow_nonexistent and not os.path.exists(path):
         # Make path absolute if relative
         if not path.is_absolute():
             logical_path = (resolved_container / path).resolve()
@@ -212,17 +256,14 @@ def validate_path_contained(path: Path, container: Path, allow_nonexistent: bool
             logical_path = path.resolve()
 
         # Check if it's within container
-        try:
-            logical_path.relative_to(resolved_container)
-            return logical_path
-        except ValueError:
+        if not _is_within(logical_path, resolved_container):
             raise PathSecurityError(
                 f"Path {logical_path} is outside container {resolved_container}"
             )
+        return logical_path
 
     # For existing paths, use standard validation
-    validator = PathValidator(allowed_roots=[container])
-    return validator.validate_path(path)
+    return PathValidator(allowed_roots=[resolved_container]).validate_path(path)
 
 
 def validate_project_root(root: Path) -> Path:
@@ -238,11 +279,8 @@ def validate_project_root(root: Path) -> Path:
     Raises:
         PathSecurityError: If root is invalid
     """
-    if not isinstance(root, Path):
-        root = Path(root)
-
     try:
-        resolved = root.resolve()
+        resolved = Path(root).resolve()
     except (OSError, RuntimeError) as e:
         raise PathSecurityError(f"Invalid project root {root}: {e}")
 
@@ -269,18 +307,13 @@ def validate_doc_root(doc_root: Path, project_root: Path) -> Path:
     Raises:
         PathSecurityError: If doc root is invalid or outside project root
     """
-    if not isinstance(doc_root, Path):
-        doc_root = Path(doc_root)
-
     try:
-        resolved = doc_root.resolve()
+        resolved = Path(doc_root).resolve()
     except (OSError, RuntimeError) as e:
         raise PathSecurityError(f"Invalid doc root {doc_root}: {e}")
 
     # Validate it's within project root
-    try:
-        resolved.relative_to(project_root.resolve())
-    except ValueError:
+    if not _is_within(resolved, Path(project_root).resolve()):
         raise PathSecurityError(
             f"Doc root {resolved} is outside project root {project_root}"
         )
@@ -302,18 +335,13 @@ def validate_templates_dir(templates_dir: Path, project_root: Path) -> Path:
     Raises:
         PathSecurityError: If templates dir is invalid or outside project root
     """
-    if not isinstance(templates_dir, Path):
-        templates_dir = Path(templates_dir)
-
     try:
-        resolved = templates_dir.resolve()
+        resolved = Path(templates_dir).resolve()
     except (OSError, RuntimeError) as e:
         raise PathSecurityError(f"Invalid templates directory {templates_dir}: {e}")
 
     # Validate it's within project root
-    try:
-        resolved.relative_to(project_root.resolve())
-    except ValueError:
+    if not _is_within(resolved, Path(project_root).resolve()):
         raise PathSecurityError(
             f"Templates directory {resolved} is outside project root {project_root}"
         )
@@ -5,11 +5,16 @@ Validates regex patterns for potential exponential backtracking that could
 cause performance issues or denial of service attacks.
 """
 
+import functools
 import re
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
 
 
+# Nested quantifier rewrite used by sanitize_pattern: (a+)+ -> (a)+
+_NESTED_QUANTIFIER_RE = re.compile(r'\(([^)]+)[+*]\)[+*]', re.ASCII)
+
+
 class RegexSecurityError(Exception):
     """Raised when a regex pattern has security concerns (ReDoS)."""
     pass
@@ -52,6 +57,13 @@ class RegexValidator:
          'Unanchored wildcard may be inefficient'),
     ]
 
+    # REDOS_PATTERNS compiled once at class definition. They only use ASCII
+    # metacharacters, so re.ASCII drops the Unicode class handling.
+    _REDOS_COMPILED = [
+        (re.compile(redos_pattern, re.ASCII), severity, issue_type, description)
+        for redos_pattern, severity, issue_type, description in REDOS_PATTERNS
+    ]
+
     def __init__(self, max_pattern_length: int = 500):
         """
         Initialize validator.
@@ -72,39 +84,17 @@ class RegexValidator:
         Returns:
             List of issues found
         """
-        issues = []
-
-        # Check pattern length
-        if len(pattern) > self.max_pattern_length:
-            issues.append(RegexIssue(
-                pattern=pattern,
-                severity='medium',
-                issue_type='excessive_length',
-                description=f'Pattern exceeds {self.max_pattern_length} characters'
-            ))
-
-        # Check for ReDoS patterns
-        for redos_pattern, severity, issue_type, description in self.REDOS_PATTERNS:
-            if re.search(redos_pattern, pattern):
-                issues.append(RegexIssue(
-                    pattern=pattern,
-                    severity=severity,
-                    issue_type=issue_type,
-                    description=description
-                ))
-
-        # Try to compile the pattern
-        try:
-            re.compile(pattern)
-        except re.error as e:
-            issues.append(RegexIssue(
+        return [
+            RegexIssue(
                 pattern=pattern,
-                severity='high',
-                issue_type='invalid_syntax',
-                description=f'Pattern is invalid: {str(e)}'
-            ))
-
-        return issues
+                severity=severity,
+                issue_type=issue_type,
+                description=description
+            )
+            for severity, issue_type, description in _pattern_findings(
+                pattern, self.max_pattern_length
+            )
+        ]
 
     def validate_config_patterns(self, config: dict) -> List[RegexIssue]:
         """
@@ -148,7 +138,7 @@ class RegexValidator:
             Sanitized pattern (may be the same if no issues found)
         """
         # Remove nested quantifiers by simplifying to single quantifier
-        sanitized = re.sub(r'\(([^)]+)[+*]\)[+*]', r'(\1)+', pattern)
+        sanitized = _NESTED_QUANTIFIER_RE.sub(r'(\1)+', pattern)
 
         # Anchor wildcard patterns
         if '.*' in sanitized and not (sanitized.startswith('^') or sanitized.endswith('$')):
@@ -157,6 +147,42 @@ class RegexValidator:
         return sanitized
 
 
+@functools.lru_cache(maxsize=2048)
+def _pattern_findings(pattern: str, max_pattern_length: int) -> Tuple[Tuple[str, str, str], ...]:
+    """
+    (severity, issue_type, description) for each issue in a pattern, memoized.
+
+    Patterns repeat heavily across healers and across repeated validations
+    of the same config. The cache holds plain tuples so callers always get
+    fresh RegexIssue objects.
+    """
+    findings = []
+
+    # Check pattern length
+    if len(pattern) > max_pattern_length:
+        findings.append((
+            'medium',
+            'excessive_length',
+            f'Pattern exceeds {max_pattern_length} characters'
+        ))
+
+    # Check for ReDoS patterns. Every heuristic needs a quantified group
+    # close (")+" / ")*") or a wildcard (".*"), so patterns without any
+    # of those skip the regex scans entirely.
+    if ')+' in pattern or ')*' in pattern or '.*' in pattern:
+        for redos_re, severity, issue_type, description in RegexValidator._REDOS_COMPILED:
+            if redos_re.search(pattern):
+                findings.append((severity, issue_type, description))
+
+    # Try to compile the pattern
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        findings.append(('high', 'invalid_syntax', f'Pattern is invalid: {str(e)}'))
+
+    return tuple(findings)
+
+
 def validate_regex_safety(pattern: str, max_length: int = 500) -> Tuple[bool, List[str]]:
     """
     Quick validation function for regex safety.
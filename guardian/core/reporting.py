@@ -7,12 +7,39 @@ Provides utilities to generate reports in:
 - Console output (terminal-friendly)
 """
 
-import json
+import io
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, Any
-from datetime import datetime
 from .base import HealingReport, Change
 
+# Optional fast JSON encoder for saved reports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Longest old/new content shown per change in markdown reports
+SNIPPET_MAX_CHARS = 200
+
+
+def _snippet(content: str) -> str:
+    """Content cut to SNIPPET_MAX_CHARS, with '...' if anything was dropped."""
+    if len(content) <= SNIPPET_MAX_CHARS:
+        return content
+    return content[:SNIPPET_MAX_CHARS] + "..."
+
+
+def _confidence_emoji(confidence: float) -> str:
+    """Traffic-light marker for a confidence score."""
+    if confidence >= 0.9:
+        return "🟢"
+    if confidence >= 0.7:
+        return "🟡"
+    return "🔴"
+
 
 def generate_markdown_report(report: HealingReport) -> str:
     """
@@ -48,71 +75,62 @@ def generate_markdown_report(report: HealingReport) -> str:
     Returns:
         Markdown formatted report as string
     """
-    lines = []
-
-    # Header
-    lines.append(f"# Healing Report: {report.healer_name}\n")
-    lines.append(f"**Mode**: {report.mode}\n")
-    lines.append(f"**Timestamp**: {report.timestamp}\n")
-    lines.append(f"**Execution Time**: {report.execution_time:.2f} seconds\n")
-
-    # Summary
-    lines.append("\n## Summary\n")
-    lines.append(f"- **Issues found**: {report.issues_found}\n")
-    lines.append(f"- **Issues fixed**: {report.issues_fixed}\n")
-    lines.append(f"- **Success rate**: {report.success_rate*100:.1f}%\n")
+    buf = io.StringIO()
+    w = buf.write
+
+    # Header and summary
+    w(
+        f"# Healing Report: {report.healer_name}\n"
+        f"**Mode**: {report.mode}\n"
+        f"**Timestamp**: {report.timestamp}\n"
+        f"**Execution Time**: {report.execution_time:.2f} seconds\n"
+        f"\n## Summary\n"
+        f"- **Issues found**: {report.issues_found}\n"
+        f"- **Issues fixed**: {report.issues_fixed}\n"
+        f"- **Success rate**: {report.success_rate*100:.1f}%\n"
+    )
 
     # Status indicator
     if report.issues_found == 0:
-        lines.append("\n✅ **All documentation is healthy!**\n")
+        w("\n✅ **All documentation is healthy!**\n")
     elif report.issues_fixed == report.issues_found:
-        lines.append("\n✅ **All issues fixed!**\n")
+        w("\n✅ **All issues fixed!**\n")
     elif report.issues_fixed > 0:
-        lines.append(f"\n⚠️ **{report.issues_found - report.issues_fixed} issues remaining**\n")
+        w(f"\n⚠️ **{report.issues_found - report.issues_fixed} issues remaining**\n")
     else:
-        lines.append("\n⚠️ **No issues fixed (check mode or low confidence)**\n")
+        w("\n⚠️ **No issues fixed (check mode or low confidence)**\n")
 
     # Changes
     if report.changes:
-        lines.append("\n## Changes\n")
-
-        # Group by file
-        changes_by_file: Dict[Path, list] = {}
-        for change in report.changes:
-            if change.file not in changes_by_file:
-                changes_by_file[change.file] = []
-            changes_by_file[change.file].append(change)
+        w("\n## Changes\n")
 
-        for file_path, file_changes in sorted(changes_by_file.items()):
-            lines.append(f"\n### {file_path}\n")
+        # Group by file (the sort is stable, so each file keeps its change order)
+        by_file = attrgetter('file')
+        for file_path, file_changes in groupby(sorted(report.changes, key=by_file), key=by_file):
+            w(f"\n### {file_path}\n")
 
             for change in file_changes:
-                lines.append(f"\n#### Line {change.line}\n")
-                lines.append(f"- **Confidence**: {change.confidence*100:.0f}%\n")
-                lines.append(f"- **Reason**: {change.reason}\n")
-                lines.append(f"- **Healer**: {change.healer}\n")
+                confidence_pct = change.confidence * 100
+                w(
+                    f"\n#### Line {change.line}\n"
+                    f"- **Confidence**: {confidence_pct:.0f}%\n"
+                    f"- **Reason**: {change.reason}\n"
+                    f"- **Healer**: {change.healer}\n"
+                )
 
                 # Show diff
                 if change.old_content:
-                    lines.append("\n**Old**:\n```\n")
-                    lines.append(change.old_content[:200])  # Limit to 200 chars
-                    if len(change.old_content) > 200:
-                        lines.append("...")
-                    lines.append("\n```\n")
-
-                lines.append("\n**New**:\n```\n")
-                lines.append(change.new_content[:200])
-                if len(change.new_content) > 200:
-                    lines.append("...")
-                lines.append("\n```\n")
+                    w(f"\n**Old**:\n```\n{_snippet(change.old_content)}\n```\n")
+
+                w(f"\n**New**:\n```\n{_snippet(change.new_content)}\n```\n")
 
     # Errors
     if report.errors:
-        lines.append("\n## Errors\n")
+        w("\n## Errors\n")
         for error in report.errors:
-            lines.append(f"- {error}\n")
+            w(f"- {error}\n")
 
-    return ''.join(lines)
+    return buf.getvalue()
 
 
 def generate_json_report(report: HealingReport) -> Dict[str, Any]:
@@ -176,6 +194,26 @@ def generate_json_report(report: HealingReport) -> Dict[str, Any]:
     }
 
 
+def dumps_json(data: Dict[str, Any]) -> str:
+    """
+    Serialize a JSON report (indented), using orjson when installed.
+
+    Args:
+        data: Dict from generate_json_report() or a similar builder
+
+    Returns:
+        JSON text
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    import json
+    return json.dumps(data, indent=2)
+
+
+# Box rule framing console output
+_CONSOLE_RULE = "=" * 70
+
+
 def generate_console_output(report: HealingReport, verbose: bool = False) -> str:
     """
     Generate console-friendly output with colors and symbols.
@@ -187,20 +225,18 @@ def generate_console_output(report: HealingReport, verbose: bool = False) -> str
     Returns:
         Formatted string for terminal output
     """
-    lines = []
-
-    # Header with box
-    lines.append("=" * 70)
-    lines.append(f"Healing Report: {report.healer_name}")
-    lines.append("=" * 70)
-
-    # Summary
-    lines.append(f"\nMode: {report.mode}")
-    lines.append(f"Execution time: {report.execution_time:.2f}s")
-    lines.append(f"\n📊 Summary:")
-    lines.append(f"   Issues found: {report.issues_found}")
-    lines.append(f"   Issues fixed: {report.issues_fixed}")
-    lines.append(f"   Success rate: {report.success_rate*100:.1f}%")
+    # Header with box and summary (fixed shape, one block)
+    lines = [
+        f"{_CONSOLE_RULE}\n"
+        f"Healing Report: {report.healer_name}\n"
+        f"{_CONSOLE_RULE}\n"
+        f"\nMode: {report.mode}\n"
+        f"Execution time: {report.execution_time:.2f}s\n"
+        f"\n📊 Summary:\n"
+        f"   Issues found: {report.issues_found}\n"
+        f"   Issues fixed: {report.issues_fixed}\n"
+        f"   Success rate: {report.success_rate*100:.1f}%"
+    ]
 
     # Status
     if report.issues_found == 0:
@@ -216,9 +252,9 @@ def generate_console_output(report: HealingReport, verbose: bool = False) -> str
         lines.append(f"\n🔧 Changes ({len(report.changes)}):")
 
         for i, change in enumerate(report.changes[:10], 1):  # Limit to 10
-            conf_emoji = "🟢" if change.confidence >= 0.9 else "🟡" if change.confidence >= 0.7 else "🔴"
-            lines.append(f"\n{i}. {conf_emoji} {change.file}:{change.line}")
-            lines.append(f"   Confidence: {change.confidence*100:.0f}%")
+            confidence = change.confidence
+            lines.append(f"\n{i}. {_confidence_emoji(confidence)} {change.file}:{change.line}")
+            lines.append(f"   Confidence: {confidence*100:.0f}%")
             lines.append(f"   Reason: {change.reason}")
 
         if len(report.changes) > 10:
@@ -232,7 +268,7 @@ def generate_console_output(report: HealingReport, verbose: bool = False) -> str
         if len(report.errors) > 5:
             lines.append(f"   ... and {len(report.errors) - 5} more")
 
-    lines.append("\n" + "=" * 70)
+    lines.append("\n" + _CONSOLE_RULE)
 
     return '\n'.join(lines)
 
@@ -255,6 +291,10 @@ def save_report(report: HealingReport, output_dir: Path, format: str = 'markdown
         # reports/BrokenLinkHealer_20240315_143022.md
         # reports/BrokenLinkHealer_20240315_143022.json
     """
+    # datetime is only needed for saving, so it is imported here rather
+    # than on every import of this module (json likewise, in dumps_json)
+    from datetime import datetime
+
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate timestamp for filename
@@ -268,5 +308,4 @@ def save_report(report: HealingReport, output_dir: Path, format: str = 'markdown
 
     if format in ['json', 'both']:
         json_path = output_dir / f"{base_name}.json"
-        json_data = generate_json_report(report)
-        json_path.write_text(json.dumps(json_data, indent=2))
+        json_path.write_text(dumps_json(generate_json_report(report)), encoding='utf-8')
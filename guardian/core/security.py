@@ -12,8 +12,11 @@ Security fixes for:
 - DG-2026-006: Memory Exhaustion
 """
 
+import functools
+import os
+from collections import defaultdict
 from pathlib import Path
-from typing import Tuple, Optional, Set
+from typing import Dict, Iterable, List, Tuple, Optional, Set, Union
 
 
 # ==============================================================================
@@ -80,23 +83,99 @@ def validate_file_size(
         - (False, "reason") if file is too large or can't be checked
     """
     try:
-        if not file_path.exists():
-            return (True, None)  # Non-existent files will fail later anyway
+        size = os.stat(file_path).st_size
+    except (FileNotFoundError, NotADirectoryError):
+        return (True, None)  # Non-existent files will fail later anyway
+    except Exception as e:
+        return (False, f"Cannot check file size for {file_path}: {e}")
 
-        size = file_path.stat().st_size
+    return _check_size(file_path, size, max_size)
 
-        if size > max_size:
-            return (
-                False,
-                f"File too large: {file_path} is {size:,} bytes "
-                f"(max: {max_size:,} bytes)"
-            )
 
-        return (True, None)
+def _check_size(
+    file_path: Path,
+    size: int,
+    max_size: int
+) -> Tuple[bool, Optional[str]]:
+    """Compare a known file size against the limit."""
+    if size > max_size:
+        return (
+            False,
+            f"File too large: {file_path} is {size:,} bytes "
+            f"(max: {max_size:,} bytes)"
+        )
+
+    return (True, None)
+
 
+def _check_entry_size(
+    file_path: Path,
+    entry: os.DirEntry,
+    max_size: int
+) -> Tuple[bool, Optional[str]]:
+    """validate_file_size() for a file whose DirEntry is already known."""
+    try:
+        size = entry.stat().st_size
+    except (FileNotFoundError, NotADirectoryError):
+        return (True, None)
     except Exception as e:
         return (False, f"Cannot check file size for {file_path}: {e}")
 
+    return _check_size(file_path, size, max_size)
+
+
+def validate_file_sizes_bulk(
+    paths: Iterable[Union[Path, os.DirEntry]],
+    max_size: int = MAX_FILE_SIZE_BYTES
+) -> Dict[Path, Tuple[bool, Optional[str]]]:
+    """
+    Validate the sizes of many files at once.
+
+    Paths that share a parent directory are looked up with a single
+    os.scandir() of that directory. Callers that already walked the tree
+    with os.scandir() can pass the DirEntry objects directly so their
+    cached stat results are reused.
+
+    Args:
+        paths: Files to check (Path objects or os.DirEntry objects)
+        max_size: Maximum allowed size in bytes
+
+    Returns:
+        Dict mapping each path to the (is_valid, error_message) tuple
+        validate_file_size() would return for it
+    """
+    results: Dict[Path, Tuple[bool, Optional[str]]] = {}
+    by_parent: Dict[Path, List[Path]] = defaultdict(list)
+
+    for path in paths:
+        if isinstance(path, os.DirEntry):
+            file_path = Path(path.path)
+            results[file_path] = _check_entry_size(file_path, path, max_size)
+        else:
+            by_parent[path.parent].append(path)
+
+    for parent, group in by_parent.items():
+        if len(group) == 1:
+            results[group[0]] = validate_file_size(group[0], max_size)
+            continue
+
+        try:
+            with os.scandir(parent) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            entries = {}
+
+        for file_path in group:
+            entry = entries.get(file_path.name)
+            if entry is None:
+                # Not listed (missing, unreadable directory, or a name that
+                # differs only in case): fall back to a direct stat
+                results[file_path] = validate_file_size(file_path, max_size)
+            else:
+                results[file_path] = _check_entry_size(file_path, entry, max_size)
+
+    return results
+
 
 def safe_read_file(
     file_path: Path,
@@ -154,7 +233,7 @@ def safe_read_bytes(
 # Git Path Safety
 # ==============================================================================
 
-def safe_git_path(path: Path) -> str:
+def safe_git_path(path: Union[str, Path]) -> str:
     """
     Make a path safe for use in git commands.
 
@@ -167,7 +246,7 @@ def safe_git_path(path: Path) -> str:
     Returns:
         Safe path string for git commands
     """
-    path_str = str(path)
+    path_str = os.fspath(path)
 
     # Prefix with ./ if path starts with - to prevent option injection
     if path_str.startswith('-'):
@@ -176,7 +255,24 @@ def safe_git_path(path: Path) -> str:
     return path_str
 
 
-def validate_git_path(path: Path) -> Tuple[bool, Optional[str]]:
+def safe_git_path_after_ddash(path: Union[str, Path]) -> str:
+    """
+    Path string for use after a `--` separator in a git command.
+
+    Everything after `--` is a pathspec, never an option, so no '-' prefix
+    guard is needed. Only use this when the command list contains `--`
+    before the path; otherwise use safe_git_path.
+
+    Args:
+        path: Path to convert
+
+    Returns:
+        Path string for git commands
+    """
+    return os.fspath(path)
+
+
+def validate_git_path(path: Union[str, Path]) -> Tuple[bool, Optional[str]]:
     """
     Validate that a path is safe for git operations.
 
@@ -186,7 +282,7 @@ def validate_git_path(path: Path) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_safe, error_message)
     """
-    path_str = str(path)
+    path_str = os.fspath(path)
 
     # Check for null bytes (could cause issues)
     if '\x00' in path_str:
@@ -203,6 +299,43 @@ def validate_git_path(path: Path) -> Tuple[bool, Optional[str]]:
 # Module Whitelist Validation
 # ==============================================================================
 
+def is_allowed_module(
+    module_path: str,
+    allowed_modules: Optional[Set[str]] = None
+) -> bool:
+    """
+    Check whether a dotted module path is covered by the whitelist.
+
+    A path is allowed if it, or any of its dotted parents, is in the
+    whitelist ("guardian.core" allows "guardian.core.base.X"). Each
+    parent is a set lookup, so the cost depends on the path's depth,
+    not on the size of the whitelist.
+
+    Args:
+        module_path: Dotted module path
+        allowed_modules: Set of allowed module prefixes (uses default if None)
+
+    Returns:
+        True if the module path is allowed
+    """
+    if allowed_modules is None:
+        allowed_modules = ALLOWED_CONTEXT_BUILDER_MODULES
+    elif not isinstance(allowed_modules, (set, frozenset)):
+        # Lists/tuples would make every lookup below a linear scan
+        allowed_modules = frozenset(allowed_modules)
+
+    if module_path in allowed_modules:
+        return True
+
+    dot = module_path.find('.')
+    while dot != -1:
+        if module_path[:dot] in allowed_modules:
+            return True
+        dot = module_path.find('.', dot + 1)
+
+    return False
+
+
 def validate_module_path(
     module_path: str,
     allowed_modules: Optional[Set[str]] = None
@@ -211,6 +344,8 @@ def validate_module_path(
     Validate that a module path is in the allowed whitelist.
 
     Prevents arbitrary code execution via malicious context_builder config.
+    The error message is only built for rejected modules; callers that just
+    need the yes/no answer should use is_allowed_module().
 
     Args:
         module_path: Dotted module path (e.g., "myproject.utils.build_context")
@@ -222,26 +357,15 @@ def validate_module_path(
     if allowed_modules is None:
         allowed_modules = ALLOWED_CONTEXT_BUILDER_MODULES
 
-    # Extract the module part (everything before the last dot)
-    if '.' not in module_path:
-        # Single name - must be in allowed list exactly
-        if module_path in allowed_modules:
-            return (True, None)
-        return (
-            False,
-            f"Module '{module_path}' is not in the allowed whitelist. "
-            f"Allowed modules: {sorted(allowed_modules)}"
-        )
-
-    # Check if any allowed module is a prefix of the module path
-    for allowed in allowed_modules:
-        if module_path == allowed or module_path.startswith(allowed + '.'):
-            return (True, None)
+    if is_allowed_module(module_path, allowed_modules):
+        return (True, None)
 
+    # Single names must be listed exactly; dotted paths may match a prefix
+    kind = "module prefixes" if '.' in module_path else "modules"
     return (
         False,
         f"Module '{module_path}' is not in the allowed whitelist. "
-        f"Allowed module prefixes: {sorted(allowed_modules)}"
+        f"Allowed {kind}: {sorted(allowed_modules)}"
     )
 
 
@@ -318,13 +442,21 @@ def sanitize_error_message(
     """
     if project_root:
         # Replace absolute paths with relative ones
-        root_str = str(project_root.resolve())
+        root_str = str(Path(project_root).resolve())
         message = message.replace(root_str, '<project>')
 
     # Remove any home directory references
-    import os
-    home = os.path.expanduser('~')
-    if home and home != '~':
+    home = _home_dir()
+    if home:
         message = message.replace(home, '<home>')
 
     return message
+
+
+@functools.lru_cache(maxsize=1)
+def _home_dir() -> Optional[str]:
+    """The user's home directory, or None if it cannot be determined."""
+    home = os.path.expanduser('~')
+    if home and home != '~':
+        return home
+    return None
@@ -22,7 +22,7 @@ import signal
 import sys
 import atexit
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Optional
 from contextlib import contextmanager
 
 
@@ -39,18 +39,22 @@ class GracefulShutdown:
     def __init__(self):
         """Initialize graceful shutdown handler."""
         self.shutdown_requested = False
-        self.cleanup_actions: List[Callable[[], None]] = []
+        # Insertion-ordered dicts used as ordered sets: O(1) register and
+        # unregister, cleanup still runs in registration order
+        self.cleanup_actions: Dict[Callable[[], None], None] = {}
         self._original_sigint = None
         self._original_sigterm = None
         self._installed = False
-        self._in_progress_files: List[Path] = []
+        self._atexit_registered = False
+        self._in_progress_files: Dict[Path, None] = {}
 
     def install(self):
         """
         Install signal handlers.
 
-        Call this at the start of the main program to enable
-        graceful shutdown handling.
+        Call this once at the start of the main program to enable
+        graceful shutdown handling. Repeated calls are no-ops, so no
+        extra sigaction syscalls are made.
         """
         if self._installed:
             return
@@ -59,8 +63,11 @@ class GracefulShutdown:
         self._original_sigint = signal.signal(signal.SIGINT, self._signal_handler)
         self._original_sigterm = signal.signal(signal.SIGTERM, self._signal_handler)
 
-        # Register atexit handler for normal exit cleanup
-        atexit.register(self._atexit_cleanup)
+        # Register atexit handler for normal exit cleanup (once, even if
+        # the handlers are uninstalled and installed again)
+        if not self._atexit_registered:
+            atexit.register(self._atexit_cleanup)
+            self._atexit_registered = True
 
         self._installed = True
 
@@ -108,14 +115,15 @@ class GracefulShutdown:
 
     def _run_cleanup(self):
         """Run all registered cleanup actions."""
-        for action in self.cleanup_actions:
+        # Copy first: an action may unregister itself
+        for action in list(self.cleanup_actions):
             try:
                 action()
             except Exception as e:
                 print(f"   Cleanup error: {e}")
 
         # Clean up any in-progress temp files
-        for temp_file in self._in_progress_files:
+        for temp_file in list(self._in_progress_files):
             try:
                 if temp_file.exists():
                     temp_file.unlink()
@@ -129,13 +137,15 @@ class GracefulShutdown:
         """
         Register a cleanup action for shutdown.
 
+        Registering the same action again has no effect.
+
         Args:
             action: Callable to run on shutdown (no arguments, no return)
 
         Example:
             >>> shutdown.register_cleanup(lambda: print("Goodbye!"))
         """
-        self.cleanup_actions.append(action)
+        self.cleanup_actions[action] = None
 
     def unregister_cleanup(self, action: Callable[[], None]):
         """
@@ -144,8 +154,7 @@ class GracefulShutdown:
         Args:
             action: Callable previously registered
         """
-        if action in self.cleanup_actions:
-            self.cleanup_actions.remove(action)
+        self.cleanup_actions.pop(action, None)
 
     def register_in_progress_file(self, file_path: Path):
         """
@@ -156,7 +165,7 @@ class GracefulShutdown:
         Args:
             file_path: Path to file being written
         """
-        self._in_progress_files.append(file_path)
+        self._in_progress_files[file_path] = None
 
     def unregister_in_progress_file(self, file_path: Path):
         """
@@ -165,8 +174,7 @@ class GracefulShutdown:
         Args:
             file_path: Path to file that was successfully written
         """
-        if file_path in self._in_progress_files:
-            self._in_progress_files.remove(file_path)
+        self._in_progress_files.pop(file_path, None)
 
     @contextmanager
     def protected_write(self, file_path: Path):
@@ -192,7 +200,9 @@ class GracefulShutdown:
         """
         Check if shutdown was requested.
 
-        Use this in long-running loops to exit gracefully.
+        Use this in long-running loops to exit gracefully. It is a plain
+        attribute read (the signal handler sets the flag), so it is cheap
+        enough to call once per file.
 
         Returns:
             True if shutdown was requested, False otherwise
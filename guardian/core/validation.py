@@ -14,10 +14,47 @@ Security features:
 import re
 import json
 import ast
+import asyncio
+import errno
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 from .base import Change
-from .security import validate_file_size, safe_read_file, MAX_FILE_SIZE_BYTES
+from .security import MAX_FILE_SIZE_BYTES
+
+# YAML support
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+
+# Batches touching more files than this read them on a thread pool
+PARALLEL_READ_THRESHOLD = 32
+MAX_VALIDATION_WORKERS = min(8, os.cpu_count() or 1)
+
+# Max link existence checks in flight per validate_links_async call
+MAX_ASYNC_LINK_CHECKS = 64
+
+# Lines whose stripped text starts with ``` (code fence open/close). \s*
+# may also swallow preceding blank lines, but never another fence.
+_CODE_FENCE_RE = re.compile(r'^\s*```', re.MULTILINE)
+
+# Markdown links [text](url), empty text/url allowed (flagged by the caller)
+_MD_LINK_RE = re.compile(r'\[([^\]]*)\]\(([^\)]*)\)')
+
+
+# Markdown links [text](url) checked by validate_links (non-empty parts)
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+
+# Link targets validate_links does not check: external links and anchors
+_SKIPPED_LINK_PREFIXES = ('http://', 'https://', 'mailto:', '#')
+
+# Errors Path.exists() reports as "does not exist" rather than raising
+_MISSING_FILE_ERRNOS = (errno.ENOENT, errno.ENOTDIR, errno.ELOOP)
 
 
 def validate_syntax(file_path: Path) -> bool:
@@ -34,59 +71,136 @@ def validate_syntax(file_path: Path) -> bool:
     - Uses ast.parse() instead of compile() for Python (DG-2026-004)
     - Enforces file size limits to prevent memory exhaustion
 
+    Results are memoized per (path, inode, mtime, size), so validating an
+    unchanged file again costs a single stat.
+
     Args:
         file_path: Path to file to validate
 
     Returns:
         True if syntax is valid, False otherwise
     """
-    if not file_path.exists():
+    path_str = os.fspath(file_path)
+    try:
+        st = os.stat(path_str)
+    except OSError:
         return False
 
     # Security: Check file size before reading
-    is_valid, error = validate_file_size(file_path)
-    if not is_valid:
+    if st.st_size > MAX_FILE_SIZE_BYTES:
         return False
 
-    suffix = file_path.suffix.lower()
+    # Results are keyed on the stat fields a rewrite changes, so edited
+    # files are re-parsed; call clear_syntax_cache() to force it
+    return _validate_syntax_cached(
+        path_str, file_path.suffix.lower(), st.st_ino, st.st_mtime_ns, st.st_size
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_syntax_cached(
+    path_str: str,
+    suffix: str,
+    inode: int,
+    mtime_ns: int,
+    size: int
+) -> bool:
+    """validate_syntax() for one version of a file (identified by stat fields)."""
+    try:
+        if suffix == '.py':
+            # ast.parse takes the raw bytes (honouring any coding cookie),
+            # so skip the decode
+            with open(path_str, 'rb') as f:
+                return validate_python_syntax_bytes(f.read())
+
+        with open(path_str, encoding='utf-8') as f:
+            content = f.read()
+    except Exception:
+        return False
+
+    return validate_syntax_content(content, suffix)
+
+
+def clear_syntax_cache() -> None:
+    """Forget memoized validate_syntax() results."""
+    _validate_syntax_cached.cache_clear()
+
+
+def validate_python_syntax_bytes(data: bytes) -> bool:
+    """
+    Check Python source syntax from undecoded bytes.
+
+    Security: ast.parse only parses, never executes code (DG-2026-004).
+
+    Args:
+        data: Python source as bytes
 
+    Returns:
+        True if the source parses, False otherwise
+    """
     try:
-        content = safe_read_file(file_path)
-
-        if suffix == '.json':
-            json.loads(content)
-            return True
-
-        elif suffix in ['.yaml', '.yml']:
-            try:
-                import yaml
-                yaml.safe_load(content)
-                return True
-            except ImportError:
-                # PyYAML not available - skip validation
-                return True
-
-        elif suffix == '.py':
-            # Security: Use ast.parse instead of compile() (DG-2026-004)
-            # ast.parse only parses, never executes code
-            # This is safer than compile() which could theoretically be
-            # combined with exec() if code evolves
-            ast.parse(content)
-            return True
-
-        elif suffix == '.md':
-            # Basic markdown validation
-            # Check for common syntax errors
-            return validate_markdown_syntax(content)
+        ast.parse(data, filename='<validate>', mode='exec')
+        return True
+    except (SyntaxError, ValueError):
+        return False
 
-        else:
-            # Unknown file type - assume valid
-            return True
 
+def validate_syntax_content(content: str, suffix: str) -> bool:
+    """
+    Validate in-memory content as if it were a file with the given suffix.
+
+    Same checks as validate_syntax(), without touching the filesystem.
+
+    Args:
+        content: File content to validate
+        suffix: Lower-case file extension including the dot (e.g. '.json')
+
+    Returns:
+        True if syntax is valid, False otherwise
+    """
+    handler = _SYNTAX_HANDLERS.get(suffix)
+    if handler is None:
+        # Unknown file type - assume valid
+        return True
+
+    try:
+        return handler(content)
     except Exception:
         return False
 
 
+def _check_json(content: str) -> bool:
+    """Parse content as JSON."""
+    json.loads(content)
+    return True
+
+
+def _check_yaml(content: str) -> bool:
+    """Parse content as YAML (safe loader only)."""
+    yaml.safe_load(content)
+    return True
+
+
+def _check_python(content: str) -> bool:
+    """Parse content as Python source."""
+    # Security: Use ast.parse instead of compile() (DG-2026-004)
+    # ast.parse only parses, never executes code
+    # This is safer than compile() which could theoretically be
+    # combined with exec() if code evolves
+    ast.parse(content)
+    return True
+
+
+def _exceeds_size_limit(content: str, max_size: int = MAX_FILE_SIZE_BYTES) -> bool:
+    """True if content would be larger than max_size bytes once UTF-8 encoded."""
+    # A character encodes to 1-4 bytes, so only the middle range needs encoding
+    if len(content) > max_size:
+        return True
+    if len(content) * 4 <= max_size:
+        return False
+    return len(content.encode('utf-8')) > max_size
+
+
 def validate_markdown_syntax(content: str) -> bool:
     """
     Validate markdown syntax.
@@ -102,20 +216,13 @@ def validate_markdown_syntax(content: str) -> bool:
     Returns:
         True if markdown is well-formed
     """
-    lines = content.split('\n')
-
     # Check for unclosed code blocks
-    code_block_count = 0
-    for line in lines:
-        if line.strip().startswith('```'):
-            code_block_count += 1
-
-    if code_block_count % 2 != 0:
+    if len(_CODE_FENCE_RE.findall(content)) % 2 != 0:
         return False  # Unclosed code block
 
     # Check for malformed links [text](url)
     # Should have matching brackets
-    for match in re.finditer(r'\[([^\]]*)\]\(([^\)]*)\)', content):
+    for match in _MD_LINK_RE.finditer(content):
         text, url = match.groups()
         if not text or not url:
             return False  # Empty text or URL
@@ -123,6 +230,17 @@ def validate_markdown_syntax(content: str) -> bool:
     return True
 
 
+# Syntax checks by lower-case suffix; a handler returns True or raises.
+# YAML is skipped (treated as valid) when PyYAML is not installed.
+_SYNTAX_HANDLERS: Dict[str, Callable[[str], bool]] = {
+    '.json': _check_json,
+    '.py': _check_python,
+    '.md': validate_markdown_syntax,
+}
+if YAML_AVAILABLE:
+    _SYNTAX_HANDLERS['.yaml'] = _SYNTAX_HANDLERS['.yml'] = _check_yaml
+
+
 def validate_links(file_path: Path, project_root: Path) -> bool:
     """
     Validate all links in a file exist.
@@ -137,42 +255,100 @@ def validate_links(file_path: Path, project_root: Path) -> bool:
     Returns:
         True if all internal links are valid
     """
-    if not file_path.exists():
+    targets = _link_targets(file_path, project_root)
+    if targets is None:
         return False
 
-    content = file_path.read_text()
+    return all(target.exists() for target in targets)
 
-    # Extract markdown links [text](url)
-    link_pattern = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
 
-    for match in link_pattern.finditer(content):
+async def validate_links_async(
+    file_path: Path,
+    project_root: Path,
+    exists_cache: Optional[Dict[Path, bool]] = None
+) -> bool:
+    """
+    Async counterpart of validate_links.
+
+    Each distinct link target is checked once, with up to
+    MAX_ASYNC_LINK_CHECKS existence checks in flight on the default
+    executor. Pass the same exists_cache dict when validating many files
+    in one run so targets already found to exist are not checked again.
+
+    Args:
+        file_path: Path to file containing links
+        project_root: Root directory for resolving absolute paths
+        exists_cache: Optional dict of targets known to exist (updated in place)
+
+    Returns:
+        True if all internal links are valid
+    """
+    loop = asyncio.get_running_loop()
+    targets = await loop.run_in_executor(None, _link_targets, file_path, project_root)
+    if targets is None:
+        return False
+
+    if exists_cache is None:
+        exists_cache = {}
+    pending = [t for t in dict.fromkeys(targets) if t not in exists_cache]
+    if not pending:
+        return True
+
+    semaphore = asyncio.Semaphore(MAX_ASYNC_LINK_CHECKS)
+
+    async def check(target: Path) -> bool:
+        async with semaphore:
+            return await loop.run_in_executor(None, target.exists)
+
+    results = await asyncio.gather(*(check(t) for t in pending))
+    for target, exists in zip(pending, results):
+        if exists:
+            exists_cache[target] = True
+
+    return all(results)
+
+
+def _link_targets(file_path: Path, project_root: Path) -> Optional[List[Path]]:
+    """
+    Internal link targets in file_path, in order of appearance.
+
+    Returns None if file_path does not exist.
+    """
+    try:
+        with open(os.fspath(file_path)) as f:
+            content = f.read()
+    except OSError as e:
+        if e.errno in _MISSING_FILE_ERRNOS:
+            return None
+        raise
+    file_dir = file_path.parent
+
+    targets = []
+    # Extract markdown links [text](url)
+    for match in _LINK_RE.finditer(content):
         url = match.group(2)
 
-        # Skip external links
-        if url.startswith(('http://', 'https://', 'mailto:')):
+        # Skip external links and anchors only
+        if url.startswith(_SKIPPED_LINK_PREFIXES):
             continue
 
-        # Skip anchors only
-        if url.startswith('#'):
-            continue
+        # Strip anchor if present
+        url = url.partition('#')[0]
 
         # Resolve link path
         if url.startswith('/'):
             # Absolute from project root
-            target = project_root / url.lstrip('/')
+            targets.append(project_root / url.lstrip('/'))
+        elif '..' in url:
+            # Relative to file; resolve() collapses '..' after following
+            # symlinks, even below directories that do not exist
+            targets.append((file_dir / url).resolve())
         else:
-            # Relative to file
-            target = (file_path.parent / url).resolve()
+            # Relative to file; without '..' the kernel finds the same file
+            # resolve() would, so skip its per-component lstat calls
+            targets.append(file_dir / url)
 
-        # Strip anchor if present
-        if '#' in str(target):
-            target = Path(str(target).split('#')[0])
-
-        # Check existence
-        if not target.exists():
-            return False
-
-    return True
+    return targets
 
 
 def validate_change(change: Change, strict: bool = False) -> Tuple[bool, Optional[str]]:
@@ -195,14 +371,44 @@ def validate_change(change: Change, strict: bool = False) -> Tuple[bool, Optiona
         - (True, None) if valid
         - (False, "reason") if invalid
     """
+    content = _read_for_validation(change.file) if _needs_content(change, strict) else None
+    return _validate_change_with_content(change, content, strict)
+
+
+def _needs_content(change: Change, strict: bool) -> bool:
+    """Whether validating change looks at the current file at all."""
+    return bool(change.old_content) or strict
+
+
+def _read_for_validation(file_path: Path) -> Optional[str]:
+    """Current content of file_path, or None if the file does not exist."""
+    try:
+        return file_path.read_text()
+    except OSError as e:
+        if e.errno in _MISSING_FILE_ERRNOS:
+            return None
+        raise
+
+
+def _validate_change_with_content(
+    change: Change,
+    content: Optional[str],
+    strict: bool
+) -> Tuple[bool, Optional[str]]:
+    """
+    validate_change() against already-read file content.
+
+    content is None when the file does not exist (it is only consulted when
+    _needs_content() is true for the change).
+    """
     # 1. File must exist (unless creating)
-    if not change.file.exists() and change.old_content:
+    if content is None and change.old_content:
         return False, f"File does not exist: {change.file}"
 
     # 2. Old content must match
-    if change.file.exists() and change.old_content:
-        content = change.file.read_text()
-        if change.old_content not in content:
+    if change.old_content and content is not None:
+        match_at = content.find(change.old_content)
+        if match_at < 0:
             return False, "Old content not found in file"
 
     # 3. New content should not be empty (unless explicit deletion)
@@ -220,30 +426,21 @@ def validate_change(change: Change, strict: bool = False) -> Tuple[bool, Optiona
         return False, f"Change magnitude too large: {diff_lines} lines"
 
     # 5. Strict mode: validate syntax after change
-    if strict and change.file.exists():
-        # Simulate change
-        content = change.file.read_text()
+    if strict and content is not None:
+        # Simulate change (apply_change replaces every occurrence; the text
+        # before the first match found in step 2 needs no rescanning)
         if change.old_content:
-            new_content = content.replace(change.old_content, change.new_content)
+            new_content = (
+                content[:match_at]
+                + content[match_at:].replace(change.old_content, change.new_content)
+            )
         else:
             new_content = content + change.new_content
 
-        # Write to temp file and validate
-        import tempfile
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix=change.file.suffix,
-            delete=False
-        ) as tmp:
-            tmp.write(new_content)
-            tmp_path = Path(tmp.name)
-
-        try:
-            is_valid = validate_syntax(tmp_path)
-            if not is_valid:
-                return False, "Change would result in invalid syntax"
-        finally:
-            tmp_path.unlink()
+        # Validate the result in memory (same size limit as a file on disk)
+        if (_exceeds_size_limit(new_content)
+                or not validate_syntax_content(new_content, change.file.suffix.lower())):
+            return False, "Change would result in invalid syntax"
 
     return True, None
 
@@ -262,9 +459,23 @@ def validate_all_changes(changes: List[Change], strict: bool = False) -> Tuple[b
         - (False, ["error1", "error2"]) if any invalid
     """
     errors = []
+    # Every change is checked against the file as it is on disk now, so
+    # each file only needs to be read once per batch
+    needed = list(dict.fromkeys(
+        change.file for change in changes if _needs_content(change, strict)
+    ))
+    if len(needed) > PARALLEL_READ_THRESHOLD:
+        # Reads release the GIL; the parsing in step 5 does not, so only
+        # the I/O is spread across threads
+        workers = min(MAX_VALIDATION_WORKERS, len(needed))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            contents = dict(zip(needed, executor.map(_read_for_validation, needed)))
+    else:
+        contents = {file_path: _read_for_validation(file_path) for file_path in needed}
 
     for change in changes:
-        is_valid, error = validate_change(change, strict=strict)
+        content = contents.get(change.file) if _needs_content(change, strict) else None
+        is_valid, error = _validate_change_with_content(change, content, strict)
         if not is_valid:
             errors.append(f"{change.file}:{change.line} - {error}")
 
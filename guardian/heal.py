@@ -22,7 +22,7 @@ Usage:
     python heal.py --config path/to/config.yaml --heal --skip enforce_disclosure
 
 Performance:
-- With --parallel: Independent healers run in parallel using ProcessPoolExecutor
+- With --parallel: Independent healers run in parallel on a thread pool
 - Target: < 10s for 1,000 files (from original 45-290s)
 """
 
@@ -34,19 +34,25 @@ from pathlib import Path
 if __name__ == "__main__":
     sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import importlib
+import importlib.util
+import os
+import threading
 import time
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
-from multiprocessing import cpu_count
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import List, Dict, Type, Optional, Tuple, Callable
+from functools import lru_cache
+from typing import Any, List, Dict, Set, Type, Optional, Tuple, Callable, Union
 from datetime import datetime
 
 # Now import local modules (works for both script and module)
 try:
     from .core.base import HealingSystem, HealingReport, Change
+    from .core.reporting import dumps_json, generate_json_report as generate_healer_json_report
     from .core.config_validator import (
         validate_config_schema,
         validate_and_load_config,
+        load_cached_config,
         ValidationResult,
         ConfigError,
         ConfigValidationError
@@ -64,9 +70,11 @@ try:
     )
 except ImportError:
     from guardian.core.base import HealingSystem, HealingReport, Change
+    from guardian.core.reporting import dumps_json, generate_json_report as generate_healer_json_report
     from guardian.core.config_validator import (
         validate_config_schema,
         validate_and_load_config,
+        load_cached_config,
         ValidationResult,
         ConfigError,
         ConfigValidationError
@@ -83,20 +91,23 @@ except ImportError:
         print_box
     )
 
-# Global flag for graceful shutdown
-_shutdown_requested = False
+# A healer class, or the (module, class name) it is imported from on demand
+HealerSpec = Union[Type[HealingSystem], Tuple[str, str]]
 
-def _signal_handler(signum, frame):
+# Set on Ctrl+C / SIGTERM. Checked by the orchestrators between healers
+# and by running healers between changes (HealingSystem.should_stop)
+_shutdown_requested = threading.Event()
+
+def _signal_handler(signum: int, frame: Any) -> None:
     """Handle Ctrl+C and SIGTERM for graceful shutdown."""
-    global _shutdown_requested
     # Import here to avoid circular dependency
     from guardian.core.colors import error, warning
 
-    if _shutdown_requested:
+    if _shutdown_requested.is_set():
         # Force exit on second signal
         print(error("\n\nForced exit requested."), file=sys.stderr)
         sys.exit(1)
-    _shutdown_requested = True
+    _shutdown_requested.set()
     print(warning("\n\nShutdown requested. Finishing current operation..."), file=sys.stderr)
     print(warning("Press Ctrl+C again to force exit."), file=sys.stderr)
 
@@ -104,23 +115,35 @@ def _signal_handler(signum, frame):
 signal.signal(signal.SIGINT, _signal_handler)
 signal.signal(signal.SIGTERM, _signal_handler)
 
-# Config loading support for Python 3.11+
-try:
-    import tomllib
-    TOML_AVAILABLE = True
-except ImportError:
+# Config format support (parsing itself is config_validator.parse_config_file)
+TOML_AVAILABLE = any(importlib.util.find_spec(name) is not None for name in ('tomllib', 'toml'))
+YAML_AVAILABLE = importlib.util.find_spec('yaml') is not None
+
+
+def _usable_cpu_count() -> int:
+    """
+    CPUs this process may run on.
+
+    Uses the scheduler affinity mask where available, so taskset and
+    container cpusets are respected (CPU quotas, e.g. docker --cpus, are not
+    visible here; pass --max-workers in that case).
+    """
     try:
-        import toml as tomllib
-        TOML_AVAILABLE = True
-    except ImportError:
-        TOML_AVAILABLE = False
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Print lines to stdout with a single write (one flush per block)."""
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
 
-# YAML support
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+
+@lru_cache(maxsize=None)
+def _display_name(healer_name: str) -> str:
+    """Human-readable healer name ('fix_broken_links' -> 'Fix Broken Links')."""
+    return healer_name.replace('_', ' ').title()
 
 
 @dataclass
@@ -175,6 +198,18 @@ class HealingOrchestrator:
         'enforce_disclosure',  # Check structure (last)
     ]
 
+    # Where each built-in healer lives: name -> (module, class name).
+    # Modules are only imported when their healer is instantiated.
+    HEALER_REGISTRY: Dict[str, Tuple[str, str]] = {
+        'sync_canonical': ('guardian.healers.sync_canonical', 'SyncCanonicalHealer'),
+        'fix_broken_links': ('guardian.healers.fix_broken_links', 'FixBrokenLinksHealer'),
+        'detect_staleness': ('guardian.healers.detect_staleness', 'DetectStalenessHealer'),
+        'resolve_duplicates': ('guardian.healers.resolve_duplicates', 'ResolveDuplicatesHealer'),
+        'balance_references': ('guardian.healers.balance_references', 'BalanceReferencesHealer'),
+        'manage_collapsed': ('guardian.healers.manage_collapsed', 'ManageCollapsedHealer'),
+        'enforce_disclosure': ('guardian.healers.enforce_disclosure', 'EnforceDisclosureHealer'),
+    }
+
     def __init__(
         self,
         config: Dict,
@@ -211,63 +246,93 @@ class HealingOrchestrator:
         # Discover healers
         self.available_healers = self._discover_healers()
 
+        # Healer instances kept for reuse across runs (see _instantiate_healer)
+        self._healer_instances: Dict[str, HealingSystem] = {}
+
+        # Timestamp shared by the reports of the current run_all() call
+        self._run_timestamp: Optional[str] = None
+
         # Get healer order from config or use default
         self.healer_order = config.get('healer_order', self.DEFAULT_HEALER_ORDER)
 
-    def _discover_healers(self) -> Dict[str, Type[HealingSystem]]:
+    def _discover_healers(self) -> Dict[str, HealerSpec]:
         """
-        Discover available healers from guardian.healers package.
+        Discover available healers enabled in the config.
+
+        Healers are not imported here; see _healer_class().
 
         Returns:
-            Dict mapping healer name to healer class
+            Dict mapping healer name to its (module, class name) registry
+            entry (or to the healer class itself, for subclasses that
+            register classes directly)
         """
-        try:
-            from . import healers
-        except ImportError:
-            from guardian import healers
-
-        healer_map = {
-            'sync_canonical': healers.SyncCanonicalHealer,
-            'fix_broken_links': healers.FixBrokenLinksHealer,
-            'detect_staleness': healers.DetectStalenessHealer,
-            'resolve_duplicates': healers.ResolveDuplicatesHealer,
-            'balance_references': healers.BalanceReferencesHealer,
-            'manage_collapsed': healers.ManageCollapsedHealer,
-            'enforce_disclosure': healers.EnforceDisclosureHealer,
-        }
-
         # Filter by enabled in config
-        enabled_healers = {}
+        enabled_healers: Dict[str, HealerSpec] = {}
         healers_config = self.config.get('healers', {})
 
-        for name, healer_class in healer_map.items():
+        for name, spec in self.HEALER_REGISTRY.items():
             healer_config = healers_config.get(name, {})
             if healer_config.get('enabled', True):  # Default to enabled
-                enabled_healers[name] = healer_class
+                enabled_healers[name] = spec
 
         return enabled_healers
 
+    def _healer_class(self, healer_name: str) -> Optional[Type[HealingSystem]]:
+        """Import (on first use) and return the class for an available healer."""
+        spec = self.available_healers.get(healer_name)
+        if not isinstance(spec, tuple):
+            return spec
+        module_path, class_name = spec
+        healer_class: Type[HealingSystem] = getattr(importlib.import_module(module_path), class_name)
+        return healer_class
+
     def _instantiate_healer(self, healer_name: str) -> Optional[HealingSystem]:
         """
         Create healer instance with configuration.
 
+        Instances of reusable healers are cached, so a check followed by a
+        heal (or repeated runs) does not rebuild their indexes and compiled
+        patterns. Call reset() after changing the config.
+
         Args:
             healer_name: Name of healer to instantiate
 
         Returns:
             HealingSystem instance or None if not available
         """
-        healer_class = self.available_healers.get(healer_name)
-        if not healer_class:
-            return None
+        healer = self._healer_instances.get(healer_name)
+        if healer is not None:
+            healer.errors.clear()
+            return healer
 
         try:
-            return healer_class(self.config)
+            healer_class = self._healer_class(healer_name)
+            if not healer_class:
+                return None
+            healer = healer_class(self.config)
+            healer.stop_event = _shutdown_requested
+            if healer.reusable:
+                healer = self._healer_instances.setdefault(healer_name, healer)
+            return healer
         except Exception as e:
             if self.verbose:
                 print(f"   ❌ Failed to instantiate {healer_name}: {e}")
             return None
 
+    def _healers_to_run(self) -> List[str]:
+        """Healers for run_all(): only_healer, else healer_order filtered by availability."""
+        if self.only_healer:
+            return [self.only_healer]
+        return [name for name in self.healer_order if name in self.available_healers]
+
+    def _timestamp(self) -> str:
+        """Timestamp for orchestrator-built reports: the run's, if one is active."""
+        return self._run_timestamp or datetime.now().isoformat()
+
+    def reset(self) -> None:
+        """Drop cached healer instances (call after changing self.config)."""
+        self._healer_instances.clear()
+
     def run_healer(self, healer_name: str, mode: str) -> HealingReport:
         """
         Run a single healing system.
@@ -286,7 +351,7 @@ class HealingOrchestrator:
             return HealingReport(
                 healer_name=healer_name,
                 mode=mode,
-                timestamp=datetime.now().isoformat(),
+                timestamp=self._timestamp(),
                 issues_found=0,
                 issues_fixed=0,
                 errors=["Skipped by --skip flag"],
@@ -299,7 +364,7 @@ class HealingOrchestrator:
             return HealingReport(
                 healer_name=healer_name,
                 mode=mode,
-                timestamp=datetime.now().isoformat(),
+                timestamp=self._timestamp(),
                 issues_found=0,
                 issues_fixed=0,
                 errors=[f"Healer not available: {healer_name}"],
@@ -321,7 +386,7 @@ class HealingOrchestrator:
             return HealingReport(
                 healer_name=healer_name,
                 mode=mode,
-                timestamp=datetime.now().isoformat(),
+                timestamp=self._timestamp(),
                 issues_found=0,
                 issues_fixed=0,
                 errors=[f"Exception: {str(e)}"],
@@ -339,84 +404,99 @@ class HealingOrchestrator:
             UnifiedReport with aggregated results
         """
         start_time = time.time()
+        self._run_timestamp = datetime.now().isoformat()
         reports = []
 
         if not self.quiet:
             mode_text = bold(f"{mode.upper()}")
             print(f"🔧 Running documentation healing systems ({mode_text} mode)...\n")
 
-        # Determine which healers to run
-        if self.only_healer:
-            healers_to_run = [self.only_healer]
-        else:
-            # Filter order by available healers
-            healers_to_run = [
-                name for name in self.healer_order
-                if name in self.available_healers
-            ]
-
+        healers_to_run = self._healers_to_run()
         total_healers = len(healers_to_run)
 
         # Run healers in order
         for idx, healer_name in enumerate(healers_to_run, 1):
             # Check for shutdown request (Ctrl+C handling)
-            global _shutdown_requested
-            if _shutdown_requested:
+            if _shutdown_requested.is_set():
                 if not self.quiet:
                     print(warning(f"\n⚠️  Shutdown requested, stopping after current operation"))
                 break
 
             if not self.quiet:
-                healer_display = bold(healer_name.replace('_', ' ').title())
+                healer_display = bold(_display_name(healer_name))
                 print(f"▶️  [{idx}/{total_healers}] Running {healer_display}...")
 
             report = self.run_healer(healer_name, mode)
             reports.append(report)
 
-            if self.verbose:
-                if report.has_errors:
-                    print(error(f"   ❌ Failed: {report.errors[0] if report.errors else 'Unknown error'}"))
-                    if len(report.errors) > 1:
-                        print(error(f"      Run with --verbose to see all {len(report.errors)} errors"))
-                elif report.issues_found > 0:
-                    print(warning(f"   ⚠️  Found {report.issues_found} issue(s)"))
-                    if mode == 'heal' and report.issues_fixed > 0:
-                        print(success(f"   ✅ Fixed {report.issues_fixed} issue(s)"))
-                else:
-                    print(success(f"   ✅ No issues ({report.execution_time:.2f}s)"))
-            elif not self.quiet:
-                # Normal mode - just show summary
-                if report.has_errors:
-                    print(error(f"   ❌ Failed"))
-                elif report.issues_found > 0:
-                    if mode == 'heal' and report.issues_fixed > 0:
-                        fixed_pct = (report.issues_fixed / report.issues_found) * 100
-                        print(success(f"   ✅ Fixed {report.issues_fixed}/{report.issues_found} ({fixed_pct:.0f}%)"))
-                    else:
-                        print(warning(f"   ⚠️  {report.issues_found} issue(s)"))
-                else:
-                    print(success(f"   ✅ Clean"))
+            lines = self._format_healer_result(report, mode)
 
             # Stop on error if not continue_on_error
-            if not self.continue_on_error and report.has_errors:
-                if not self.quiet:
-                    print(warning(f"\n⚠️  Stopping due to error in {healer_name}"))
-                    print(info("   Run with --continue-on-error to keep going"))
+            stop = not self.continue_on_error and report.has_errors
+            if stop and not self.quiet:
+                lines.append(warning(f"\n⚠️  Stopping due to error in {healer_name}"))
+                lines.append(info("   Run with --continue-on-error to keep going"))
+
+            _write_lines(lines)
+            if stop:
                 break
 
         # Create unified report
-        total_execution_time = time.time() - start_time
+        return self._create_report(reports, start_time, mode)
+
+    def _create_report(
+        self,
+        reports: List[HealingReport],
+        start_time: float,
+        mode: str
+    ) -> UnifiedReport:
+        """Create unified report from individual healer reports; ends the run."""
+        total_found = total_fixed = 0
+        for report in reports:
+            total_found += report.issues_found
+            total_fixed += report.issues_fixed
+
+        timestamp = self._timestamp()
+        self._run_timestamp = None
 
         return UnifiedReport(
-            timestamp=datetime.now().isoformat(),
+            timestamp=timestamp,
             mode=mode,
-            total_issues_found=sum(r.issues_found for r in reports),
-            total_issues_fixed=sum(r.issues_fixed for r in reports),
+            total_issues_found=total_found,
+            total_issues_fixed=total_fixed,
             healer_reports=reports,
-            execution_time=total_execution_time,
+            execution_time=time.time() - start_time,
             config_path=str(self.config_path) if self.config_path else "unknown"
         )
 
+    def _format_healer_result(self, report: HealingReport, mode: str) -> List[str]:
+        """Progress lines for a finished healer (empty in quiet mode)."""
+        lines = []
+        if self.verbose:
+            if report.has_errors:
+                lines.append(error(f"   ❌ Failed: {report.errors[0] if report.errors else 'Unknown error'}"))
+                if len(report.errors) > 1:
+                    lines.append(error(f"      Run with --verbose to see all {len(report.errors)} errors"))
+            elif report.issues_found > 0:
+                lines.append(warning(f"   ⚠️  Found {report.issues_found} issue(s)"))
+                if mode == 'heal' and report.issues_fixed > 0:
+                    lines.append(success(f"   ✅ Fixed {report.issues_fixed} issue(s)"))
+            else:
+                lines.append(success(f"   ✅ No issues ({report.execution_time:.2f}s)"))
+        elif not self.quiet:
+            # Normal mode - just show summary
+            if report.has_errors:
+                lines.append(error(f"   ❌ Failed"))
+            elif report.issues_found > 0:
+                if mode == 'heal' and report.issues_fixed > 0:
+                    fixed_pct = (report.issues_fixed / report.issues_found) * 100
+                    lines.append(success(f"   ✅ Fixed {report.issues_fixed}/{report.issues_found} ({fixed_pct:.0f}%)"))
+                else:
+                    lines.append(warning(f"   ⚠️  {report.issues_found} issue(s)"))
+            else:
+                lines.append(success(f"   ✅ Clean"))
+        return lines
+
     def list_healers(self) -> str:
         """
         List all available healers in execution order.
@@ -444,31 +524,45 @@ class ParallelHealingOrchestrator(HealingOrchestrator):
     Runs independent healers in parallel while respecting dependencies.
     Uses ThreadPoolExecutor for I/O-bound healers.
 
-    Performance:
-    - Independent healers (fix_broken_links, detect_staleness, manage_collapsed)
-      run in parallel
-    - Dependent healers (sync_canonical, resolve_duplicates, balance_references,
-      enforce_disclosure) run sequentially
+    Scheduling:
+    - In heal mode each healer starts as soon as the healers it depends on
+      (DEPENDENCIES) have finished, rather than waiting for a whole phase
+    - In check mode nothing is written, so all healers start at once
+    - Reports are returned in healer_order regardless of completion order
 
     Thread safety:
-    - Each healer operates on different files (no shared state)
-    - Reports are collected after all parallel tasks complete
+    - Healers that may run together in heal mode operate on different
+      files (no shared state); healers that edit shared content are
+      chained through DEPENDENCIES
+
+    Stopping (an error without continue_on_error, or Ctrl+C) cancels
+    healers that are queued but not yet running. Running healers finish,
+    except that on Ctrl+C they stop applying changes (see
+    HealingSystem.should_stop).
+
+    The worker threads are created on first use and reused by later
+    run_all() calls; call close() (or use the orchestrator as a context
+    manager) to stop them early.
     """
 
-    # Healers that can run in parallel (no interdependencies)
-    PARALLEL_HEALERS = {
-        'fix_broken_links',
-        'detect_staleness',
-        'manage_collapsed',
+    # Healers each healer must wait for in heal mode. A dependency that is
+    # disabled or not selected is replaced by its own dependencies.
+    DEPENDENCIES: Dict[str, Set[str]] = {
+        'sync_canonical': set(),                    # Updates source data
+        'fix_broken_links': {'sync_canonical'},
+        'detect_staleness': {'sync_canonical'},
+        'manage_collapsed': {'sync_canonical'},
+        'resolve_duplicates': {                     # Modifies file content
+            'fix_broken_links',
+            'detect_staleness',
+            'manage_collapsed',
+        },
+        'balance_references': {'resolve_duplicates'},  # Depends on link analysis
+        'enforce_disclosure': {'balance_references'},  # Final checks
     }
 
-    # Healers that must run sequentially (have dependencies or modify shared state)
-    SEQUENTIAL_HEALERS = {
-        'sync_canonical',       # Runs first (updates source data)
-        'resolve_duplicates',   # Modifies file content
-        'balance_references',   # Depends on link analysis
-        'enforce_disclosure',   # Final checks
-    }
+    # Seconds between shutdown-request checks while waiting on healers
+    SHUTDOWN_POLL_INTERVAL = 0.1
 
     def __init__(
         self,
@@ -494,7 +588,8 @@ class ParallelHealingOrchestrator(HealingOrchestrator):
             continue_on_error: Continue running even if a healer fails
             verbose: Show detailed progress
             quiet: Minimal output (errors only)
-            max_workers: Max parallel workers (default: min(cpu_count, 4))
+            max_workers: Max parallel workers (default: usable CPUs, capped
+                at the number of known healers)
         """
         super().__init__(
             config=config,
@@ -507,19 +602,43 @@ class ParallelHealingOrchestrator(HealingOrchestrator):
             quiet=quiet
         )
 
-        # Set max workers
+        # Set max workers (more threads than healers would never be used)
         if max_workers is None:
-            max_workers = min(cpu_count(), 4)
+            max_workers = min(_usable_cpu_count(), len(self.DEPENDENCIES))
         self.max_workers = max_workers
 
+        # Worker pool shared by all run_all() calls, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self) -> 'ParallelHealingOrchestrator':
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker threads (a later run_all() starts new ones)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """The persistent worker pool, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='guardian-healer'
+            )
+        return self._executor
+
     def run_all(self, mode: str = 'check') -> UnifiedReport:
         """
         Run all enabled healing systems with parallel execution where safe.
 
-        Execution order:
-        1. sync_canonical (sequential, first)
-        2. Parallel batch: fix_broken_links, detect_staleness, manage_collapsed
-        3. Sequential batch: resolve_duplicates, balance_references, enforce_disclosure
+        In heal mode a healer is started once every healer it depends on has
+        finished (see DEPENDENCIES); in check mode all healers run at once.
+        Unless continue_on_error is set, no further healers are started
+        after one reports errors (healers already running are finished).
 
         Args:
             mode: 'check' or 'heal'
@@ -528,200 +647,231 @@ class ParallelHealingOrchestrator(HealingOrchestrator):
             UnifiedReport with aggregated results
         """
         start_time = time.time()
-        reports: List[HealingReport] = []
+        self._run_timestamp = datetime.now().isoformat()
 
         if self.verbose:
             print(f"🔧 Running documentation healing systems ({mode} mode, parallel)...\n")
 
-        # Determine which healers to run
         if self.only_healer:
             # Single healer mode - run sequentially
             return super().run_all(mode)
 
-        healers_to_run = [
-            name for name in self.healer_order
-            if name in self.available_healers
-        ]
-
-        # Phase 1: Run sync_canonical first (always sequential)
-        if 'sync_canonical' in healers_to_run:
-            if self.verbose:
-                print(f"▶️  Running sync_canonical (phase 1)...")
-            report = self.run_healer('sync_canonical', mode)
-            reports.append(report)
-            self._print_healer_result(report, mode)
-
-            if not self.continue_on_error and report.has_errors:
-                return self._create_report(reports, start_time, mode)
+        healers_to_run = self._healers_to_run()
 
-        # Phase 2: Run parallel healers
-        parallel_healers = [
-            h for h in healers_to_run
-            if h in self.PARALLEL_HEALERS
-        ]
-
-        if parallel_healers:
-            if self.verbose:
-                print(f"\n▶️  Running parallel healers (phase 2): {', '.join(parallel_healers)}...")
-
-            parallel_reports = self._run_parallel(parallel_healers, mode)
-            reports.extend(parallel_reports)
-
-            # Check for errors
-            if not self.continue_on_error:
-                for report in parallel_reports:
-                    if report.has_errors:
-                        if self.verbose:
-                            print(f"\n⚠️  Stopping due to error in {report.healer_name}")
-                        return self._create_report(reports, start_time, mode)
-
-        # Phase 3: Run sequential healers
-        sequential_healers = [
-            h for h in healers_to_run
-            if h in self.SEQUENTIAL_HEALERS and h != 'sync_canonical'
-        ]
+        # Check mode writes nothing, so every healer runs at once and an
+        # error in one does not cancel the others: which healers were still
+        # queued would depend on max_workers (i.e. the CPU count)
+        dependencies: Dict[str, Set[str]]
+        if mode == 'check':
+            # One shared empty set; _run_parallel only reads it
+            dependencies = dict.fromkeys(healers_to_run, set())
+        else:
+            dependencies = self._effective_dependencies(healers_to_run)
 
-        if sequential_healers:
-            if self.verbose:
-                print(f"\n▶️  Running sequential healers (phase 3)...")
+        reports = self._run_parallel(
+            healers_to_run, mode, dependencies, stop_on_error=(mode != 'check')
+        )
 
-            for healer_name in sequential_healers:
-                global _shutdown_requested
-                if _shutdown_requested:
-                    if self.verbose:
-                        print(f"\n⚠️  Shutdown requested, stopping")
-                    break
+        # Report in execution order, not completion order
+        position = {name: i for i, name in enumerate(healers_to_run)}
+        reports.sort(key=lambda r: position.get(r.healer_name, len(position)))
 
-                if self.verbose:
-                    print(f"▶️  Running {healer_name}...")
+        return self._create_report(reports, start_time, mode)
 
-                report = self.run_healer(healer_name, mode)
-                reports.append(report)
-                self._print_healer_result(report, mode)
+    def _effective_dependencies(self, healer_names: List[str]) -> Dict[str, Set[str]]:
+        """
+        Map each healer to the healers in healer_names it must wait for.
 
-                if not self.continue_on_error and report.has_errors:
-                    break
+        Dependencies outside healer_names are replaced by their own
+        dependencies, so disabling a healer never lets its dependents jump
+        ahead of what it was waiting for. Healers missing from DEPENDENCIES
+        wait for every healer listed before them.
+        """
+        selected = set(healer_names)
+        result: Dict[str, Set[str]] = {}
+
+        for idx, name in enumerate(healer_names):
+            if name not in self.DEPENDENCIES:
+                result[name] = set(healer_names[:idx])
+                continue
+
+            deps: Set[str] = set()
+            pending = list(self.DEPENDENCIES[name])
+            seen: Set[str] = set()
+            while pending:
+                dep = pending.pop()
+                if dep in seen:
+                    continue
+                seen.add(dep)
+                if dep in selected:
+                    deps.add(dep)
+                else:
+                    pending.extend(self.DEPENDENCIES.get(dep, ()))
+            result[name] = deps
 
-        return self._create_report(reports, start_time, mode)
+        return result
 
-    def _run_parallel(self, healer_names: List[str], mode: str) -> List[HealingReport]:
+    def _run_parallel(
+        self,
+        healer_names: List[str],
+        mode: str,
+        dependencies: Optional[Dict[str, Set[str]]] = None,
+        stop_on_error: bool = True
+    ) -> List[HealingReport]:
         """
-        Run healers in parallel using ThreadPoolExecutor.
+        Run healers on the worker pool, each once its dependencies finish.
 
         Args:
             healer_names: List of healer names to run
             mode: 'check' or 'heal'
+            dependencies: Healers each healer must wait for (default: none)
+            stop_on_error: Cancel queued healers after one reports errors
+                (unless continue_on_error is set)
 
         Returns:
-            List of HealingReport objects
+            List of HealingReport objects, in completion order
         """
         reports: List[HealingReport] = []
 
-        # Use ThreadPoolExecutor for I/O-bound healers
-        # (ProcessPoolExecutor has pickle issues with complex objects)
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all healers
-            future_to_healer = {
-                executor.submit(self.run_healer, name, mode): name
-                for name in healer_names
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_healer):
-                healer_name = future_to_healer[future]
-                try:
-                    report = future.result()
-                    reports.append(report)
-                    self._print_healer_result(report, mode)
-                except Exception as e:
-                    # Create error report for failed healer
-                    report = HealingReport(
-                        healer_name=healer_name,
-                        mode=mode,
-                        timestamp=datetime.now().isoformat(),
-                        issues_found=0,
-                        issues_fixed=0,
-                        errors=[f"Parallel execution failed: {str(e)}"],
-                        execution_time=0.0
-                    )
-                    reports.append(report)
+        if dependencies is None:
+            dependencies = {}
+        indegree = dict.fromkeys(healer_names, 0)
+        children: Dict[str, List[str]] = {name: [] for name in healer_names}
+        for name in healer_names:
+            for dep in dependencies.get(name, ()):
+                if dep in children:
+                    indegree[name] += 1
+                    children[dep].append(name)
+
+        # Use threads for I/O-bound healers. Worker processes would have
+        # to pickle healers and would share the parent's git helper
+        # processes (persistent cat-file pipes) after a fork.
+        executor = self._get_executor()
+        future_to_healer = {}
+        stopping = False
+
+        def submit_ready(names: List[str]) -> None:
+            for name in names:
+                if indegree[name] == 0:
                     if self.verbose:
-                        print(f"   ❌ {healer_name} failed: {e}")
+                        print(f"▶️  Running {name}...")
+                    future_to_healer[executor.submit(self.run_healer, name, mode)] = name
+
+        submit_ready(healer_names)
+
+        def stop(message: str) -> None:
+            # Queued healers never start; running ones are waited for
+            # (on shutdown they stop at their next should_stop() check)
+            for pending in future_to_healer:
+                pending.cancel()
+            if self.verbose:
+                print(message)
+
+        try:
+            while future_to_healer:
+                # Time out periodically so a shutdown request is noticed
+                # while healers are still running
+                done, _ = wait(
+                    future_to_healer,
+                    timeout=self.SHUTDOWN_POLL_INTERVAL,
+                    return_when=FIRST_COMPLETED
+                )
+                if not stopping and _shutdown_requested.is_set():
+                    stopping = True
+                    stop(f"\n⚠️  Shutdown requested, stopping")
+
+                for future in done:
+                    healer_name = future_to_healer.pop(future)
+                    if future.cancelled():
+                        continue
+                    try:
+                        report = future.result()
+                        self._print_healer_result(report, mode)
+                    except Exception as e:
+                        # Create error report for failed healer
+                        report = HealingReport(
+                            healer_name=healer_name,
+                            mode=mode,
+                            timestamp=self._timestamp(),
+                            issues_found=0,
+                            issues_fixed=0,
+                            errors=[f"Parallel execution failed: {str(e)}"],
+                            execution_time=0.0
+                        )
+                        if self.verbose:
+                            print(f"   ❌ {healer_name} failed: {e}")
+                    reports.append(report)
+
+                    if (not stopping and stop_on_error and report.has_errors
+                            and not self.continue_on_error):
+                        stopping = True
+                        stop(f"\n⚠️  Stopping due to error in {healer_name}")
+
+                    if stopping:
+                        continue
+                    for child in children[healer_name]:
+                        indegree[child] -= 1
+                    submit_ready(children[healer_name])
+        except BaseException:
+            # Forced exit (second Ctrl+C) or an unexpected error: drop
+            # queued healers so they do not start after we return
+            for pending in future_to_healer:
+                pending.cancel()
+            raise
 
         return reports
 
-    def _print_healer_result(self, report: HealingReport, mode: str):
+    def _print_healer_result(self, report: HealingReport, mode: str) -> None:
         """Print healer result if verbose."""
         if not self.verbose:
             return
 
         if report.has_errors:
-            print(f"   ❌ {report.healer_name}: Failed - {report.errors}")
+            lines = [f"   ❌ {report.healer_name}: Failed - {report.errors}"]
         elif report.issues_found > 0:
-            print(f"   ⚠️  {report.healer_name}: Found {report.issues_found} issues")
+            lines = [f"   ⚠️  {report.healer_name}: Found {report.issues_found} issues"]
             if mode == 'heal' and report.issues_fixed > 0:
-                print(f"   ✅ {report.healer_name}: Fixed {report.issues_fixed} issues")
+                lines.append(f"   ✅ {report.healer_name}: Fixed {report.issues_fixed} issues")
         else:
-            print(f"   ✅ {report.healer_name}: No issues ({report.execution_time:.2f}s)")
-
-    def _create_report(
-        self,
-        reports: List[HealingReport],
-        start_time: float,
-        mode: str
-    ) -> UnifiedReport:
-        """Create unified report from individual healer reports."""
-        return UnifiedReport(
-            timestamp=datetime.now().isoformat(),
-            mode=mode,
-            total_issues_found=sum(r.issues_found for r in reports),
-            total_issues_fixed=sum(r.issues_fixed for r in reports),
-            healer_reports=reports,
-            execution_time=time.time() - start_time,
-            config_path=str(self.config_path) if self.config_path else "unknown"
-        )
+            lines = [f"   ✅ {report.healer_name}: No issues ({report.execution_time:.2f}s)"]
+        _write_lines(lines)
 
 
-def load_config(config_path: Path, validate: bool = False) -> Dict:
+def load_config(config_path: Path, validate: bool = False, use_sidecar: bool = False) -> Dict:
     """
-    Load configuration from YAML or TOML file.
+    Load configuration from YAML, TOML or JSON file.
+
+    Parsing is done by config_validator.parse_config_file, the same parser
+    validate_and_load_config uses. Parsed configs are cached until the
+    file's mtime or size changes (the cache is shared with
+    validate_and_load_config; see clear_config_cache).
+    Every call returns a fresh deep copy, so callers may modify it.
+
+    With use_sidecar, the parsed config is also stored next to the source
+    as "<name>.cache.json" (see config_validator.load_cached_config).
 
     Args:
         config_path: Path to config file
         validate: If True, run full validation (use load_config_validated instead)
+        use_sidecar: Read/write a JSON sidecar cache next to the config
 
     Returns:
         Configuration dictionary
 
     Raises:
-        ValueError: If file format is not supported or file doesn't exist
+        ValueError: If file format is not supported, the file doesn't exist
+            or it has a syntax error (ConfigParseError)
     """
-    if not config_path.exists():
-        raise ValueError(f"Config file not found: {config_path}")
-
-    suffix = config_path.suffix.lower()
-
-    if suffix in ['.yaml', '.yml']:
-        if not YAML_AVAILABLE:
-            raise ValueError("YAML support not available. Install PyYAML: pip install pyyaml")
-
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-
-    elif suffix == '.toml':
-        if not TOML_AVAILABLE:
-            raise ValueError("TOML support not available. Install toml: pip install toml")
-
-        with open(config_path, 'rb') as f:
-            config = tomllib.load(f)
-
-    else:
-        raise ValueError(f"Unsupported config format: {suffix}. Use .yaml, .yml, or .toml")
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        raise ValueError(f"Config file not found: {config_path}") from None
 
+    config: Dict = load_cached_config(config_path, st, use_sidecar)
     return config
 
 
-def load_config_validated(config_path: Path) -> Tuple[Dict, ValidationResult]:
+def load_config_validated(config_path: Path, use_sidecar: bool = False) -> Tuple[Dict, ValidationResult]:
     """
     Load and validate configuration file.
 
@@ -733,6 +883,7 @@ def load_config_validated(config_path: Path) -> Tuple[Dict, ValidationResult]:
 
     Args:
         config_path: Path to config file (YAML, TOML, or JSON)
+        use_sidecar: Read/write a JSON sidecar cache next to the config
 
     Returns:
         Tuple of (config_dict, validation_result)
@@ -750,10 +901,10 @@ def load_config_validated(config_path: Path) -> Tuple[Dict, ValidationResult]:
         for warning in result.warnings:
             print(f"Warning: {warning}")
     """
-    return validate_and_load_config(config_path)
+    return validate_and_load_config(config_path, use_sidecar=use_sidecar)
 
 
-def print_summary_box(unified_report: UnifiedReport):
+def print_summary_box(unified_report: UnifiedReport) -> None:
     """
     Print enhanced summary box with color and formatting.
 
@@ -764,14 +915,13 @@ def print_summary_box(unified_report: UnifiedReport):
 
     # Add healer results
     for report in unified_report.healer_reports:
+        name = _display_name(report.healer_name)
         if report.has_errors:
             status = error("❌")
-            name = report.healer_name.replace('_', ' ').title()
             result = error("Failed")
             lines.append(f"  {status} {name:30} {result}")
         elif report.issues_found == 0:
             status = success("✓")
-            name = report.healer_name.replace('_', ' ').title()
             result = success("Clean")
             lines.append(f"  {status} {name:30} {result}")
         else:
@@ -783,7 +933,6 @@ def print_summary_box(unified_report: UnifiedReport):
             else:
                 status = error("⚠")
 
-            name = report.healer_name.replace('_', ' ').title()
             result = f"{report.issues_fixed}/{report.issues_found} issues fixed ({fixed_pct}%)"
 
             if fixed_pct == 100:
@@ -842,7 +991,7 @@ def generate_markdown_report(unified_report: UnifiedReport) -> str:
 
     for report in unified_report.healer_reports:
         status = "❌" if report.has_errors else "✅" if report.issues_found == 0 else "⚠️"
-        lines.append(f"### {status} {report.healer_name.replace('_', ' ').title()}\n\n")
+        lines.append(f"### {status} {_display_name(report.healer_name)}\n\n")
 
         if report.has_errors:
             lines.append("- **Status**: ❌ Failed\n")
@@ -873,7 +1022,36 @@ def generate_markdown_report(unified_report: UnifiedReport) -> str:
     return ''.join(lines)
 
 
-def main():
+def generate_json_report(unified_report: UnifiedReport) -> Dict:
+    """
+    Generate JSON-serializable report from unified results.
+
+    Args:
+        unified_report: UnifiedReport instance
+
+    Returns:
+        Dict with run metadata, a summary and one entry per healer (in the
+        format of guardian.core.reporting.generate_json_report)
+    """
+    return {
+        "mode": unified_report.mode,
+        "timestamp": unified_report.timestamp,
+        "config_path": unified_report.config_path,
+        "execution_time": unified_report.execution_time,
+        "summary": {
+            "healers_run": len(unified_report.healer_reports),
+            "issues_found": unified_report.total_issues_found,
+            "issues_fixed": unified_report.total_issues_fixed,
+            "success_rate": unified_report.success_rate
+        },
+        "healers": [
+            generate_healer_json_report(report)
+            for report in unified_report.healer_reports
+        ]
+    }
+
+
+def main() -> None:
     """Main CLI entry point"""
     import argparse
 
@@ -960,7 +1138,7 @@ Examples:
         '--max-workers',
         type=int,
         default=None,
-        help='Max parallel workers (default: min(cpu_count, 4))'
+        help='Max parallel workers (default: usable CPUs, at most one per healer)'
     )
 
     parser.add_argument(
@@ -975,6 +1153,12 @@ Examples:
         help='Path to write report (default: from config or stdout only)'
     )
 
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Write the report as JSON (to --output, or stdout if no output path; implies --quiet on stdout)'
+    )
+
     parser.add_argument(
         '--validate-only',
         action='store_true',
@@ -987,12 +1171,18 @@ Examples:
         help='Show what would be done without making changes'
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the parsed config cache (<config>.cache.json)'
+    )
+
     args = parser.parse_args()
 
     # Load and validate configuration using comprehensive validator
     # This addresses all 8 CRITICAL issues from CONFIG_VALIDATION_AUDIT.md
     try:
-        config, validation_result = load_config_validated(args.config)
+        config, validation_result = load_config_validated(args.config, use_sidecar=not args.no_cache)
     except FileNotFoundError as e:
         print(f"ERROR: Config file not found: {args.config}", file=sys.stderr)
         sys.exit(1)
@@ -1035,7 +1225,21 @@ Examples:
         print(color_error("ERROR: --verbose and --quiet are mutually exclusive"), file=sys.stderr)
         sys.exit(1)
 
+    # Report destination: --output, else the configured output_dir
+    report_name = 'healing_report.json' if args.json else 'healing_report.md'
+    output_path = args.output
+    if not output_path:
+        output_dir = config.get('reporting', {}).get('output_dir')
+        if output_dir:
+            output_path = Path(output_dir) / report_name
+
+    # A JSON report on stdout must be the only thing there
+    if args.json and not output_path:
+        args.quiet = True
+        args.verbose = False
+
     # Create orchestrator (parallel or sequential)
+    orchestrator: HealingOrchestrator
     if args.parallel:
         orchestrator = ParallelHealingOrchestrator(
             config=config,
@@ -1082,28 +1286,25 @@ Examples:
         print()  # Add blank line
         print_summary_box(unified_report)
 
-    # Generate markdown report (always generate for file output, conditionally print)
-    report_markdown = generate_markdown_report(unified_report)
+    # Generate report (always generate for file output, conditionally print)
+    if args.json:
+        report_text = dumps_json(generate_json_report(unified_report))
+    else:
+        report_text = generate_markdown_report(unified_report)
 
-    # Only print full markdown if verbose or if saving to file
-    if args.verbose:
-        print("\n" + report_markdown)
+        # Only print full markdown if verbose or if saving to file
+        if args.verbose:
+            print("\n" + report_text)
 
     # Save report if requested or configured
-    output_path = args.output
-    if not output_path:
-        # Get from config
-        reporting_config = config.get('reporting', {})
-        output_dir = reporting_config.get('output_dir')
-        if output_dir:
-            output_path = Path(output_dir) / 'healing_report.md'
-
     if output_path:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, 'w') as f:
-            f.write(report_markdown)
+            f.write(report_text)
         if not args.quiet:
             print(success(f"📄 Report saved to {output_path}"))
+    elif args.json:
+        print(report_text)
 
     # Exit code for strict mode
     if args.strict and unified_report.total_issues_found > 0:
@@ -4,13 +4,42 @@ Doc Guardian Healers
 Collection of universal healers for maintaining documentation quality.
 """
 
-from .manage_collapsed import ManageCollapsedHealer
-from .fix_broken_links import FixBrokenLinksHealer
-from .detect_staleness import DetectStalenessHealer
-from .resolve_duplicates import ResolveDuplicatesHealer
-from .balance_references import BalanceReferencesHealer
-from .sync_canonical import SyncCanonicalHealer
-from .enforce_disclosure import EnforceDisclosureHealer
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .manage_collapsed import ManageCollapsedHealer
+    from .fix_broken_links import FixBrokenLinksHealer
+    from .detect_staleness import DetectStalenessHealer
+    from .resolve_duplicates import ResolveDuplicatesHealer
+    from .balance_references import BalanceReferencesHealer
+    from .sync_canonical import SyncCanonicalHealer
+    from .enforce_disclosure import EnforceDisclosureHealer
+
+# Healer classes are imported on first access, so using one healer does
+# not import the other six
+_HEALER_MODULES = {
+    'ManageCollapsedHealer': 'manage_collapsed',
+    'FixBrokenLinksHealer': 'fix_broken_links',
+    'DetectStalenessHealer': 'detect_staleness',
+    'ResolveDuplicatesHealer': 'resolve_duplicates',
+    'BalanceReferencesHealer': 'balance_references',
+    'SyncCanonicalHealer': 'sync_canonical',
+    'EnforceDisclosureHealer': 'enforce_disclosure',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _HEALER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     'ManageCollapsedHealer',
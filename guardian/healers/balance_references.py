@@ -591,6 +591,8 @@ class BalanceReferencesHealer(HealingSystem):
         issues_fixed = 0
 
         for change in check_report.changes:
+            if self.should_stop():
+                break
             if change.confidence >= threshold:
                 # Reconstruct MissingBacklink for backlink_adder
                 # (We need this because Change doesn't preserve all metadata)
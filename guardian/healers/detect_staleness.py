@@ -173,6 +173,9 @@ class DetectStalenessHealer(HealingSystem):
         healers.detect_staleness.exclude_dirs: Directories to skip during scanning
     """
 
+    # Statistics lists and the git timestamp cache accumulate across runs
+    reusable = False
+
     def __init__(self, config: Dict):
         super().__init__(config)
 
@@ -204,6 +207,9 @@ class DetectStalenessHealer(HealingSystem):
                 )
             self.timestamp_patterns.append(pattern)
 
+        # Compiled once; extract_timestamp() runs them against every line
+        self._timestamp_regexes = [re.compile(p) for p in self.timestamp_patterns]
+
         # Staleness threshold in days
         self.staleness_threshold = healer_config.get('staleness_threshold_days', 30)
 
@@ -261,7 +267,8 @@ class DetectStalenessHealer(HealingSystem):
                 pattern, message, confidence, suggestion
 
         Returns:
-            List of pattern dicts with compiled regex and suggestion callables
+            List of pattern dicts with the pattern string, its compiled regex
+            and suggestion callables
 
         Raises:
             RegexSecurityError: If any pattern is potentially dangerous
@@ -347,6 +354,7 @@ class DetectStalenessHealer(HealingSystem):
 
             patterns.append({
                 "pattern": pattern,
+                "regex": re.compile(pattern),
                 "message": message,
                 "confidence": confidence,
                 "suggestion": suggestion_fn
@@ -379,8 +387,8 @@ class DetectStalenessHealer(HealingSystem):
         lines = content.split('\n')
 
         for i, line in enumerate(lines, 1):
-            for pattern in self.timestamp_patterns:
-                match = re.search(pattern, line)
+            for regex in self._timestamp_regexes:
+                match = regex.search(line)
                 if match:
                     date_str = match.group(1).split()[0]  # Get just the date part
                     try:
@@ -462,8 +470,7 @@ class DetectStalenessHealer(HealingSystem):
 
             # Check each pattern
             for stale_pattern in self.deprecated_patterns:
-                pattern = stale_pattern["pattern"]
-                matches = re.finditer(pattern, line)
+                matches = stale_pattern["regex"].finditer(line)
 
                 for match in matches:
                     # Extract context around match
@@ -533,9 +540,8 @@ class DetectStalenessHealer(HealingSystem):
 
                 # Replace just the date part, preserving format
                 new_line = old_line
-                for pattern in self.timestamp_patterns:
-                    new_line = re.sub(
-                        pattern,
+                for regex in self._timestamp_regexes:
+                    new_line = regex.sub(
                         lambda m: m.group(0).replace(m.group(1).split()[0], new_date_str),
                         old_line
                     )
@@ -630,6 +636,8 @@ class DetectStalenessHealer(HealingSystem):
 
         # Apply changes file by file
         for file_path, file_changes in changes_by_file.items():
+            if self.should_stop():
+                break
             try:
                 content = file_path.read_text(encoding='utf-8')
                 lines = content.split('\n')
@@ -285,6 +285,8 @@ class EnforceDisclosureHealer(HealingSystem):
 
         applied_changes = []
         for change in high_confidence_changes:
+            if self.should_stop():
+                break
             if self.validate_change(change):
                 if self._apply_disclosure_change(change):
                     applied_changes.append(change)
@@ -27,6 +27,7 @@ Performance:
     - Levenshtein calculations cached for repeated comparisons
 """
 
+import io
 import re
 import signal
 from pathlib import Path
@@ -62,6 +63,11 @@ MAX_SYMLINK_DEPTH = 10
 # Maximum line length to process (DC-10)
 MAX_LINE_LENGTH = 100000
 
+# Regex constructs whose meaning depends on line boundaries beyond ^ and $
+# (anchors, lookarounds, conditionals). Link patterns using them are only
+# matched line by line, never against the whole file.
+_LINE_SENSITIVE_RE = re.compile(r'\(\?[=!<(]|\\[AZz]')
+
 
 class RegexConfigError(ValueError):
     """Raised when regex pattern in config is invalid (CFG-05)."""
@@ -168,7 +174,7 @@ class FileIndex:
         # Build index
         self._build_index()
 
-    def _build_index(self):
+    def _build_index(self) -> None:
         """Build index from file tree (O(n) one-time cost)."""
         for file_path in self.root.rglob("*"):
             # Skip directories
@@ -318,6 +324,11 @@ class LinkExtractor:
             raise RegexConfigError(
                 f"Invalid link_pattern regex: '{link_pattern}'. Error: {e}"
             ) from e
+        # Whole-file prefilter: a file where the pattern matches nowhere
+        # has no links, so its lines need not be scanned one by one
+        self._file_prefilter = None
+        if not _LINE_SENSITIVE_RE.search(link_pattern):
+            self._file_prefilter = re.compile(link_pattern, re.MULTILINE)
         self._logger = logger
         self._errors: List[str] = []
 
@@ -363,42 +374,51 @@ class LinkExtractor:
                 return links
 
             with open(resolved_path, encoding='utf-8', errors='replace') as f:
-                in_code_block = False
-                for line_num, line in enumerate(f, 1):
-                    # Skip extremely long lines (DC-10)
-                    if len(line) > MAX_LINE_LENGTH:
-                        error_msg = f"Line {line_num} in {file_path} exceeds max length ({len(line)} > {MAX_LINE_LENGTH})"
+                content = f.read()
+
+            # Fast path: short files (no line can exceed MAX_LINE_LENGTH)
+            # without a single match anywhere
+            if (self._file_prefilter is not None
+                    and len(content) <= MAX_LINE_LENGTH
+                    and not self._file_prefilter.search(content)):
+                return links
+
+            in_code_block = False
+            for line_num, line in enumerate(io.StringIO(content), 1):
+                # Skip extremely long lines (DC-10)
+                if len(line) > MAX_LINE_LENGTH:
+                    error_msg = f"Line {line_num} in {file_path} exceeds max length ({len(line)} > {MAX_LINE_LENGTH})"
+                    self._errors.append(error_msg)
+                    if self._logger:
+                        self._logger.warning(error_msg)
+                    continue
+
+                # Track code block state
+                if line.strip().startswith('```'):
+                    in_code_block = not in_code_block
+                    continue
+
+                # Skip links in code blocks
+                if in_code_block:
+                    continue
+
+                for match in self.LINK_PATTERN.finditer(line):
+                    # Security: Limit links per file (DG-2026-006)
+                    if len(links) >= MAX_LINKS_PER_FILE:
+                        error_msg = f"Link limit reached in {file_path} (max {MAX_LINKS_PER_FILE})"
                         self._errors.append(error_msg)
                         if self._logger:
                             self._logger.warning(error_msg)
-                        continue
-
-                    # Track code block state
-                    if line.strip().startswith('```'):
-                        in_code_block = not in_code_block
-                        continue
-
-                    # Skip links in code blocks
-                    if in_code_block:
-                        continue
-
-                    for match in self.LINK_PATTERN.finditer(line):
-                        # Security: Limit links per file (DG-2026-006)
-                        if len(links) >= MAX_LINKS_PER_FILE:
-                            error_msg = f"Link limit reached in {file_path} (max {MAX_LINKS_PER_FILE})"
-                            self._errors.append(error_msg)
-                            if self._logger:
-                                self._logger.warning(error_msg)
-                            return links
-
-                        text, target = match.groups()
-                        links.append(Link(
-                            file=file_path,
-                            line_num=line_num,
-                            text=text,
-                            target=target,
-                            full_match=match.group(0)
-                        ))
+                        return links
+
+                    text, target = match.groups()
+                    links.append(Link(
+                        file=file_path,
+                        line_num=line_num,
+                        text=text,
+                        target=target,
+                        full_match=match.group(0)
+                    ))
         except PermissionError as e:
             error_msg = f"Permission denied reading {file_path}: {e}"
             self._errors.append(error_msg)
@@ -561,7 +581,7 @@ class LinkFixer:
     @property
     def file_index(self) -> FileIndex:
         """Get or build file index lazily."""
-        if not self._index_built:
+        if not self._index_built or self._file_index is None:
             self._file_index = FileIndex(
                 self.project_root,
                 self.file_extensions,
@@ -570,6 +590,11 @@ class LinkFixer:
             self._index_built = True
         return self._file_index
 
+    def reset_index(self) -> None:
+        """Drop the file index so the next lookup rebuilds it from disk."""
+        self._file_index = None
+        self._index_built = False
+
     def levenshtein_distance(self, s1: str, s2: str) -> int:
         """
         Calculate Levenshtein distance between two strings.
@@ -836,6 +861,9 @@ class FixBrokenLinksHealer(HealingSystem):
         """
         start_time = time.time()
 
+        # The healer is reused across runs; index the tree as it is now
+        self.fixer.reset_index()
+
         # Extract all links from markdown files
         all_links = self.extractor.extract_from_tree(
             self.doc_root,
@@ -912,6 +940,8 @@ class FixBrokenLinksHealer(HealingSystem):
         # Apply each change
         applied_changes: List[Change] = []
         for change in changes_to_apply:
+            if self.should_stop():
+                break
             if self.validate_change(change):
                 if self.apply_change(change):
                     applied_changes.append(change)
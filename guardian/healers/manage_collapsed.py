@@ -461,6 +461,9 @@ class ManageCollapsedHealer(HealingSystem):
         # Apply changes
         applied = []
         for change in changes_to_apply:
+            if self.should_stop():
+                break
+
             # Skip changes with no fix (e.g., unused sections needing manual review)
             if not change.old_content and not change.new_content:
                 continue
@@ -47,7 +47,7 @@ import hashlib
 import logging
 
 from ..core.base import HealingSystem, HealingReport, Change
-from ..core.file_cache import get_file_cache, simhash, hamming_distance
+from ..core.file_cache import get_file_cache, simhash_batch, hamming_distance
 
 
 # Maximum file size for in-memory processing (RT-01)
@@ -514,8 +514,8 @@ class FastDuplicationDetector:
         Returns:
             List of Duplication objects
         """
-        # Phase 1: Extract blocks with SimHash (streaming)
-        blocks_with_hash: List[Tuple[ContentBlock, int]] = []
+        # Phase 1: Extract blocks (streaming), then SimHash them as one batch
+        candidate_blocks: List[ContentBlock] = []
         file_cache = get_file_cache()
 
         for file_path in files:
@@ -523,19 +523,23 @@ class FastDuplicationDetector:
                 blocks = self.extractor.extract_all_blocks(file_path)
                 for block in blocks:
                     if len(block.content) >= self.min_block_size:
-                        # Compute SimHash
-                        block_hash = simhash(block.content)
-                        blocks_with_hash.append((block, block_hash))
+                        candidate_blocks.append(block)
 
                         # Memory bound
-                        if len(blocks_with_hash) >= self.max_blocks:
+                        if len(candidate_blocks) >= self.max_blocks:
                             break
             except Exception:
                 continue
 
-            if len(blocks_with_hash) >= self.max_blocks:
+            if len(candidate_blocks) >= self.max_blocks:
                 break
 
+        # Batch hashing shares token hashes across all blocks
+        block_hashes = simhash_batch([block.content for block in candidate_blocks])
+        blocks_with_hash: List[Tuple[ContentBlock, int]] = list(
+            zip(candidate_blocks, block_hashes)
+        )
+
         # Phase 2: Build hash buckets using LSH
         # We use band hashing: split the 64-bit hash into bands
         # Blocks matching in any band are candidates
@@ -830,6 +834,9 @@ class ResolveDuplicatesHealer(HealingSystem):
         applied_changes = []
 
         for file_path, file_changes in changes_by_file.items():
+            if self.should_stop():
+                break
+
             # Sort by line number (reverse order - bottom to top)
             # This way earlier changes don't affect later line numbers
             file_changes.sort(key=lambda c: c.line, reverse=True)
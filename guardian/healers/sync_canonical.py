@@ -480,6 +480,9 @@ class SyncCanonicalHealer(HealingSystem):
         context_builder: Optional Python path to context builder function
     """
 
+    # The canonical source is loaded once per instance and never re-read
+    reusable = False
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize sync canonical healer.
@@ -667,6 +670,8 @@ class SyncCanonicalHealer(HealingSystem):
 
         # Apply each change
         for change in changes_to_apply:
+            if self.should_stop():
+                break
             if self._apply_sync_change(change):
                 applied_changes.append(change)
 
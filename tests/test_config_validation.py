@@ -20,6 +20,7 @@ from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from guardian.core import config_validator
 from guardian.core.config_validator import (
     ConfigError,
     ConfigValidationError,
@@ -34,6 +35,7 @@ from guardian.core.config_validator import (
     safe_read_file,
     validate_and_load_config,
     load_config_strict,
+    clear_config_cache,
     MAX_FILE_SIZE,
     MAX_PATTERN_LENGTH,
     MAX_ARRAY_SIZE,
@@ -64,6 +66,16 @@ class TestPathTraversalPrevention:
             validate_path_traversal(Path("/etc"), tmp_path, "test.path")
         assert "escapes project root" in str(exc_info.value)
 
+    def test_empty_root_still_checks_doc_root(self, tmp_path, monkeypatch):
+        """An empty project.root is the current directory, not a skipped check."""
+        monkeypatch.chdir(tmp_path)
+        config = {"project": {"root": "", "doc_root": str(tmp_path.parent)}}
+
+        result = validate_config_schema(config, Path("."))
+
+        assert not result.is_valid
+        assert any("escapes project root" in e for e in result.errors)
+
 
 class TestNumericRangeValidation:
     """Test CRITICAL fix #2: Numeric range validation."""
@@ -490,6 +502,21 @@ class TestConfigValidationEdgeCases:
         assert not result.is_valid
         assert any("source_file" in e.lower() for e in result.errors)
 
+    def test_sync_canonical_null_byte_source_file(self, tmp_path):
+        """HS-004: A null byte in source_file is reported, not raised."""
+        config = {
+            "project": {"root": str(tmp_path), "doc_root": str(tmp_path)},
+            "healers": {
+                "sync_canonical": {
+                    "enabled": True,
+                    "source_file": "data\x00.json"
+                }
+            }
+        }
+        result = validate_config_schema(config)
+        assert not result.is_valid
+        assert any("null byte" in e.lower() for e in result.errors)
+
     def test_manage_collapsed_invalid_strategy(self, tmp_path):
         """HS-002: Invalid hint_strategy should be rejected."""
         config = {
@@ -539,6 +566,15 @@ class TestConfigValidationEdgeCases:
         with pytest.raises(ConfigValidationError):
             result.raise_if_invalid()
 
+    def test_validation_result_deferred_errors(self):
+        """EM-003: Deferred errors are counted without formatting and rendered on access."""
+        config = {"project": {"root": ".", "doc_root": "docs", "excluded_dirs": [42]}}
+        result = validate_config_schema(config, check_paths=False)
+        assert result.error_count == 1
+        assert result.errors == [
+            "[project.excluded_dirs[0]] Must be string, got int | Suggestion: Use string values in list"
+        ]
+
 
 class TestConfigFileLoading:
     """Test config file loading and validation."""
@@ -627,6 +663,46 @@ name = "test"
             load_config_strict(config_file)
         assert len(exc_info.value.errors) > 0
 
+    def test_unchanged_file_parsed_once(self, tmp_path, monkeypatch):
+        """Repeated loads of an unchanged file reuse the parsed config."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('[project]\nroot = "."\ndoc_root = "docs/"\n')
+        (tmp_path / "docs").mkdir()
+        clear_config_cache()
+
+        parses = []
+        original = config_validator.parse_config_file
+
+        def counting_parse(path):
+            parses.append(path)
+            return original(path)
+
+        monkeypatch.setattr(config_validator, "parse_config_file", counting_parse)
+
+        first, _ = validate_and_load_config(config_file)
+        first["project"]["root"] = "changed"
+        second, _ = validate_and_load_config(config_file)
+
+        assert parses == [config_file]
+        assert second["project"]["root"] == "."
+
+    def test_cached_config_revalidated(self, tmp_path):
+        """Validation still runs on a cache hit, so removed paths are reported."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text(
+            f'[project]\nroot = "{tmp_path.as_posix()}"\ndoc_root = "{tmp_path.as_posix()}"\n\n'
+            '[healers.sync_canonical]\nsource_file = "data.json"\n'
+        )
+        (tmp_path / "data.json").write_text("{}")
+        clear_config_cache()
+
+        assert validate_and_load_config(config_file)[1].is_valid
+
+        (tmp_path / "data.json").unlink()
+
+        _, result = validate_and_load_config(config_file)
+        assert any("does not exist" in e for e in result.errors)
+
 
 class TestConfigValidationIntegration:
     """Integration tests for complete config validation workflow."""
@@ -0,0 +1,165 @@
+"""
+Test suite for core security utilities.
+
+Covers:
+1. File size validation
+2. Bulk file size validation
+3. Module whitelist
+4. Git path safety
+5. Error message sanitization
+"""
+
+import os
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from guardian.core.security import (
+    ALLOWED_CONTEXT_BUILDER_MODULES,
+    is_allowed_module,
+    safe_git_path,
+    sanitize_error_message,
+    validate_file_size,
+    validate_file_sizes_bulk,
+    validate_git_path,
+    validate_module_path,
+)
+
+
+class TestValidateFileSize:
+    """Test validate_file_size."""
+
+    def test_within_limit(self, tmp_path):
+        """Files at or below the limit are valid."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("x" * 10)
+
+        assert validate_file_size(doc, max_size=10) == (True, None)
+
+    def test_too_large(self, tmp_path):
+        """Files above the limit are rejected with their size."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("x" * 11)
+
+        is_valid, error = validate_file_size(doc, max_size=10)
+        assert not is_valid
+        assert "11 bytes" in error
+
+    def test_missing_file_passes(self, tmp_path):
+        """Missing files are left for the caller's read to report."""
+        assert validate_file_size(tmp_path / "missing.md") == (True, None)
+        assert validate_file_size(tmp_path / "missing" / "doc.md") == (True, None)
+
+
+class TestValidateFileSizesBulk:
+    """Test validate_file_sizes_bulk."""
+
+    def test_matches_single_file_results(self, tmp_path):
+        """Bulk results equal validate_file_size for every path."""
+        (tmp_path / "sub").mkdir()
+        paths = [
+            tmp_path / "small.md",
+            tmp_path / "big.md",
+            tmp_path / "missing.md",
+            tmp_path / "sub" / "only.md",
+            tmp_path / "nodir" / "a.md",
+            tmp_path / "nodir" / "b.md",
+        ]
+        paths[0].write_text("x" * 5)
+        paths[1].write_text("x" * 50)
+        paths[3].write_text("x" * 20)
+
+        results = validate_file_sizes_bulk(paths, max_size=10)
+
+        assert results == {p: validate_file_size(p, max_size=10) for p in paths}
+        assert not results[paths[1]][0]
+
+    def test_accepts_dir_entries(self, tmp_path):
+        """DirEntry objects from an earlier scandir are checked by path."""
+        (tmp_path / "a.md").write_text("x" * 5)
+        (tmp_path / "b.md").write_text("x" * 50)
+
+        with os.scandir(tmp_path) as it:
+            results = validate_file_sizes_bulk(list(it), max_size=10)
+
+        assert results == {
+            tmp_path / "a.md": (True, None),
+            tmp_path / "b.md": validate_file_size(tmp_path / "b.md", max_size=10),
+        }
+
+
+class TestModuleWhitelist:
+    """Test is_allowed_module and validate_module_path."""
+
+    def test_dotted_parents_allowed(self):
+        """A listed module allows itself and its submodules only."""
+        allowed = {'guardian.core', 'json'}
+
+        assert is_allowed_module('guardian.core', allowed)
+        assert is_allowed_module('guardian.core.base.build', allowed)
+        assert is_allowed_module('json.dumps', allowed)
+        assert not is_allowed_module('guardian', allowed)
+        assert not is_allowed_module('guardian.corex.build', allowed)
+        assert not is_allowed_module('os.system', allowed)
+
+    def test_list_whitelist(self):
+        """Whitelists given as lists behave like sets."""
+        assert is_allowed_module('pkg.sub.fn', ['other', 'pkg'])
+        assert validate_module_path('json', ['json']) == (True, None)
+        assert not validate_module_path('yaml', ['json'])[0]
+
+    def test_runtime_whitelist_additions(self, monkeypatch):
+        """Modules added to the default whitelist at runtime are honoured."""
+        assert not is_allowed_module('myproject.context.build')
+
+        monkeypatch.setattr(
+            'guardian.core.security.ALLOWED_CONTEXT_BUILDER_MODULES',
+            ALLOWED_CONTEXT_BUILDER_MODULES | {'myproject.context'},
+        )
+        assert is_allowed_module('myproject.context.build')
+        assert validate_module_path('myproject.context.build') == (True, None)
+
+    def test_default_whitelist(self):
+        """validate_module_path uses the default whitelist when none is given."""
+        assert validate_module_path('guardian.core.reporting.build') == (True, None)
+
+        is_allowed, error = validate_module_path('subprocess.run')
+        assert not is_allowed
+        assert 'subprocess.run' in error
+
+
+class TestGitPaths:
+    """Test safe_git_path and validate_git_path."""
+
+    def test_dash_prefixed_paths_guarded(self):
+        """Paths starting with '-' get a './' prefix; others are unchanged."""
+        assert safe_git_path(Path("-rf .")) == "./-rf ."
+        assert safe_git_path("-n") == "./-n"
+        assert safe_git_path(Path("docs/a.md")) == str(Path("docs/a.md"))
+
+    def test_validate_git_path(self):
+        """Null bytes and excessively long paths are rejected."""
+        assert validate_git_path(Path("docs/a.md")) == (True, None)
+        assert validate_git_path("bad\x00.md") == (False, "Path contains null byte")
+        assert not validate_git_path("a" * 4097)[0]
+
+
+class TestSanitizeErrorMessage:
+    """Test sanitize_error_message."""
+
+    def test_project_and_home_replaced(self, tmp_path):
+        """The resolved project root and the home directory are masked."""
+        root = tmp_path.resolve()
+        home = os.path.expanduser('~')
+
+        message = sanitize_error_message(f"bad {root}/a.md in {home}/x", tmp_path)
+
+        assert message == "bad <project>/a.md in <home>/x"
+
+    def test_repeated_calls_reuse_lookups(self, tmp_path):
+        """Repeated sanitizing gives the same result from cached lookups."""
+        first = sanitize_error_message(f"{tmp_path.resolve()}/a", tmp_path)
+        second = sanitize_error_message(f"{tmp_path.resolve()}/a", tmp_path)
+        assert first == second == "<project>/a"
@@ -441,16 +441,22 @@ class TestNewErrorHandling:
         """GIT-04: Missing git should give clear error."""
         from guardian.core.git_utils import (
             GitNotInstalledError,
+            _check_git_installed,
             _run_git_command,
         )
 
-        with patch("guardian.core.git_utils.shutil.which") as mock_which:
-            mock_which.return_value = None
+        # The git lookup is cached per process; reset it around the patch
+        _check_git_installed.cache_clear()
+        try:
+            with patch("guardian.core.git_utils.shutil.which") as mock_which:
+                mock_which.return_value = None
 
-            with pytest.raises(GitNotInstalledError) as exc_info:
-                _run_git_command(["git", "status"], Path("."), 10, "test")
+                with pytest.raises(GitNotInstalledError) as exc_info:
+                    _run_git_command(["git", "status"], Path("."), 10, "test")
 
-            assert "not installed" in str(exc_info.value).lower()
+                assert "not installed" in str(exc_info.value).lower()
+        finally:
+            _check_git_installed.cache_clear()
 
     def test_git_timeout_error(self):
         """GIT-06: Git timeout should give clear error."""
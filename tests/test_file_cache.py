@@ -0,0 +1,184 @@
+"""
+Test suite for the file cache and SimHash utilities.
+
+Covers:
+1. Cached reads and line splitting
+2. Invalidation on file modification
+3. SimHash similarity helpers
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from guardian.core.file_cache import (
+    FileCache,
+    are_similar,
+    hamming_distance,
+    simhash,
+    simhash_batch,
+)
+
+
+class TestReadLines:
+    """Test FileCache.read_lines caching."""
+
+    def test_lines_split_on_newline(self, tmp_path):
+        """Lines are returned without newline characters."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("# Title\n\nBody\n")
+
+        cache = FileCache()
+        assert cache.read_lines(doc) == ["# Title", "", "Body", ""]
+
+    def test_split_result_reused(self, tmp_path):
+        """Second call reuses the cached split instead of re-splitting."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("a\nb\nc")
+
+        cache = FileCache()
+        first = cache.read_lines(doc)
+        second = cache.read_lines(doc)
+
+        assert first == second
+        assert first[0] is second[0]
+        assert cache.stats['hits'] == 1
+
+    def test_caller_mutation_does_not_leak(self, tmp_path):
+        """Mutating a returned list does not affect later reads."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("a\nb")
+
+        cache = FileCache()
+        cache.read_lines(doc).append("extra")
+
+        assert cache.read_lines(doc) == ["a", "b"]
+
+    def test_modified_file_reread(self, tmp_path):
+        """A newer mtime invalidates the cached lines."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("old")
+
+        cache = FileCache()
+        assert cache.read_lines(doc) == ["old"]
+
+        doc.write_text("new\nlines")
+        stat = doc.stat()
+        os.utime(doc, (stat.st_atime, stat.st_mtime + 10))
+
+        assert cache.read_lines(doc) == ["new", "lines"]
+
+
+class TestByteBudget:
+    """Test FileCache byte-based eviction."""
+
+    def test_evicts_by_total_bytes(self, tmp_path):
+        """Oldest entries are evicted once max_bytes would be exceeded."""
+        cache = FileCache(max_size=100, max_bytes=250)
+        files = []
+        for i in range(3):
+            f = tmp_path / f"doc_{i}.md"
+            f.write_text("x" * 100)
+            files.append(f)
+            cache.read(f)
+
+        stats = cache.stats
+        assert stats['entries'] == 2
+        assert stats['total_cached_bytes'] == 200
+
+        # doc_0 was evicted, so reading it again is a miss
+        misses = stats['misses']
+        cache.read(files[0])
+        assert cache.stats['misses'] == misses + 1
+
+    def test_oversized_file_not_cached(self, tmp_path):
+        """A file larger than max_bytes is returned but never cached."""
+        big = tmp_path / "big.md"
+        big.write_text("y" * 500)
+
+        cache = FileCache(max_bytes=100)
+        assert cache.read(big) == "y" * 500
+        assert cache.stats['entries'] == 0
+        assert cache.stats['total_cached_bytes'] == 0
+
+    def test_invalidate_releases_bytes(self, tmp_path):
+        """Invalidating an entry releases its bytes from the budget."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("z" * 40)
+
+        cache = FileCache()
+        cache.read(doc)
+        assert cache.stats['total_cached_bytes'] == 40
+
+        cache.invalidate(doc)
+        assert cache.stats['total_cached_bytes'] == 0
+
+
+class TestThreadSafety:
+    """Test FileCache under concurrent access."""
+
+    def test_concurrent_reads_and_invalidations(self, tmp_path):
+        """Concurrent reads/invalidations keep counters and size bounds consistent."""
+        files = []
+        for i in range(20):
+            f = tmp_path / f"doc_{i}.md"
+            f.write_text(f"content {i}")
+            files.append(f)
+
+        cache = FileCache(max_size=8)
+        errors = []
+
+        def worker(offset):
+            try:
+                for n in range(200):
+                    f = files[(n + offset) % len(files)]
+                    assert cache.read(f) == f"content {(n + offset) % len(files)}"
+                    if n % 17 == 0:
+                        cache.invalidate(f)
+            except Exception as e:  # pragma: no cover - surfaced via assert below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert not errors
+        stats = cache.stats
+        assert stats['hits'] + stats['misses'] == 8 * 200
+        assert stats['entries'] <= 8
+
+
+class TestSimHash:
+    """Test SimHash helpers."""
+
+    def test_batch_matches_single(self):
+        """simhash_batch produces the same fingerprints as simhash."""
+        texts = [
+            "Install the package with pip",
+            "install the package with pip install",
+            "",
+            "Completely unrelated content about configuration",
+        ]
+        assert simhash_batch(texts) == [simhash(t) for t in texts]
+
+    def test_empty_text_hashes_to_zero(self):
+        """Texts without tokens hash to zero."""
+        assert simhash("   ") == 0
+        assert simhash_batch([""]) == [0]
+
+    def test_hamming_distance_counts_differing_bits(self):
+        """hamming_distance counts differing bits within the compared width."""
+        assert hamming_distance(0b1011, 0b0001) == 2
+        assert hamming_distance(1 << 70, 0) == 0
+        assert hamming_distance(1 << 70, 0, bits=128) == 1
+
+    def test_are_similar_threshold(self):
+        """are_similar accepts distances up to max_distance inclusive."""
+        assert are_similar(0xFF, 0xFF)
+        assert are_similar(0b111, 0, max_distance=3)
+        assert not are_similar(0b1111, 0, max_distance=3)
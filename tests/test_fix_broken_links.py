@@ -0,0 +1,114 @@
+"""
+Test suite for FixBrokenLinksHealer link extraction.
+
+Covers:
+1. Links extracted with line numbers
+2. Code blocks skipped
+3. Whole-file prefilter for files without links
+4. Line-sensitive patterns matched line by line
+5. Heal stops on shutdown request
+6. Reused healer sees tree changes between runs
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from guardian.healers.fix_broken_links import FixBrokenLinksHealer, LinkExtractor
+
+DEFAULT_PATTERN = r'\[([^\]]+)\]\(([^\)]+)\)'
+
+
+class TestLinkExtractor:
+    """Test LinkExtractor.extract_from_file."""
+
+    def test_links_with_line_numbers(self, tmp_path):
+        """Each link is reported with its 1-based line number."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("# Title\n\nSee [guide](guide.md).\r\nAnd [api](api.md) too.\n")
+
+        links = LinkExtractor(DEFAULT_PATTERN).extract_from_file(doc)
+
+        assert [(link.line_num, link.text, link.target) for link in links] == [
+            (3, 'guide', 'guide.md'),
+            (4, 'api', 'api.md'),
+        ]
+
+    def test_code_block_links_skipped(self, tmp_path):
+        """Links inside fenced code blocks are ignored."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("```\n[code](code.md)\n```\n[real](real.md)\n")
+
+        links = LinkExtractor(DEFAULT_PATTERN).extract_from_file(doc)
+
+        assert [link.target for link in links] == ['real.md']
+
+    def test_file_without_links(self, tmp_path):
+        """A file with no match anywhere yields no links and no errors."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("# Title\n\nPlain text [not a link] (really).\n")
+
+        extractor = LinkExtractor(DEFAULT_PATTERN)
+
+        assert extractor.extract_from_file(doc) == []
+        assert extractor.errors == []
+
+    def test_anchored_pattern_matched_per_line(self, tmp_path):
+        """Patterns with \\A anchors still match at the start of each line."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("intro\n[first](a.md)\n")
+
+        extractor = LinkExtractor(r'\A\[([^\]]+)\]\(([^\)]+)\)')
+        links = extractor.extract_from_file(doc)
+
+        assert [(link.line_num, link.target) for link in links] == [(2, 'a.md')]
+
+
+class TestShutdown:
+    """Test cooperative stopping during heal."""
+
+    def test_heal_applies_nothing_once_stop_requested(self, tmp_path):
+        """With the stop event set, heal() records an error and leaves files alone."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "guide.md").write_text("# Guide\n")
+        doc = docs / "index.md"
+        doc.write_text("[guide](gude.md)\n")
+
+        healer = FixBrokenLinksHealer({'project': {'root': str(tmp_path), 'doc_root': str(docs)}})
+        healer.stop_event = threading.Event()
+        healer.stop_event.set()
+
+        report = healer.heal(min_confidence=0.0)
+
+        assert report.issues_fixed == 0
+        assert report.errors == ["Stopped by shutdown request; remaining changes not applied"]
+        assert doc.read_text() == "[guide](gude.md)\n"
+
+        healer.stop_event.clear()
+        healer.errors.clear()
+        assert healer.heal(min_confidence=0.0).issues_fixed == 1
+        assert doc.read_text() == "[guide](guide.md)\n"
+
+
+class TestReuse:
+    """Test running one healer instance more than once."""
+
+    def test_second_check_sees_deleted_target(self, tmp_path):
+        """A file deleted between runs is no longer proposed as a fix."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "guide.md").write_text("# Guide\n")
+        (docs / "index.md").write_text("[guide](gude.md)\n")
+
+        healer = FixBrokenLinksHealer({'project': {'root': str(tmp_path), 'doc_root': str(docs)}})
+
+        first = healer.check()
+        assert [c.new_content for c in first.changes] == ["[guide](guide.md)"]
+
+        (docs / "guide.md").unlink()
+        second = healer.check()
+
+        assert all("guide.md" not in c.new_content for c in second.changes)
@@ -0,0 +1,317 @@
+"""
+Test suite for git integration utilities.
+
+Covers:
+1. Batched rollback / add / diff across many files
+2. Commit staging
+3. Async API
+4. Merge conflict detection without stale status
+"""
+
+import asyncio
+import shutil
+import subprocess
+
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from guardian.core.git_utils import (
+    GitMergeConflictError,
+    GitRollbackError,
+    RepoInfo,
+    check_merge_conflict,
+    git_add_async,
+    git_add_files,
+    git_commit,
+    git_diff_async,
+    git_diff_files,
+    probe_repos,
+    rollback_file,
+    rollback_file_async,
+    rollback_files,
+    status_session,
+)
+
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git not installed")
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ['git', *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A git repository with three committed markdown files."""
+    _git(tmp_path, 'init', '-q')
+    _git(tmp_path, 'config', 'user.email', 'test@example.com')
+    _git(tmp_path, 'config', 'user.name', 'Test')
+    (tmp_path / 'docs').mkdir()
+    for name in ('a.md', 'b.md', '-dash.md'):
+        (tmp_path / 'docs' / name).write_text(f"original {name}\n")
+    _git(tmp_path, 'add', '-A')
+    _git(tmp_path, 'commit', '-q', '-m', 'init')
+    return tmp_path
+
+
+class TestRollbackFile:
+    """Test single-file rollback."""
+
+    def test_rollback_restores_committed_content(self, repo):
+        """A modified tracked file is restored from HEAD."""
+        doc = repo / 'docs' / 'a.md'
+        doc.write_text("broken\n")
+
+        assert rollback_file(doc)
+        assert doc.read_text() == "original a.md\n"
+
+    def test_repeated_rollbacks_reuse_checker(self, repo):
+        """Several rollbacks in one repo work through the shared tracked-file checker."""
+        for name in ('a.md', 'b.md', '-dash.md'):
+            doc = repo / 'docs' / name
+            doc.write_text("broken\n")
+            assert rollback_file(doc)
+            assert doc.read_text() == f"original {name}\n"
+
+    def test_rollback_untracked_raises(self, repo):
+        """Untracked files cannot be rolled back (GIT-07)."""
+        doc = repo / 'docs' / 'new.md'
+        doc.write_text("new\n")
+
+        with pytest.raises(GitRollbackError):
+            rollback_file(doc)
+
+    def test_rollback_staged_but_uncommitted_raises(self, repo):
+        """A file that is only staged has no HEAD version to restore."""
+        doc = repo / 'docs' / 'staged.md'
+        doc.write_text("staged\n")
+        _git(repo, 'add', 'docs/staged.md')
+
+        with pytest.raises(GitRollbackError):
+            rollback_file(doc)
+
+
+class TestBatchOperations:
+    """Test multi-file git helpers."""
+
+    def test_rollback_files_restores_tracked(self, repo):
+        """Tracked files are restored; untracked ones are reported False."""
+        docs = repo / 'docs'
+        for name in ('a.md', '-dash.md'):
+            (docs / name).write_text("modified\n")
+        untracked = docs / 'new.md'
+        untracked.write_text("new\n")
+
+        results = rollback_files([docs / 'a.md', docs / '-dash.md', untracked])
+
+        assert results == {docs / 'a.md': True, docs / '-dash.md': True, untracked: False}
+        assert (docs / 'a.md').read_text() == "original a.md\n"
+        assert (docs / '-dash.md').read_text() == "original -dash.md\n"
+        assert untracked.exists()
+
+    def test_git_add_files_stages_all(self, repo):
+        """All files are staged in one call."""
+        docs = repo / 'docs'
+        (docs / 'a.md').write_text("changed\n")
+        (docs / 'c.md').write_text("added\n")
+
+        assert git_add_files([docs / 'a.md', docs / 'c.md'])
+
+        staged = _git(repo, 'diff', '--cached', '--name-only').split()
+        assert staged == ['docs/a.md', 'docs/c.md']
+
+    def test_git_add_files_rejects_missing(self, repo):
+        """Nothing is staged when one of the files does not exist."""
+        docs = repo / 'docs'
+        (docs / 'a.md').write_text("changed\n")
+
+        assert not git_add_files([docs / 'a.md', docs / 'missing.md'])
+        assert _git(repo, 'diff', '--cached', '--name-only') == ''
+
+    def test_git_diff_files_combines_output(self, repo):
+        """Diff output covers every requested file."""
+        docs = repo / 'docs'
+        (docs / 'a.md').write_text("changed a\n")
+        (docs / 'b.md').write_text("changed b\n")
+
+        diff = git_diff_files([docs / 'a.md', docs / 'b.md'])
+
+        assert 'docs/a.md' in diff
+        assert 'docs/b.md' in diff
+        assert '+changed b' in diff
+
+    def test_git_commit_stages_and_commits(self, repo):
+        """git_commit stages the given files and commits them."""
+        docs = repo / 'docs'
+        (docs / 'a.md').write_text("fixed\n")
+        (docs / 'b.md').write_text("fixed\n")
+
+        assert git_commit("docs: fix", [docs / 'a.md', docs / 'b.md'], repo_root=repo)
+
+        assert _git(repo, 'status', '--porcelain') == ''
+        assert _git(repo, 'log', '-1', '--format=%s').strip() == "docs: fix"
+
+    def test_git_commit_only_given_files(self, repo):
+        """Other staged changes stay staged and out of the commit."""
+        docs = repo / 'docs'
+        (docs / 'a.md').write_text("fixed\n")
+        (docs / 'b.md').write_text("unrelated\n")
+        _git(repo, 'add', 'docs/b.md')
+
+        assert git_commit("docs: fix a", [docs / 'a.md'], repo_root=repo)
+
+        committed = _git(repo, 'show', '--name-only', '--format=', 'HEAD').split()
+        assert committed == ['docs/a.md']
+        assert _git(repo, 'diff', '--cached', '--name-only').split() == ['docs/b.md']
+
+    def test_git_commit_new_file(self, repo):
+        """Untracked files are staged and committed."""
+        docs = repo / 'docs'
+        (docs / 'new.md').write_text("new\n")
+        (docs / 'a.md').write_text("fixed\n")
+
+        assert git_commit("docs: add", [docs / 'new.md', docs / 'a.md'], repo_root=repo)
+
+        committed = _git(repo, 'show', '--name-only', '--format=', 'HEAD').split()
+        assert sorted(committed) == ['docs/a.md', 'docs/new.md']
+        assert _git(repo, 'status', '--porcelain') == ''
+
+
+class TestCachedLookups:
+    """Test memoized git lookups."""
+
+    def test_repo_root_cached_per_directory(self, repo):
+        """Repeated lookups for one directory run rev-parse once."""
+        from guardian.core import git_utils
+
+        git_utils._repo_root_for_dir.cache_clear()
+        docs = repo / 'docs'
+
+        first = git_utils._repo_root(docs / 'a.md')
+        second = git_utils._repo_root(docs / 'b.md')
+
+        assert first == second
+        assert first.resolve() == repo.resolve()
+        info = git_utils._repo_root_for_dir.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+
+class TestMergeConflicts:
+    """Test merge conflict detection (GIT-03)."""
+
+    @staticmethod
+    def _make_conflict(repo: Path) -> None:
+        """Leave an unresolved merge conflict in docs/a.md."""
+        _git(repo, 'checkout', '-q', '-b', 'other')
+        (repo / 'docs' / 'a.md').write_text("other side\n")
+        _git(repo, 'commit', '-q', '-am', 'other')
+        _git(repo, 'checkout', '-q', '-')
+        (repo / 'docs' / 'a.md').write_text("this side\n")
+        _git(repo, 'commit', '-q', '-am', 'this')
+        subprocess.run(['git', 'merge', 'other'], cwd=repo, capture_output=True)
+
+    @pytest.fixture
+    def conflicted(self, repo):
+        """The repo fixture with an unresolved merge conflict in docs/a.md."""
+        self._make_conflict(repo)
+        return repo
+
+    def test_clean_repo_has_no_conflict(self, repo):
+        """A repo without unmerged paths reports no conflict."""
+        assert not check_merge_conflict(repo)
+
+    def test_unmerged_paths_detected(self, conflicted):
+        """Unmerged index entries are reported as a conflict."""
+        assert check_merge_conflict(conflicted)
+
+    def test_commit_refused_during_conflict(self, conflicted):
+        """git_commit refuses to commit while paths are unmerged."""
+        doc = conflicted / 'docs' / 'b.md'
+        doc.write_text("fixed\n")
+
+        with pytest.raises(GitMergeConflictError):
+            git_commit("docs: fix", [doc], repo_root=conflicted)
+
+    def test_conflict_created_after_clean_check(self, repo):
+        """A conflict made outside this module is seen after a clean check."""
+        assert not check_merge_conflict(repo)
+
+        self._make_conflict(repo)
+
+        assert check_merge_conflict(repo)
+
+    def test_commit_rechecks_status_inside_session(self, repo):
+        """git_commit ignores status cached earlier in the session."""
+        doc = repo / 'docs' / 'b.md'
+        with status_session():
+            assert not check_merge_conflict(repo)
+            self._make_conflict(repo)
+            doc.write_text("fixed\n")
+
+            with pytest.raises(GitMergeConflictError):
+                git_commit("docs: fix", [doc], repo_root=repo)
+
+
+class TestProbeRepos:
+    """Test parallel repository probing."""
+
+    def test_probe_mixed_paths(self, repo, tmp_path_factory):
+        """Paths in a repo report its root; paths outside report is_repo False."""
+        outside = tmp_path_factory.mktemp('outside')
+        (outside / 'x.md').write_text("x\n")
+        docs = repo / 'docs'
+
+        infos = probe_repos([docs / 'a.md', docs / 'b.md', docs, outside / 'x.md'])
+
+        for path in (docs / 'a.md', docs / 'b.md', docs):
+            assert infos[path].is_repo
+            assert infos[path].root.resolve() == repo.resolve()
+        assert infos[outside / 'x.md'] == RepoInfo(is_repo=False)
+
+    def test_probe_empty(self):
+        """An empty input needs no probes."""
+        assert probe_repos([]) == {}
+
+
+class TestAsyncOperations:
+    """Test the asyncio git API."""
+
+    def test_rollback_many_concurrently(self, repo):
+        """Concurrent async rollbacks in one repo all succeed."""
+        docs = repo / 'docs'
+        names = ('a.md', 'b.md', '-dash.md')
+        for name in names:
+            (docs / name).write_text("broken\n")
+
+        async def run():
+            return await asyncio.gather(*(rollback_file_async(docs / n) for n in names))
+
+        assert asyncio.run(run()) == [True, True, True]
+        for name in names:
+            assert (docs / name).read_text() == f"original {name}\n"
+
+    def test_rollback_untracked_raises(self, repo):
+        """Untracked files raise GitRollbackError, as in the sync API."""
+        doc = repo / 'docs' / 'new.md'
+        doc.write_text("new\n")
+
+        with pytest.raises(GitRollbackError):
+            asyncio.run(rollback_file_async(doc))
+
+    def test_add_and_diff(self, repo):
+        """git_add_async stages a file; git_diff_async reports staged changes."""
+        doc = repo / 'docs' / 'a.md'
+        doc.write_text("changed\n")
+
+        async def run():
+            assert await git_add_async(doc)
+            return await git_diff_async(doc, staged=True)
+
+        diff = asyncio.run(run())
+        assert '+changed' in diff
+        assert _git(repo, 'diff', '--cached', '--name-only').split() == ['docs/a.md']
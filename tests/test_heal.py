@@ -0,0 +1,529 @@
+"""
+Test suite for the healing orchestrator entry points.
+
+Covers:
+1. Config loading and caching
+2. JSON sidecar config cache
+3. Parallel orchestrator scheduling and worker pool
+4. Sequential orchestrator progress output
+5. Lazy healer imports
+6. Healer instance reuse
+7. JSON report (API and command line)
+"""
+
+import json
+import os
+import subprocess
+import threading
+import time
+
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from guardian import heal
+from guardian.core import config_validator
+from guardian.core.base import HealingReport, HealingSystem
+from guardian.core.config_validator import ConfigParseError, clear_config_cache
+from guardian.heal import (
+    HealingOrchestrator,
+    ParallelHealingOrchestrator,
+    generate_json_report,
+    load_config,
+)
+
+
+def _stub_healer(name: str, issues: int = 0, log=None, errors=(), on_run=None):
+    """A HealingSystem class reporting fixed results and logging start/end."""
+
+    class StubHealer(HealingSystem):
+        def _report(self, mode: str, fixed: int) -> HealingReport:
+            if log is not None:
+                log.append((name, 'start'))
+            if on_run is not None:
+                on_run()
+            if log is not None:
+                log.append((name, 'end'))
+            return HealingReport(name, mode, '', issues, fixed, errors=list(errors))
+
+        def check(self) -> HealingReport:
+            return self._report('check', 0)
+
+        def heal(self, min_confidence=None) -> HealingReport:
+            return self._report('heal', issues)
+
+    return StubHealer
+
+
+@pytest.fixture
+def project_config(tmp_path):
+    """A config whose project and doc roots exist."""
+    (tmp_path / "docs").mkdir()
+    return {'project': {'root': str(tmp_path), 'doc_root': str(tmp_path / "docs")}}
+
+
+@pytest.fixture
+def toml_config(tmp_path):
+    """A minimal TOML config file."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('[project]\nname = "demo"\n\n[healers.fix_broken_links]\nenabled = true\n')
+    clear_config_cache()
+    yield config_file
+    clear_config_cache()
+
+
+class TestLoadConfig:
+    """Test load_config parsing and caching."""
+
+    def test_parses_toml(self, toml_config):
+        """TOML configs are parsed into dictionaries."""
+        config = load_config(toml_config)
+
+        assert config['project'] == {'name': 'demo'}
+        assert config['healers']['fix_broken_links']['enabled'] is True
+
+    @pytest.mark.skipif(not heal.YAML_AVAILABLE, reason="PyYAML not installed")
+    def test_parses_yaml_safely(self, tmp_path):
+        """YAML configs are parsed with a safe loader (C-accelerated if available)."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("project:\n  name: demo\nhook: !!python/name:os.system\n")
+
+        with pytest.raises(ConfigParseError, match="YAML parse error"):
+            load_config(config_file)
+
+        config_file.write_text("project:\n  name: demo\n")
+        assert load_config(config_file) == {'project': {'name': 'demo'}}
+
+    def test_same_parser_as_validator(self, tmp_path):
+        """load_config parses exactly what validate_and_load_config does, in any order."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"project": {"name": "demo"}}')
+        clear_config_cache()
+
+        first = load_config(config_file)
+        clear_config_cache()
+        validated, _ = config_validator.validate_and_load_config(config_file, check_paths=False)
+
+        assert first == validated == {'project': {'name': 'demo'}}
+
+    def test_missing_file(self, tmp_path):
+        """A missing config file raises ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            load_config(tmp_path / "missing.toml")
+
+    def test_unchanged_file_parsed_once(self, toml_config, monkeypatch):
+        """Repeated loads of an unchanged file reuse the parsed config."""
+        parses = []
+        original = config_validator.parse_config_file
+
+        def counting_parse(path):
+            parses.append(path)
+            return original(path)
+
+        monkeypatch.setattr(config_validator, "parse_config_file", counting_parse)
+
+        assert load_config(toml_config) == load_config(toml_config)
+        assert parses == [toml_config]
+
+    def test_returned_config_is_a_copy(self, toml_config):
+        """Mutating a loaded config does not affect later loads."""
+        load_config(toml_config)['project']['name'] = 'changed'
+
+        assert load_config(toml_config)['project']['name'] == 'demo'
+
+    def test_modified_file_reparsed(self, toml_config):
+        """A change to the file's mtime or size invalidates the cache."""
+        assert load_config(toml_config)['project']['name'] == 'demo'
+
+        toml_config.write_text('[project]\nname = "renamed"\n')
+        stat = toml_config.stat()
+        os.utime(toml_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert load_config(toml_config)['project']['name'] == 'renamed'
+
+
+class TestConfigSidecar:
+    """Test the JSON sidecar cache (opt-in for the API, on by default in the CLI)."""
+
+    def test_sidecar_written_and_used(self, toml_config, monkeypatch):
+        """A fresh process (empty memory cache) reads the sidecar instead of parsing."""
+        sidecar = toml_config.with_name("config.toml.cache.json")
+        expected = load_config(toml_config, use_sidecar=True)
+        assert sidecar.exists()
+
+        clear_config_cache()
+        monkeypatch.setattr(config_validator, "parse_config_file", lambda path: pytest.fail("parsed"))
+
+        assert load_config(toml_config, use_sidecar=True) == expected
+
+    def test_stale_sidecar_ignored(self, toml_config):
+        """Editing the source invalidates the sidecar."""
+        load_config(toml_config, use_sidecar=True)
+
+        toml_config.write_text('[project]\nname = "renamed"\n')
+        stat = toml_config.stat()
+        os.utime(toml_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        clear_config_cache()
+
+        assert load_config(toml_config, use_sidecar=True)['project']['name'] == 'renamed'
+
+    def test_not_json_safe_config_skipped(self, tmp_path):
+        """Configs JSON cannot represent faithfully get no sidecar."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('[project]\nreleased = 2024-01-01\n')
+        clear_config_cache()
+
+        config = load_config(config_file, use_sidecar=True)
+
+        assert str(config['project']['released']) == '2024-01-01'
+        assert not config_file.with_name("config.toml.cache.json").exists()
+
+    def test_no_sidecar_by_default(self, toml_config):
+        """Without use_sidecar nothing is written next to the config."""
+        load_config(toml_config)
+
+        assert sorted(p.name for p in toml_config.parent.iterdir()) == ["config.toml"]
+
+    def test_validated_load_uses_sidecar(self, toml_config, monkeypatch):
+        """load_config_validated reads the sidecar written by an earlier process."""
+        expected, _ = heal.load_config_validated(toml_config, use_sidecar=True)
+        assert toml_config.with_name("config.toml.cache.json").exists()
+
+        clear_config_cache()
+        monkeypatch.setattr(config_validator, "parse_config_file", lambda path: pytest.fail("parsed"))
+
+        assert heal.load_config_validated(toml_config, use_sidecar=True)[0] == expected
+
+    def test_cli_no_cache(self, tmp_path):
+        """The CLI writes the sidecar unless --no-cache is given."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text(
+            f'[project]\nroot = "{tmp_path.as_posix()}"\ndoc_root = "{tmp_path.as_posix()}"\n'
+        )
+        sidecar = config_file.with_name("config.toml.cache.json")
+
+        def run(*flags):
+            return subprocess.run(
+                [sys.executable, '-m', 'guardian.heal', '--config', str(config_file),
+                 '--validate-only', *flags],
+                cwd=Path(__file__).parent.parent, capture_output=True, text=True
+            )
+
+        assert run('--no-cache').returncode == 0
+        assert not sidecar.exists()
+
+        assert run().returncode == 0
+        assert sidecar.exists()
+
+
+class TestParallelOrchestrator:
+    """Test ParallelHealingOrchestrator execution."""
+
+    def _orchestrator(self, config, names, max_workers=2, **stub_kwargs):
+        orchestrator = ParallelHealingOrchestrator(config, quiet=True, max_workers=max_workers)
+        orchestrator.available_healers = {
+            name: _stub_healer(name, **stub_kwargs.get(name, {})) for name in names
+        }
+        return orchestrator
+
+    def test_heal_mode_respects_dependencies(self, project_config):
+        """In heal mode no healer starts before its (effective) dependencies end."""
+        log = []
+        names = [n for n in ParallelHealingOrchestrator.DEFAULT_HEALER_ORDER if n != 'resolve_duplicates']
+        with self._orchestrator(
+            project_config, names, max_workers=4, **{n: {'log': log} for n in names}
+        ) as orchestrator:
+            report = orchestrator.run_all('heal')
+            dependencies = orchestrator._effective_dependencies(names)
+
+        # resolve_duplicates is disabled, so balance_references inherits its deps
+        assert dependencies['balance_references'] == {
+            'fix_broken_links', 'detect_staleness', 'manage_collapsed'
+        }
+        for name in names:
+            start = log.index((name, 'start'))
+            for dep in dependencies[name]:
+                assert log.index((dep, 'end')) < start
+        assert [r.healer_name for r in report.healer_reports] == names
+
+    def test_check_mode_runs_all_at_once(self, project_config):
+        """In check mode dependent healers run concurrently."""
+        barrier = threading.Barrier(2, timeout=5)
+        names = ['sync_canonical', 'fix_broken_links']
+        with self._orchestrator(
+            project_config, names, **{n: {'on_run': barrier.wait} for n in names}
+        ) as orchestrator:
+            report = orchestrator.run_all('check')
+
+        assert not report.has_errors
+        assert [r.healer_name for r in report.healer_reports] == names
+
+    def test_error_stops_dependents(self, project_config):
+        """Without continue_on_error, dependents of a failed healer never start."""
+        names = ['sync_canonical', 'fix_broken_links', 'enforce_disclosure']
+        with self._orchestrator(
+            project_config, names, sync_canonical={'errors': ['boom']}
+        ) as orchestrator:
+            report = orchestrator.run_all('heal')
+
+            assert [r.healer_name for r in report.healer_reports] == ['sync_canonical']
+
+            orchestrator.continue_on_error = True
+            report = orchestrator.run_all('heal')
+
+        assert [r.healer_name for r in report.healer_reports] == names
+
+    def test_check_mode_error_does_not_cancel_others(self, project_config):
+        """In check mode an error never cancels queued healers, whatever max_workers is."""
+        names = ['sync_canonical', 'fix_broken_links', 'enforce_disclosure']
+        for max_workers in (1, 3):
+            with self._orchestrator(
+                project_config, names, max_workers=max_workers, sync_canonical={'errors': ['boom']}
+            ) as orchestrator:
+                report = orchestrator.run_all('check')
+
+            assert [r.healer_name for r in report.healer_reports] == names
+
+    def test_shutdown_cancels_queued_healers(self, project_config, monkeypatch):
+        """A shutdown request stops queued healers while one is still running."""
+        monkeypatch.setattr(heal, '_shutdown_requested', threading.Event())
+
+        def request_shutdown():
+            heal._shutdown_requested.set()
+            time.sleep(5 * ParallelHealingOrchestrator.SHUTDOWN_POLL_INTERVAL)
+
+        log = []
+        names = ['sync_canonical', 'fix_broken_links', 'detect_staleness']
+        stubs = {n: {'log': log} for n in names}
+        stubs['sync_canonical']['on_run'] = request_shutdown
+        with self._orchestrator(project_config, names, max_workers=1, **stubs) as orchestrator:
+            report = orchestrator.run_all('check')
+
+        assert log == [('sync_canonical', 'start'), ('sync_canonical', 'end')]
+        assert [r.healer_name for r in report.healer_reports] == ['sync_canonical']
+
+    def test_runs_every_available_healer(self, project_config):
+        """Parallel and sequential healers all report, in a single unified report."""
+        names = ['sync_canonical', 'fix_broken_links', 'detect_staleness', 'enforce_disclosure']
+        with self._orchestrator(project_config, names) as orchestrator:
+            report = orchestrator.run_all('check')
+
+        assert sorted(r.healer_name for r in report.healer_reports) == sorted(names)
+        assert not report.has_errors
+
+    def test_default_worker_count(self, project_config, monkeypatch):
+        """Workers follow the affinity mask, capped at one per healer."""
+        monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1}, raising=False)
+        assert ParallelHealingOrchestrator(project_config).max_workers == 2
+
+        monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(64)), raising=False)
+        limit = len(ParallelHealingOrchestrator.DEPENDENCIES)
+        assert ParallelHealingOrchestrator(project_config).max_workers == limit
+
+        assert ParallelHealingOrchestrator(project_config, max_workers=12).max_workers == 12
+
+    def test_worker_pool_reused_across_runs(self, project_config):
+        """Later run_all() calls reuse the worker threads of the first."""
+        orchestrator = self._orchestrator(project_config, ['fix_broken_links', 'detect_staleness'])
+        try:
+            orchestrator.run_all('check')
+            executor = orchestrator._executor
+            orchestrator.run_all('check')
+
+            assert executor is not None
+            assert orchestrator._executor is executor
+        finally:
+            orchestrator.close()
+
+        assert orchestrator._executor is None
+
+
+class TestSequentialOutput:
+    """Test HealingOrchestrator progress output."""
+
+    def _run(self, config, **kwargs):
+        orchestrator = HealingOrchestrator(config, **kwargs)
+        orchestrator.available_healers = {
+            'sync_canonical': _stub_healer('sync_canonical', issues=2),
+            'fix_broken_links': _stub_healer('fix_broken_links', errors=['boom', 'again']),
+            'enforce_disclosure': _stub_healer('enforce_disclosure'),
+        }
+        return orchestrator.run_all('heal')
+
+    def test_normal_output(self, project_config, capsys):
+        """Each healer gets a progress line and a one-line result."""
+        report = self._run(project_config)
+        out = capsys.readouterr().out
+
+        assert [r.healer_name for r in report.healer_reports] == ['sync_canonical', 'fix_broken_links']
+        assert "[1/3] Running" in out and "Fixed 2/2 (100%)" in out
+        assert "[2/3] Running" in out and "Failed" in out
+        assert "Stopping due to error in fix_broken_links" in out
+        assert "--continue-on-error" in out
+        assert "[3/3]" not in out
+
+    def test_verbose_output(self, project_config, capsys):
+        """Verbose mode shows the first error and how many there are."""
+        self._run(project_config, verbose=True, continue_on_error=True)
+        out = capsys.readouterr().out
+
+        assert "Found 2 issue(s)" in out and "Fixed 2 issue(s)" in out
+        assert "Failed: boom" in out and "all 2 errors" in out
+        assert "No issues" in out
+        assert "Stopping" not in out
+
+    def test_totals(self, project_config):
+        """The unified report totals issues found and fixed across healers."""
+        orchestrator = HealingOrchestrator(project_config, quiet=True, continue_on_error=True)
+        orchestrator.available_healers = {
+            'sync_canonical': _stub_healer('sync_canonical', issues=2),
+            'detect_staleness': _stub_healer('detect_staleness', issues=3),
+        }
+
+        check = orchestrator.run_all('check')
+        heal_report = orchestrator.run_all('heal')
+
+        assert (check.total_issues_found, check.total_issues_fixed) == (5, 0)
+        assert (heal_report.total_issues_found, heal_report.total_issues_fixed) == (5, 5)
+        assert heal_report.success_rate == 1.0
+
+    def test_reports_share_run_timestamp(self, project_config):
+        """Orchestrator-built reports carry the run's timestamp."""
+        orchestrator = HealingOrchestrator(
+            project_config, quiet=True, continue_on_error=True,
+            skip_healers=['detect_staleness'],
+        )
+        orchestrator.available_healers = {
+            'fix_broken_links': ('guardian.healers.no_such_module', 'Missing'),
+            'detect_staleness': _stub_healer('detect_staleness'),
+        }
+
+        report = orchestrator.run_all('check')
+
+        assert [r.timestamp for r in report.healer_reports] == [report.timestamp] * 2
+        assert orchestrator._run_timestamp is None
+
+    def test_quiet_output(self, project_config, capsys):
+        """Quiet mode prints nothing."""
+        self._run(project_config, quiet=True)
+
+        assert capsys.readouterr().out == ""
+
+
+class TestLazyHealerImports:
+    """Test that healer modules are imported on demand."""
+
+    def test_only_used_healer_imported(self):
+        """Creating an orchestrator imports no healers; resolving one imports only it."""
+        code = (
+            "import sys\n"
+            "from guardian.heal import HealingOrchestrator\n"
+            "o = HealingOrchestrator({})\n"
+            "assert not [m for m in sys.modules if m.startswith('guardian.healers.')]\n"
+            "cls = o._healer_class('detect_staleness')\n"
+            "assert cls.__name__ == 'DetectStalenessHealer'\n"
+            "print(sorted(m for m in sys.modules if m.startswith('guardian.healers.')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "['guardian.healers.detect_staleness']"
+
+    def test_package_attributes(self):
+        """Healer classes are still importable from guardian.healers."""
+        from guardian import healers
+        from guardian.healers import FixBrokenLinksHealer
+
+        assert FixBrokenLinksHealer.__name__ == 'FixBrokenLinksHealer'
+        assert set(healers.__all__) <= set(dir(healers))
+        with pytest.raises(AttributeError):
+            healers.NoSuchHealer
+
+
+class TestHealerReuse:
+    """Test caching of healer instances across runs."""
+
+    def test_instance_reused_until_reset(self, project_config):
+        """check then heal share one instance; reset() drops it."""
+        orchestrator = HealingOrchestrator(project_config, quiet=True)
+        orchestrator.available_healers = {'fix_broken_links': _stub_healer('fix_broken_links')}
+
+        first = orchestrator._instantiate_healer('fix_broken_links')
+        first.log_error("left over from check")
+        second = orchestrator._instantiate_healer('fix_broken_links')
+
+        assert second is first
+        assert second.errors == []
+
+        orchestrator.reset()
+        assert orchestrator._instantiate_healer('fix_broken_links') is not first
+
+    def test_healers_share_shutdown_event(self, project_config):
+        """New healer instances are given the module's shutdown event."""
+        orchestrator = HealingOrchestrator(project_config, quiet=True)
+        orchestrator.available_healers = {'fix_broken_links': _stub_healer('fix_broken_links')}
+
+        healer = orchestrator._instantiate_healer('fix_broken_links')
+
+        assert healer.stop_event is heal._shutdown_requested
+        assert not healer.should_stop()
+
+    def test_non_reusable_healer_rebuilt(self, project_config):
+        """Healers with reusable = False get a fresh instance every run."""
+        healer_class = _stub_healer('detect_staleness')
+        healer_class.reusable = False
+        orchestrator = HealingOrchestrator(project_config, quiet=True)
+        orchestrator.available_healers = {'detect_staleness': healer_class}
+
+        first = orchestrator._instantiate_healer('detect_staleness')
+        assert orchestrator._instantiate_healer('detect_staleness') is not first
+
+
+class TestJsonReport:
+    """Test the unified JSON report."""
+
+    def test_round_trip(self, project_config):
+        """The serialized report parses back to the summary and per-healer entries."""
+        orchestrator = HealingOrchestrator(project_config, quiet=True, continue_on_error=True)
+        orchestrator.available_healers = {
+            'sync_canonical': _stub_healer('sync_canonical', issues=2),
+            'fix_broken_links': _stub_healer('fix_broken_links', errors=['boom']),
+        }
+        report = orchestrator.run_all('heal')
+
+        data = json.loads(heal.dumps_json(generate_json_report(report)))
+
+        assert data['summary'] == {
+            'healers_run': 2, 'issues_found': 2, 'issues_fixed': 2, 'success_rate': 1.0,
+        }
+        assert [h['healer_name'] for h in data['healers']] == ['sync_canonical', 'fix_broken_links']
+        assert data['healers'][1]['errors'] == ['boom']
+        assert data['timestamp'] == report.timestamp
+
+    def test_cli_stdout_is_pure_json(self, tmp_path):
+        """--json without an output path prints nothing but the report."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "index.md").write_text("[guide](missing.md)\n")
+        config_file = tmp_path / "config.toml"
+        config_file.write_text(
+            f'[project]\nroot = "{tmp_path.as_posix()}"\ndoc_root = "{docs.as_posix()}"\n'
+        )
+
+        result = subprocess.run(
+            [sys.executable, '-m', 'guardian.heal', '--config', str(config_file),
+             '--only', 'fix_broken_links', '--json'],
+            cwd=Path(__file__).parent.parent, capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
+        data = json.loads(result.stdout)
+        assert [h['healer_name'] for h in data['healers']] == ['FixBrokenLinksHealer']
+        assert data['summary']['issues_found'] == 1
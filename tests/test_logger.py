@@ -0,0 +1,239 @@
+"""
+Test suite for Doc Guardian logging.
+
+Covers:
+1. Console and JSON file output through the background listener
+2. Context fields and error codes
+"""
+
+import json
+import logging
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from guardian.core.logger import HealerLogger, setup_logger, shutdown_logger
+
+
+def _setup(tmp_path: Path):
+    """Logger writing plain console output and a JSON log file."""
+    log_file = tmp_path / "guardian.log"
+    logger = setup_logger(
+        "test-guardian", log_file=log_file, use_colors=False, use_icons=False
+    )
+    return logger, log_file
+
+
+def _read_json_lines(log_file: Path):
+    return [json.loads(line) for line in log_file.read_text().splitlines()]
+
+
+class TestQueuedOutput:
+    """Test output written via the queue listener."""
+
+    def test_records_written_after_shutdown(self, tmp_path, capsys):
+        """Records reach console and file once the listener is drained."""
+        logger, log_file = _setup(tmp_path)
+        logger.info("first %s", "message")
+        logger.warning("second")
+        shutdown_logger("test-guardian")
+
+        entries = _read_json_lines(log_file)
+        assert [e['message'] for e in entries] == ["first message", "second"]
+        assert [e['level'] for e in entries] == ["INFO", "WARNING"]
+
+        out = capsys.readouterr().out
+        assert "INFO first message" in out
+        assert "WARNING second" in out
+
+    def test_exception_info_preserved(self, tmp_path):
+        """Tracebacks still reach the JSON formatter."""
+        logger, log_file = _setup(tmp_path)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        shutdown_logger("test-guardian")
+
+        entry = _read_json_lines(log_file)[0]
+        assert entry['message'] == "failed"
+        assert "ValueError: boom" in entry['exception']
+
+    def test_level_respected(self, tmp_path):
+        """Records below the configured level are not written."""
+        log_file = tmp_path / "guardian.log"
+        logger = setup_logger(
+            "test-guardian", log_file=log_file, level=logging.WARNING, console=False
+        )
+        logger.info("hidden")
+        logger.error("shown")
+        shutdown_logger("test-guardian")
+
+        assert [e['message'] for e in _read_json_lines(log_file)] == ["shown"]
+
+
+class TestHealerLogger:
+    """Test HealerLogger context fields."""
+
+    def test_context_fields_in_output(self, tmp_path, capsys):
+        """Healer name, file, line and error code appear in both outputs."""
+        logger, log_file = _setup(tmp_path)
+        healer_log = HealerLogger("fix_links", logger)
+        healer_log.file_error("Broken link", Path("docs/a.md"), line_number=7, error_code="FS-06")
+        shutdown_logger("test-guardian")
+
+        entry = _read_json_lines(log_file)[0]
+        assert entry['healer_name'] == "fix_links"
+        assert entry['file_path'] == str(Path("docs/a.md"))
+        assert entry['line_number'] == 7
+        assert entry['error_code'] == "FS-06"
+
+        out = capsys.readouterr().out
+        assert f"ERROR [fix_links] ({Path('docs/a.md')}:7) Broken link [FS-06: File deleted during processing]" in out
+
+    def test_disabled_level_skipped(self, tmp_path):
+        """Records below the logger level are dropped before any work is done."""
+        log_file = tmp_path / "guardian.log"
+        logger = setup_logger("test-guardian", log_file=log_file, console=False)
+        healer_log = HealerLogger("fix_links", logger)
+        healer_log.operation_start("scan", file_path=Path("docs/a.md"))
+        healer_log.info("done")
+        shutdown_logger("test-guardian")
+
+        assert [e['message'] for e in _read_json_lines(log_file)] == ["done"]
+
+
+class TestJSONFormatter:
+    """Test JSON log entries."""
+
+    def test_timestamp_from_record_creation(self):
+        """The timestamp reflects when the record was created."""
+        from datetime import datetime
+        from guardian.core.logger import JSONFormatter
+
+        record = logging.LogRecord('x', logging.INFO, 'p', 1, 'msg', (), None)
+        record.created = 0.0
+        entry = json.loads(JSONFormatter().format(record))
+
+        assert entry['timestamp'] == datetime.fromtimestamp(0.0).isoformat()
+        assert entry['message'] == 'msg'
+
+    def test_message_with_and_without_args(self):
+        """Messages render the same whether or not %-args are present."""
+        from guardian.core.logger import JSONFormatter
+
+        formatter = JSONFormatter()
+        plain = logging.LogRecord('x', logging.INFO, 'p', 1, '100% done', None, None)
+        with_args = logging.LogRecord('x', logging.INFO, 'p', 1, '%d%% done', (100,), None)
+        non_str = logging.LogRecord('x', logging.INFO, 'p', 1, ValueError("bad"), None, None)
+
+        assert json.loads(formatter.format(plain))['message'] == '100% done'
+        assert json.loads(formatter.format(with_args))['message'] == '100% done'
+        assert json.loads(formatter.format(non_str))['message'] == 'bad'
+
+
+class TestColoredFormatter:
+    """Test console formatting."""
+
+    def _record(self, **context):
+        record = logging.LogRecord('x', logging.ERROR, 'p', 1, 'Oops', (), None)
+        for key, value in context.items():
+            setattr(record, key, value)
+        return record
+
+    def test_known_error_code(self):
+        """Known error codes are rendered with their description."""
+        from guardian.core.logger import ColoredFormatter
+
+        formatter = ColoredFormatter(use_colors=False, use_icons=False)
+        assert formatter.format(self._record(error_code="GIT-04")) == \
+            "ERROR Oops [GIT-04: Git not installed]"
+
+    def test_plain_formatter_for_non_tty(self, tmp_path):
+        """setup_logger installs the plain formatter when stdout is not a terminal."""
+        from guardian.core.logger import ColoredFormatter, PlainFormatter, _listeners
+
+        setup_logger("test-guardian", log_file=None)
+        try:
+            (console_handler,) = _listeners["test-guardian"].handlers
+            assert type(console_handler.formatter) is PlainFormatter
+            assert not isinstance(console_handler.formatter, ColoredFormatter)
+        finally:
+            shutdown_logger("test-guardian")
+
+    def test_unknown_error_code(self):
+        """Unknown error codes fall back to a generic description."""
+        from guardian.core.logger import ColoredFormatter
+
+        formatter = ColoredFormatter(use_colors=False, use_icons=False)
+        assert formatter.format(self._record(error_code="XX-99")) == \
+            "ERROR Oops [XX-99: Unknown error]"
+
+
+class TestContextFilter:
+    """Test default context injection."""
+
+    def test_context_applied_and_replaceable(self):
+        """Default context fills missing fields and follows set_context."""
+        from guardian.core.logger import ContextFilter, LogContext
+
+        context_filter = ContextFilter(LogContext(healer_name="a", operation="scan"))
+        record = logging.LogRecord('x', logging.INFO, 'p', 1, 'msg', (), None)
+        context_filter.filter(record)
+        assert (record.healer_name, record.operation, record.file_path) == ("a", "scan", None)
+
+        context_filter.set_context(LogContext(healer_name="b"))
+        record = logging.LogRecord('x', logging.INFO, 'p', 1, 'msg', (), None)
+        record.healer_name = "explicit"
+        context_filter.filter(record)
+        assert (record.healer_name, record.operation) == ("explicit", None)
+
+
+class TestBufferedRotatingFileHandler:
+    """Test the buffered, size-rotating log file handler."""
+
+    def _record(self, msg, level=logging.INFO):
+        return logging.LogRecord('x', level, 'p', 1, msg, (), None)
+
+    def test_file_not_created_until_first_record(self, tmp_path):
+        """The file is opened lazily."""
+        from guardian.core.logger import BufferedRotatingFileHandler
+
+        log_file = tmp_path / "guardian.log"
+        handler = BufferedRotatingFileHandler(log_file)
+        assert not log_file.exists()
+        handler.close()
+
+    def test_buffered_until_interval(self, tmp_path):
+        """Records are flushed every flush_interval records and on errors."""
+        from guardian.core.logger import BufferedRotatingFileHandler
+
+        log_file = tmp_path / "guardian.log"
+        handler = BufferedRotatingFileHandler(log_file, flush_interval=3)
+        handler.emit(self._record("one"))
+        handler.emit(self._record("two"))
+        assert log_file.read_text() == ""
+
+        handler.emit(self._record("three"))
+        assert log_file.read_text() == "one\ntwo\nthree\n"
+
+        handler.emit(self._record("boom", logging.ERROR))
+        assert log_file.read_text().endswith("boom\n")
+        handler.close()
+
+    def test_rotates_by_size(self, tmp_path):
+        """Exceeding max_bytes rotates the file and keeps backup_count backups."""
+        from guardian.core.logger import BufferedRotatingFileHandler
+
+        log_file = tmp_path / "guardian.log"
+        handler = BufferedRotatingFileHandler(log_file, max_bytes=20, backup_count=2)
+        for i in range(5):
+            handler.emit(self._record(f"record-{i}-xxxxx"))
+        handler.close()
+
+        assert log_file.read_text() == "record-4-xxxxx\n"
+        assert (tmp_path / "guardian.log.1").read_text() == "record-3-xxxxx\n"
+        assert (tmp_path / "guardian.log.2").read_text() == "record-2-xxxxx\n"
+        assert not (tmp_path / "guardian.log.3").exists()
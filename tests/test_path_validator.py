@@ -0,0 +1,213 @@
+"""
+Test suite for path validation.
+
+Covers:
+1. Containment within allowed roots
+2. Symlink handling
+3. No reuse of resolutions across calls
+"""
+
+import os
+
+import pytest
+from pathlib import Path, PurePath
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from guardian.core.path_validator import (
+    PathTraversalError,
+    PathValidator,
+    validate_doc_root,
+    validate_path_contained,
+    validate_project_root,
+)
+
+
+class TestContainment:
+    """Test allowed-root containment checks."""
+
+    def test_path_inside_root(self, tmp_path):
+        """Paths under an allowed root resolve to absolute paths."""
+        validator = PathValidator(allowed_roots=[tmp_path])
+        assert validator.validate_path(tmp_path / "docs" / "a.md") == (tmp_path / "docs" / "a.md").resolve()
+
+    def test_traversal_rejected(self, tmp_path):
+        """'..' components escaping the root are rejected."""
+        validator = PathValidator(allowed_roots=[tmp_path / "docs"])
+        with pytest.raises(PathTraversalError):
+            validator.validate_path(tmp_path / "docs" / ".." / "secret.md")
+
+    def test_sibling_with_common_prefix_rejected(self, tmp_path):
+        """A sibling directory sharing the root's name prefix is outside it."""
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs-private").mkdir()
+        validator = PathValidator(allowed_roots=[tmp_path / "docs"])
+        with pytest.raises(PathTraversalError):
+            validator.validate_path(tmp_path / "docs-private" / "a.md")
+
+    def test_pure_path_accepted(self, tmp_path):
+        """PurePath inputs validate like Path inputs."""
+        validator = PathValidator(allowed_roots=[tmp_path])
+
+        result = validator.validate_path(PurePath(tmp_path / "a.md"))
+        assert result == (tmp_path / "a.md").resolve()
+        assert isinstance(result, Path)
+
+    def test_root_itself_allowed(self, tmp_path):
+        """The allowed root itself is valid."""
+        validator = PathValidator(allowed_roots=[tmp_path])
+        assert validator.validate_path(tmp_path) == tmp_path.resolve()
+        assert validator.validate_path(str(tmp_path.resolve())) == validator.allowed_roots[0]
+
+    def test_relative_path_uses_current_directory(self, tmp_path, monkeypatch):
+        """Relative paths resolve against the current directory, even after chdir."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        validator = PathValidator(allowed_roots=[first])
+
+        monkeypatch.chdir(first)
+        assert validator.validate_path(Path("a.md")) == (first / "a.md").resolve()
+
+        monkeypatch.chdir(second)
+        with pytest.raises(PathTraversalError):
+            validator.validate_path(Path("a.md"))
+
+    def test_batch_null_byte_rejected_first(self, tmp_path):
+        """A null byte anywhere in a batch is reported before other checks."""
+        link = tmp_path / "link.md"
+        os.symlink(tmp_path / "real.md", link)
+        validator = PathValidator(allowed_roots=[tmp_path])
+
+        with pytest.raises(PathTraversalError, match="null byte"):
+            validator.validate_paths([link, str(tmp_path / "bad\x00.md")])
+
+    def test_large_batch_matches_serial(self, tmp_path):
+        """Large (thread pool) batches return results in input order."""
+        validator = PathValidator(allowed_roots=[tmp_path])
+        paths = [tmp_path / f"doc_{i}.md" for i in range(200)]
+
+        assert validator.validate_paths(paths) == [p.resolve() for p in paths]
+
+    def test_large_batch_raises_for_escape(self, tmp_path):
+        """One escaping path fails the whole large batch."""
+        validator = PathValidator(allowed_roots=[tmp_path])
+        paths = [tmp_path / f"doc_{i}.md" for i in range(100)]
+        paths.insert(50, tmp_path / ".." / "outside.md")
+
+        with pytest.raises(PathTraversalError, match="outside allowed roots"):
+            validator.validate_paths(paths)
+
+    def test_duplicate_roots_checked_once(self, tmp_path):
+        """Roots that resolve to the same directory share one bound."""
+        validator = PathValidator(allowed_roots=[tmp_path, tmp_path / "docs" / "..", tmp_path])
+
+        assert len(validator._root_bounds) == 1
+        assert validator.validate_path(tmp_path / "a.md") == (tmp_path / "a.md").resolve()
+
+    def test_doc_root_outside_project(self, tmp_path):
+        """Doc roots must live inside the project root."""
+        project = tmp_path / "project"
+        project.mkdir()
+        with pytest.raises(PathTraversalError):
+            validate_doc_root(tmp_path / "elsewhere", project)
+
+    def test_nonexistent_contained(self, tmp_path):
+        """Nonexistent relative paths are resolved against the container."""
+        assert validate_path_contained(Path("new/file.md"), tmp_path, allow_nonexistent=True) == \
+            (tmp_path / "new" / "file.md").resolve()
+
+    def test_existing_contained(self, tmp_path):
+        """Existing paths inside the container resolve to absolute paths."""
+        for name in ("a.md", "b.md"):
+            (tmp_path / name).write_text("x")
+            assert validate_path_contained(tmp_path / name, str(tmp_path)) == (tmp_path / name).resolve()
+
+    def test_string_roots_accepted(self, tmp_path):
+        """Root validators take plain strings as well as paths."""
+        (tmp_path / "docs").mkdir()
+
+        project = validate_project_root(str(tmp_path))
+        assert validate_doc_root(str(tmp_path / "docs"), project) == (tmp_path / "docs").resolve()
+
+
+class TestSymlinks:
+    """Test symlink handling."""
+
+    def test_symlink_rejected_by_default(self, tmp_path):
+        """Symlinks are rejected unless follow_symlinks is set."""
+        real = tmp_path / "real.md"
+        real.write_text("x")
+        link = tmp_path / "link.md"
+        os.symlink(real, link)
+
+        with pytest.raises(PathTraversalError):
+            PathValidator(allowed_roots=[tmp_path]).validate_path(link)
+        assert PathValidator(allowed_roots=[tmp_path], follow_symlinks=True).validate_path(link) == real.resolve()
+
+    def test_trailing_slash_symlink_rejected(self, tmp_path):
+        """A string path with a trailing slash cannot sneak a symlink past the check."""
+        (tmp_path / "real").mkdir()
+        os.symlink(tmp_path / "real", tmp_path / "link")
+
+        with pytest.raises(PathTraversalError, match="Symlinks not allowed"):
+            PathValidator(allowed_roots=[tmp_path]).validate_path(f"{tmp_path}/link/")
+
+    def test_symlink_created_after_first_check(self, tmp_path):
+        """A path replaced by a symlink is rejected even after a cached resolve."""
+        validator = PathValidator(allowed_roots=[tmp_path])
+        target = tmp_path / "doc.md"
+        target.write_text("x")
+        validator.validate_path(target)
+
+        target.unlink()
+        os.symlink(tmp_path / "other.md", target)
+        with pytest.raises(PathTraversalError):
+            validator.validate_path(target)
+
+
+class TestNoStaleResolution:
+    """Test that a directory swapped for a symlink is seen on the next call."""
+
+    @pytest.fixture
+    def swapped(self, tmp_path):
+        """root/docs/sub/x.md, plus a function swapping docs/sub for an outside symlink."""
+        root = tmp_path / "root"
+        sub = root / "docs" / "sub"
+        sub.mkdir(parents=True)
+        (sub / "x.md").write_text("x")
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "x.md").write_text("secret")
+
+        def swap():
+            (sub / "x.md").unlink()
+            sub.rmdir()
+            os.symlink(outside, sub)
+
+        return root, sub / "x.md", swap
+
+    def test_validator_sees_swapped_directory(self, swapped):
+        """The same and a fresh validator reject the path once its parent escapes."""
+        root, doc, swap = swapped
+        validator = PathValidator(allowed_roots=[root])
+        validator.validate_path(doc)
+
+        swap()
+
+        with pytest.raises(PathTraversalError, match="outside allowed roots"):
+            validator.validate_path(doc)
+        with pytest.raises(PathTraversalError, match="outside allowed roots"):
+            PathValidator(allowed_roots=[root]).validate_path(doc)
+
+    def test_contained_sees_swapped_directory(self, swapped):
+        """validate_path_contained rejects the path once its parent escapes."""
+        root, doc, swap = swapped
+        validate_path_contained(doc, root)
+
+        swap()
+
+        with pytest.raises(PathTraversalError):
+            validate_path_contained(doc, root)
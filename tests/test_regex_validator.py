@@ -0,0 +1,83 @@
+"""
+Test suite for regex validation (ReDoS heuristics).
+
+Covers:
+1. Issue detection per heuristic
+2. Pattern sanitization
+"""
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from guardian.core.regex_validator import RegexValidator, validate_regex_safety
+
+
+class TestValidatePattern:
+    """Test RegexValidator.validate_pattern."""
+
+    def _issue_types(self, pattern):
+        return [issue.issue_type for issue in RegexValidator().validate_pattern(pattern)]
+
+    def test_nested_quantifiers(self):
+        """(a+)+ is flagged as nested quantifiers."""
+        assert 'nested_quantifiers' in self._issue_types(r'(a+)+b')
+
+    def test_alternation_quantifier(self):
+        """(a|ab)* is flagged as a quantified alternation."""
+        assert self._issue_types(r'^(a|ab)*$') == ['alternation_quantifier']
+
+    def test_repeated_wildcards(self):
+        """(.*)+ is flagged as repeated wildcards."""
+        assert 'repeated_wildcards' in self._issue_types(r'(.*x)+')
+
+    def test_short_wildcard(self):
+        """Even a two-character pattern can trip the wildcard heuristic."""
+        assert self._issue_types('.*') == ['unanchored_wildcard']
+
+    def test_non_ascii_pattern(self):
+        """Non-ASCII text inside a group is still scanned."""
+        assert 'nested_quantifiers' in self._issue_types('(é+)+')
+
+    def test_safe_pattern(self):
+        """Plain anchored patterns have no issues."""
+        assert self._issue_types(r'^npm install \w+$') == []
+
+    def test_invalid_syntax(self):
+        """Uncompilable patterns are reported."""
+        assert self._issue_types(r'([a-z') == ['invalid_syntax']
+
+    def test_repeat_validation_returns_fresh_issues(self):
+        """Memoized results still give each caller its own RegexIssue objects."""
+        validator = RegexValidator(max_pattern_length=3)
+        first = validator.validate_pattern(r'(a+)+')
+        first[0].severity = 'low'
+
+        second = validator.validate_pattern(r'(a+)+')
+        assert [i.issue_type for i in second] == [i.issue_type for i in first]
+        assert second[0].severity == 'medium'
+        assert second[0] is not first[0]
+
+    def test_length_limit_per_validator(self):
+        """Validators with different limits do not share cached results."""
+        assert RegexValidator(max_pattern_length=3).validate_pattern('abcd')
+        assert RegexValidator(max_pattern_length=10).validate_pattern('abcd') == []
+
+    def test_validate_regex_safety(self):
+        """High-severity issues make a pattern unsafe."""
+        is_safe, warnings = validate_regex_safety(r'(a+)+')
+        assert not is_safe
+        assert warnings
+
+
+class TestSanitizePattern:
+    """Test RegexValidator.sanitize_pattern."""
+
+    def test_nested_quantifier_flattened(self):
+        """Nested quantifiers collapse to a single quantifier."""
+        assert RegexValidator().sanitize_pattern(r'(a+)+b') == r'(a)+b'
+
+    def test_wildcard_anchored(self):
+        """Unanchored wildcard patterns are anchored."""
+        assert RegexValidator().sanitize_pattern(r'foo.*bar') == r'^foo.*bar$'
@@ -0,0 +1,124 @@
+"""
+Test suite for report generation.
+
+Covers:
+1. Markdown report layout
+2. Truncation of long change content
+3. Console output
+4. Saved JSON reports
+"""
+
+import json
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from guardian.core.base import HealingReport, Change
+from guardian.core.reporting import (
+    generate_console_output,
+    generate_json_report,
+    generate_markdown_report,
+    save_report,
+)
+
+
+def _report(changes=None, errors=None, found=2, fixed=1) -> HealingReport:
+    return HealingReport(
+        healer_name="TestHealer",
+        mode="check",
+        timestamp="2024-03-15T14:30:22",
+        issues_found=found,
+        issues_fixed=fixed,
+        changes=changes or [],
+        errors=errors or [],
+        execution_time=1.5,
+    )
+
+
+def _change(file: str, line: int, old: str = "old", new: str = "new") -> Change:
+    return Change(Path(file), line, old, new, 0.95, "broken link", "TestHealer")
+
+
+class TestMarkdownReport:
+    """Test generate_markdown_report."""
+
+    def test_header_and_summary(self):
+        """Header, summary and status lines are rendered in order."""
+        md = generate_markdown_report(_report())
+
+        assert md == (
+            "# Healing Report: TestHealer\n"
+            "**Mode**: check\n"
+            "**Timestamp**: 2024-03-15T14:30:22\n"
+            "**Execution Time**: 1.50 seconds\n"
+            "\n## Summary\n"
+            "- **Issues found**: 2\n"
+            "- **Issues fixed**: 1\n"
+            "- **Success rate**: 50.0%\n"
+            "\n⚠️ **1 issues remaining**\n"
+        )
+
+    def test_changes_grouped_by_file(self):
+        """Changes are grouped under sorted file headings, in input order."""
+        changes = [_change("b.md", 3), _change("a.md", 7), _change("b.md", 1, old="")]
+        md = generate_markdown_report(_report(changes, errors=["boom"]))
+
+        assert md.index("### a.md") < md.index("### b.md")
+        assert md.index("#### Line 3") < md.index("#### Line 1")
+        assert md.count("**Old**") == 2
+        assert md.count("**New**") == 3
+        assert "- **Confidence**: 95%\n" in md
+        assert md.endswith("\n## Errors\n- boom\n")
+
+    def test_long_content_truncated(self):
+        """Old and new content are cut at 200 characters with an ellipsis."""
+        md = generate_markdown_report(_report([_change("a.md", 1, old="x" * 201, new="y" * 200)]))
+
+        assert "x" * 200 + "...\n```" in md
+        assert "y" * 200 + "\n```" in md
+
+
+class TestConsoleOutput:
+    """Test generate_console_output."""
+
+    def test_summary_block(self):
+        """The boxed header and summary come first, one item per line."""
+        out = generate_console_output(_report())
+
+        assert out.splitlines()[:11] == [
+            "=" * 70,
+            "Healing Report: TestHealer",
+            "=" * 70,
+            "",
+            "Mode: check",
+            "Execution time: 1.50s",
+            "",
+            "📊 Summary:",
+            "   Issues found: 2",
+            "   Issues fixed: 1",
+            "   Success rate: 50.0%",
+        ]
+        assert out.endswith("\n\n" + "=" * 70)
+
+    def test_verbose_lists_changes(self):
+        """Verbose output lists changes with a confidence marker."""
+        out = generate_console_output(_report([_change("a.md", 3)]), verbose=True)
+
+        assert "1. 🟢 a.md:3" in out
+        assert "   Confidence: 95%" in out
+
+
+class TestSaveReport:
+    """Test save_report output files."""
+
+    def test_json_round_trip(self, tmp_path):
+        """The saved JSON file parses back to generate_json_report's dict."""
+        report = _report([_change("docs/a.md", 4, new="caf\u00e9")], errors=["boom"])
+
+        save_report(report, tmp_path, format="both")
+
+        json_file = tmp_path / "TestHealer_20240315_143022.json"
+        assert (tmp_path / "TestHealer_20240315_143022.md").exists()
+        assert json.loads(json_file.read_text(encoding="utf-8")) == generate_json_report(report)
@@ -0,0 +1,118 @@
+"""
+Test suite for graceful shutdown handling.
+
+Covers:
+1. Cleanup action registration
+2. In-progress file tracking
+3. Handler installation
+"""
+
+import atexit
+import signal
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from guardian.core.signal_handlers import GracefulShutdown
+
+
+class TestCleanupActions:
+    """Test register_cleanup / unregister_cleanup."""
+
+    def test_actions_run_in_registration_order(self):
+        """Cleanup runs every registered action once, oldest first."""
+        shutdown = GracefulShutdown()
+        calls = []
+
+        def first():
+            calls.append("first")
+
+        def second():
+            calls.append("second")
+
+        shutdown.register_cleanup(first)
+        shutdown.register_cleanup(second)
+        shutdown.register_cleanup(first)
+        shutdown._run_cleanup()
+
+        assert calls == ["first", "second"]
+
+    def test_unregister_bound_method(self):
+        """A bound method can be unregistered through a fresh reference."""
+        calls = []
+
+        class Resource:
+            def close(self):
+                calls.append("closed")
+
+        resource = Resource()
+        shutdown = GracefulShutdown()
+        shutdown.register_cleanup(resource.close)
+        shutdown.unregister_cleanup(resource.close)
+        shutdown.unregister_cleanup(resource.close)
+        shutdown._run_cleanup()
+
+        assert calls == []
+
+    def test_action_may_unregister_itself(self):
+        """Unregistering during cleanup does not break the cleanup loop."""
+        shutdown = GracefulShutdown()
+        calls = []
+
+        def once():
+            calls.append("once")
+            shutdown.unregister_cleanup(once)
+
+        shutdown.register_cleanup(once)
+        shutdown.register_cleanup(lambda: calls.append("after"))
+        shutdown._run_cleanup()
+
+        assert calls == ["once", "after"]
+
+
+class TestInProgressFiles:
+    """Test in-progress file tracking."""
+
+    def test_interrupted_write_removed(self, tmp_path):
+        """Files still registered at cleanup time are deleted."""
+        shutdown = GracefulShutdown()
+        done = tmp_path / "done.md"
+        partial = tmp_path / "partial.md"
+
+        with shutdown.protected_write(done):
+            done.write_text("complete")
+        shutdown.register_in_progress_file(partial)
+        partial.write_text("half")
+        shutdown._run_cleanup()
+
+        assert done.exists()
+        assert not partial.exists()
+
+
+class TestInstall:
+    """Test install / uninstall."""
+
+    def test_install_is_idempotent(self, monkeypatch):
+        """Repeated installs set handlers and the atexit hook only once."""
+        signal_calls = []
+        atexit_calls = []
+        monkeypatch.setattr(signal, "signal", lambda sig, handler: signal_calls.append(sig))
+        monkeypatch.setattr(atexit, "register", lambda fn: atexit_calls.append(fn))
+
+        shutdown = GracefulShutdown()
+        shutdown.install()
+        shutdown.install()
+        assert signal_calls == [signal.SIGINT, signal.SIGTERM]
+
+        shutdown.uninstall()
+        shutdown.install()
+        assert len(atexit_calls) == 1
+
+    def test_check_shutdown_reads_flag(self):
+        """check_shutdown reports the flag set by the signal handler."""
+        shutdown = GracefulShutdown()
+        assert not shutdown.check_shutdown()
+
+        shutdown.shutdown_requested = True
+        assert shutdown.check_shutdown()
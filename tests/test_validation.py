@@ -0,0 +1,332 @@
+"""
+Test suite for change and syntax validation.
+
+Covers:
+1. In-memory syntax validation
+2. Markdown checks
+3. Link existence (sync and async)
+4. Strict change validation
+5. Batch validation
+6. Memoized file syntax checks
+"""
+
+import asyncio
+import os
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from guardian.core.base import Change
+from guardian.core import validation
+from guardian.core.validation import (
+    clear_syntax_cache,
+    validate_all_changes,
+    validate_change,
+    validate_links,
+    validate_links_async,
+    validate_markdown_syntax,
+    validate_python_syntax_bytes,
+    validate_syntax,
+    validate_syntax_content,
+)
+
+
+def _change(file: Path, old: str, new: str, reason: str = "fix") -> Change:
+    return Change(file, 1, old, new, 0.95, reason, "TestHealer")
+
+
+class TestSyntaxContent:
+    """Test validate_syntax_content."""
+
+    def test_json(self):
+        """JSON content is parsed."""
+        assert validate_syntax_content('{"a": 1}', '.json')
+        assert not validate_syntax_content('{"a": ', '.json')
+
+    def test_python(self):
+        """Python content is parsed, never executed."""
+        assert validate_syntax_content("x = 1\n", '.py')
+        assert not validate_syntax_content("def (:\n", '.py')
+
+    def test_yaml(self):
+        """YAML is parsed when PyYAML is installed and skipped otherwise."""
+        assert validate_syntax_content("a: 1\n", '.yaml')
+        assert validate_syntax_content("key: [1, 2\n", '.yml') == (not validation.YAML_AVAILABLE)
+
+    def test_markdown_and_unknown(self):
+        """Markdown is checked for unclosed fences; unknown suffixes pass."""
+        assert validate_syntax_content("# T\n```\ncode\n```\n", '.md')
+        assert not validate_syntax_content("```\ncode\n", '.md')
+        assert validate_syntax_content("anything {", '.txt')
+
+    def test_python_bytes(self, tmp_path):
+        """Python files are parsed from bytes, honouring coding cookies."""
+        assert validate_python_syntax_bytes(b"x = 1\n")
+        assert not validate_python_syntax_bytes(b"x = = 1\n")
+        assert not validate_python_syntax_bytes(b"x = '\xff'\n")
+
+        latin = tmp_path / "latin.py"
+        latin.write_bytes(b"# -*- coding: latin-1 -*-\nname = '\xe9'\n")
+        assert validate_syntax(latin)
+
+    def test_matches_file_validation(self, tmp_path):
+        """validate_syntax gives the same answer for the file on disk."""
+        for name, content in (("a.json", "[1, 2]"), ("b.json", "[1,"), ("c.md", "```\n")):
+            path = tmp_path / name
+            path.write_text(content)
+            assert validate_syntax(path) == validate_syntax_content(content, path.suffix)
+
+
+class TestMarkdownSyntax:
+    """Test validate_markdown_syntax."""
+
+    def test_indented_fences_counted(self):
+        """Fences indented with spaces or tabs still open and close blocks."""
+        assert validate_markdown_syntax("- item\n  ```\n  code\n\t```\n")
+        assert not validate_markdown_syntax("text\n\n   ```sh\nls\n")
+
+    def test_inline_backticks_ignored(self):
+        """Triple backticks mid-line do not count as fences."""
+        assert validate_markdown_syntax("use ```inline``` here\n")
+
+    def test_empty_link_parts_rejected(self):
+        """Links with empty text or URL are malformed."""
+        assert validate_markdown_syntax("[ok](a.md)")
+        assert not validate_markdown_syntax("[](a.md)")
+        assert not validate_markdown_syntax("[text]()")
+
+
+class TestValidateLinks:
+    """Test validate_links."""
+
+    def test_anchors_and_external_links(self, tmp_path):
+        """Anchors are stripped; external and anchor-only links are skipped."""
+        (tmp_path / "guide.md").write_text("# Guide\n")
+        doc = tmp_path / "index.md"
+        doc.write_text(
+            "[g](guide.md#install) [abs](/guide.md#top) [top](#top) "
+            "[web](https://example.com/missing) [mail](mailto:a@b.c)\n"
+        )
+
+        assert validate_links(doc, tmp_path)
+
+    def test_missing_target(self, tmp_path):
+        """A relative link to a missing file fails."""
+        doc = tmp_path / "index.md"
+        doc.write_text("[gone](missing.md#sec)\n")
+
+        assert not validate_links(doc, tmp_path)
+
+    def test_missing_source_file(self, tmp_path):
+        """A source file that does not exist is reported invalid."""
+        assert not validate_links(tmp_path / "missing.md", tmp_path)
+
+    def test_parent_segments(self, tmp_path):
+        """Links with '..' are resolved, including through missing directories."""
+        (tmp_path / "guide.md").write_text("# Guide\n")
+        (tmp_path / "docs").mkdir()
+        doc = tmp_path / "docs" / "index.md"
+
+        doc.write_text("[up](../guide.md) [via](missing/../../guide.md)\n")
+        assert validate_links(doc, tmp_path)
+
+        doc.write_text("[up](../../guide.md)\n")
+        assert not validate_links(doc, tmp_path)
+
+    def test_hash_in_directory_name(self, tmp_path):
+        """A '#' in the document's directory is not mistaken for an anchor."""
+        folder = tmp_path / "c#"
+        folder.mkdir()
+        (folder / "api.md").write_text("x\n")
+        doc = folder / "index.md"
+        doc.write_text("[api](api.md)\n")
+
+        assert validate_links(doc, tmp_path)
+
+
+class TestValidateLinksAsync:
+    """Test validate_links_async."""
+
+    def test_matches_sync_results(self, tmp_path):
+        """The async check agrees with validate_links."""
+        (tmp_path / "guide.md").write_text("# Guide\n")
+        good = tmp_path / "good.md"
+        good.write_text("[g](guide.md#a) [abs](/guide.md) [web](https://x.invalid)\n")
+        bad = tmp_path / "bad.md"
+        bad.write_text("[g](guide.md) [gone](missing.md)\n")
+
+        for doc in (good, bad, tmp_path / "missing.md"):
+            assert asyncio.run(validate_links_async(doc, tmp_path)) == validate_links(doc, tmp_path)
+
+    def test_targets_checked_once(self, tmp_path, monkeypatch):
+        """Repeated targets are checked once; the cache skips known targets."""
+        guide = tmp_path / "guide.md"
+        guide.write_text("# Guide\n")
+        first = tmp_path / "first.md"
+        first.write_text("[a](guide.md) [b](guide.md#x) [c](./guide.md)\n")
+        second = tmp_path / "second.md"
+        second.write_text("[a](guide.md)\n")
+        checked = []
+        original = Path.exists
+
+        def counting_exists(self, *args, **kwargs):
+            checked.append(self)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "exists", counting_exists)
+        cache = {}
+
+        async def run():
+            return [
+                await validate_links_async(first, tmp_path, cache),
+                await validate_links_async(second, tmp_path, cache),
+            ]
+
+        assert asyncio.run(run()) == [True, True]
+        assert checked == [guide]
+        assert cache == {guide: True}
+
+
+class TestStrictValidation:
+    """Test validate_change in strict mode."""
+
+    def test_valid_result_accepted(self, tmp_path):
+        """A change that keeps the file parseable passes."""
+        doc = tmp_path / "data.json"
+        doc.write_text('{"a": 1}')
+
+        assert validate_change(_change(doc, '1', '2'), strict=True) == (True, None)
+
+    def test_invalid_result_rejected(self, tmp_path):
+        """A change that breaks the file's syntax is rejected."""
+        doc = tmp_path / "data.json"
+        doc.write_text('{"a": 1}')
+
+        is_valid, error = validate_change(_change(doc, '}', '', reason="delete brace"), strict=True)
+        assert not is_valid
+        assert error == "Change would result in invalid syntax"
+
+    def test_missing_file(self, tmp_path):
+        """Missing files are reported without a separate existence check."""
+        missing = tmp_path / "missing.md"
+        under_file = tmp_path / "data.json" / "child.md"
+        (tmp_path / "data.json").write_text("{}")
+
+        for path in (missing, under_file):
+            assert validate_change(_change(path, "x", "y")) == (
+                False, f"File does not exist: {path}"
+            )
+            assert not validate_syntax(path)
+        assert validate_change(_change(missing, "", "new"), strict=True) == (True, None)
+
+    def test_every_occurrence_simulated(self, tmp_path):
+        """The simulation replaces every match, as apply_change does."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("A\nB\nA\n")
+
+        # Replacing only the first "A" would leave an unclosed fence
+        assert validate_change(_change(doc, "A", "```"), strict=True) == (True, None)
+
+    def test_no_temp_files_left(self, tmp_path, monkeypatch):
+        """Strict validation does not write temporary files."""
+        import tempfile
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        doc = tmp_path / "doc.md"
+        doc.write_text("# Title\n")
+
+        validate_change(_change(doc, "Title", "Heading"), strict=True)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["doc.md"]
+
+
+class TestValidateAllChanges:
+    """Test validate_all_changes."""
+
+    def test_each_file_read_once(self, tmp_path, monkeypatch):
+        """Several changes to one file share a single read."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("alpha\nbeta\n")
+        reads = []
+        original = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads.append(self)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        changes = [_change(doc, "alpha", "ALPHA"), _change(doc, "beta", "BETA")]
+
+        assert validate_all_changes(changes, strict=True) == (True, [])
+        assert reads == [doc]
+
+    def test_many_files_read_in_parallel(self, tmp_path):
+        """Large batches (thread-pool reads) give the same per-change results."""
+        changes = []
+        for i in range(50):
+            doc = tmp_path / f"doc_{i}.json"
+            doc.write_text(f'{{"n": {i}}}')
+            new = "}" if i == 17 else str(i + 1)
+            changes.append(_change(doc, f": {i}", f": {new}"))
+
+        all_valid, errors = validate_all_changes(changes, strict=True)
+
+        assert not all_valid
+        assert errors == [f"{tmp_path / 'doc_17.json'}:1 - Change would result in invalid syntax"]
+
+    def test_errors_keep_change_order(self, tmp_path):
+        """Errors are reported per change, in input order."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("alpha\n")
+        missing = tmp_path / "missing.md"
+
+        all_valid, errors = validate_all_changes([
+            _change(missing, "x", "y"),
+            _change(doc, "alpha", "ALPHA"),
+            _change(doc, "gamma", "GAMMA"),
+        ])
+
+        assert not all_valid
+        assert errors == [
+            f"{missing}:1 - File does not exist: {missing}",
+            f"{doc}:1 - Old content not found in file",
+        ]
+
+
+class TestSyntaxCache:
+    """Test memoization of validate_syntax."""
+
+    def test_unchanged_file_parsed_once(self, tmp_path):
+        """Repeated checks of an unchanged file hit the cache."""
+        clear_syntax_cache()
+        doc = tmp_path / "data.json"
+        doc.write_text('{"a": 1}')
+
+        assert validate_syntax(doc)
+        assert validate_syntax(doc)
+
+        info = validation._validate_syntax_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_rewritten_file_reparsed(self, tmp_path):
+        """A modified file is validated again, even at the same size."""
+        clear_syntax_cache()
+        doc = tmp_path / "data.json"
+        doc.write_text('[1, 2]')
+        assert validate_syntax(doc)
+
+        doc.write_text('[1, 2')
+        stat = doc.stat()
+        os.utime(doc, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert not validate_syntax(doc)
+
+    def test_oversized_file_rejected(self, tmp_path, monkeypatch):
+        """The size limit is enforced before the cache is consulted."""
+        clear_syntax_cache()
+        doc = tmp_path / "data.json"
+        doc.write_text('[1, 2, 3]')
+        monkeypatch.setattr(validation, "MAX_FILE_SIZE_BYTES", 4)
+
+        assert not validate_syntax(doc)